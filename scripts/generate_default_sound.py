@@ -1,8 +1,35 @@
 """Generate default alert sound for mmMCounter."""
 
-import wave
 import struct
-import math
+
+import numpy as np
+
+
+# Canonical 44-byte PCM WAV header: RIFF chunk, fmt chunk, data chunk header
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+
+def _make_wav_header(num_samples, sample_rate, channels=1, bits=16):
+    """
+    Build a PCM WAV header.
+
+    Args:
+        num_samples: Number of samples per channel
+        sample_rate: Sample rate in Hz
+        channels: Number of channels
+        bits: Bits per sample
+
+    Returns:
+        44-byte header as bytes
+    """
+    block_align = channels * bits // 8
+    data_size = num_samples * block_align
+    return _WAV_HEADER.pack(
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate,
+        sample_rate * block_align, block_align, bits,
+        b'data', data_size
+    )
 
 
 def generate_beep(frequency=800, duration_ms=200, sample_rate=44100):
@@ -13,33 +40,25 @@ def generate_beep(frequency=800, duration_ms=200, sample_rate=44100):
         frequency: Frequency in Hz
         duration_ms: Duration in milliseconds
         sample_rate: Sample rate in Hz
+
+    Returns:
+        NumPy int16 array of samples
     """
     num_samples = int(sample_rate * duration_ms / 1000)
 
-    # Generate samples for a sine wave
-    samples = []
-    for i in range(num_samples):
-        # Sine wave with envelope (fade in/out to avoid clicks)
-        t = i / sample_rate
-        envelope = 1.0
-
-        # Fade in first 10ms
-        fade_in_samples = int(sample_rate * 0.01)
-        if i < fade_in_samples:
-            envelope = i / fade_in_samples
-
-        # Fade out last 10ms
-        fade_out_samples = int(sample_rate * 0.01)
-        if i > num_samples - fade_out_samples:
-            envelope = (num_samples - i) / fade_out_samples
-
-        # Generate sine wave
-        value = envelope * math.sin(2 * math.pi * frequency * t)
+    # Envelope (fade in/out first and last 10ms to avoid clicks)
+    fade_samples = min(int(sample_rate * 0.01), num_samples // 2)
+    envelope = np.ones(num_samples)
+    if fade_samples:
+        envelope[:fade_samples] = np.linspace(0.0, 1.0, fade_samples)
+        envelope[-fade_samples:] = np.linspace(1.0, 0.0, fade_samples)
 
-        # Convert to 16-bit integer (-32768 to 32767)
-        samples.append(int(value * 32767 * 0.3))  # 30% volume
+    # Generate sine wave
+    t = np.arange(num_samples) / sample_rate
+    values = envelope * np.sin(2 * np.pi * frequency * t)
 
-    return samples
+    # Convert to 16-bit integer (-32768 to 32767)
+    return (values * 32767 * 0.3).astype('<i2')  # 30% volume
 
 
 def save_wav(filename, samples, sample_rate=44100):
@@ -48,17 +67,15 @@ def save_wav(filename, samples, sample_rate=44100):
 
     Args:
         filename: Output filename
-        samples: List of sample values
+        samples: Sample values (int16 array or list of ints)
         sample_rate: Sample rate in Hz
     """
-    with wave.open(filename, 'w') as wav_file:
-        # Set WAV file parameters
-        # nchannels, sampwidth, framerate, nframes, comptype, compname
-        wav_file.setparams((1, 2, sample_rate, len(samples), 'NONE', 'not compressed'))
+    samples = np.asarray(samples, dtype='<i2')
 
-        # Write samples
-        for sample in samples:
-            wav_file.writeframes(struct.pack('<h', sample))
+    with open(filename, 'wb') as wav_file:
+        # 16-bit mono PCM header, then the raw sample buffer
+        wav_file.write(_make_wav_header(len(samples), sample_rate))
+        samples.tofile(wav_file)
 
 
 if __name__ == "__main__":
@@ -66,11 +83,11 @@ if __name__ == "__main__":
 
     # Generate a pleasant two-tone beep
     beep1 = generate_beep(frequency=800, duration_ms=150)
-    silence = [0] * int(44100 * 0.05)  # 50ms silence
+    silence = np.zeros(int(44100 * 0.05), dtype='<i2')  # 50ms silence
     beep2 = generate_beep(frequency=1000, duration_ms=150)
 
     # Combine
-    samples = beep1 + silence + beep2
+    samples = np.concatenate([beep1, silence, beep2])
 
     # Save
     output_path = "assets/sounds/default_alert.wav"
@@ -1,10 +1,63 @@
 """Configuration management for loading and saving profiles."""
 
+import copy
 import json
 import os
 from typing import Dict, Any, Optional
 from src.config.defaults import DEFAULT_PROFILE
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to stdlib json
+    orjson = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _write_atomic(path: str, data: bytes):
+    """
+    Write bytes to a file via a temp file and os.replace.
+
+    A crash mid-write leaves the previous file intact instead of a
+    truncated one.
+
+    Args:
+        path: Destination file path
+        data: File contents
+
+    Raises:
+        IOError: If the temp file can't be written or moved into place
+    """
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except IOError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+# Serialized once so each validation gets an independent deep copy cheaply
+_DEFAULT_PROFILE_TEMPLATE = _json_dumps(dict(DEFAULT_PROFILE))
+
+# Keys a complete profile has, for the _validate_profile fast path
+_PROFILE_KEYS = frozenset(DEFAULT_PROFILE)
+_GLOBAL_SETTINGS_KEYS = frozenset(DEFAULT_PROFILE["global_settings"])
+
 
 class ConfigManager:
     """
@@ -24,6 +77,12 @@ class ConfigManager:
         self.profiles_dir = os.path.join(config_dir, "profiles")
         self.app_state_file = os.path.join(config_dir, "app_state.json")
 
+        # Validated profiles keyed by path -> ((mtime_ns, size), config)
+        self._profile_cache: Dict[str, tuple] = {}
+
+        # Sorted profile names keyed by profiles_dir mtime -> (mtime_ns, names)
+        self._profile_list_cache: Optional[tuple] = None
+
         # Ensure directories exist
         os.makedirs(self.profiles_dir, exist_ok=True)
 
@@ -39,13 +98,24 @@ class ConfigManager:
         """
         profile_path = self._get_profile_path(profile_name)
 
-        if not os.path.exists(profile_path):
+        try:
+            stat = os.stat(profile_path)
+        except OSError:
+            self._profile_cache.pop(profile_path, None)
             return None
 
+        # Serve unchanged files from cache (callers get their own copy)
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._profile_cache.get(profile_path)
+        if cached is not None and cached[0] == file_key:
+            return copy.deepcopy(cached[1])
+
         try:
-            with open(profile_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-            return self._validate_profile(config)
+            with open(profile_path, 'rb') as f:
+                config = _json_loads(f.read())
+            validated = self._validate_profile(config)
+            self._profile_cache[profile_path] = (file_key, validated)
+            return copy.deepcopy(validated)
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error loading profile '{profile_name}': {e}")
             return None
@@ -62,13 +132,14 @@ class ConfigManager:
             True if saved successfully, False otherwise
         """
         profile_path = self._get_profile_path(profile_name)
+        self._profile_cache.pop(profile_path, None)
+        self._profile_list_cache = None
 
         try:
             # Update profile name in config
             config["profile_name"] = profile_name
 
-            with open(profile_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            _write_atomic(profile_path, _json_dumps(config))
             return True
         except IOError as e:
             print(f"Error saving profile '{profile_name}': {e}")
@@ -85,6 +156,8 @@ class ConfigManager:
             True if deleted successfully, False otherwise
         """
         profile_path = self._get_profile_path(profile_name)
+        self._profile_cache.pop(profile_path, None)
+        self._profile_list_cache = None
 
         try:
             if os.path.exists(profile_path):
@@ -95,6 +168,18 @@ class ConfigManager:
             print(f"Error deleting profile '{profile_name}': {e}")
             return False
 
+    def profile_exists(self, profile_name: str) -> bool:
+        """
+        Check if a profile file exists without loading it.
+
+        Args:
+            profile_name: Name of the profile
+
+        Returns:
+            True if the profile exists
+        """
+        return os.path.isfile(self._get_profile_path(profile_name))
+
     def list_profiles(self) -> list[str]:
         """
         List all available profile names.
@@ -106,12 +191,22 @@ class ConfigManager:
             if not os.path.exists(self.profiles_dir):
                 return []
 
+            # Directory mtime changes whenever a profile is added or removed
+            dir_mtime = os.stat(self.profiles_dir).st_mtime_ns
+            cached = self._profile_list_cache
+            if cached is not None and cached[0] == dir_mtime:
+                return list(cached[1])
+
             profiles = []
-            for filename in os.listdir(self.profiles_dir):
-                if filename.endswith('.json'):
-                    profile_name = filename[:-5]  # Remove .json extension
-                    profiles.append(profile_name)
-            return sorted(profiles)
+            with os.scandir(self.profiles_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.json') and entry.is_file():
+                        profile_name = entry.name[:-5]  # Remove .json extension
+                        profiles.append(profile_name)
+            profiles.sort()
+
+            self._profile_list_cache = (dir_mtime, profiles)
+            return list(profiles)
         except IOError:
             return []
 
@@ -123,7 +218,7 @@ class ConfigManager:
             True if created, False if already exists
         """
         if self.load_profile("default") is None:
-            return self.save_profile("default", DEFAULT_PROFILE.copy())
+            return self.save_profile("default", _json_loads(_DEFAULT_PROFILE_TEMPLATE))
         return False
 
     def load_app_state(self) -> Dict[str, Any]:
@@ -144,8 +239,8 @@ class ConfigManager:
             }
 
         try:
-            with open(self.app_state_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.app_state_file, 'rb') as f:
+                return _json_loads(f.read())
         except (json.JSONDecodeError, IOError) as e:
             print(f"Error loading app state: {e}")
             return {}
@@ -161,8 +256,7 @@ class ConfigManager:
             True if saved successfully
         """
         try:
-            with open(self.app_state_file, 'w', encoding='utf-8') as f:
-                json.dump(state, f, indent=2)
+            _write_atomic(self.app_state_file, _json_dumps(state))
             return True
         except IOError as e:
             print(f"Error saving app state: {e}")
@@ -182,8 +276,19 @@ class ConfigManager:
         Returns:
             Validated profile configuration
         """
-        # Ensure required top-level keys exist
-        validated = DEFAULT_PROFILE.copy()
+        # A file holding a JSON list or scalar has nothing to merge
+        if not isinstance(config, dict):
+            return _json_loads(_DEFAULT_PROFILE_TEMPLATE)
+
+        # Fast path: complete profiles need no merging with defaults
+        global_settings = config.get("global_settings")
+        if (config.keys() == _PROFILE_KEYS
+                and isinstance(global_settings, dict)
+                and global_settings.keys() >= _GLOBAL_SETTINGS_KEYS):
+            return config
+
+        # Ensure required top-level keys exist (fresh deep copy of defaults)
+        validated = _json_loads(_DEFAULT_PROFILE_TEMPLATE)
 
         # Update with loaded config (deep merge for nested dicts)
         if "profile_name" in config:
@@ -216,8 +321,8 @@ class ConfigManager:
             return False
 
         try:
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2)
+            with open(export_path, 'wb') as f:
+                f.write(_json_dumps(config))
             return True
         except IOError as e:
             print(f"Error exporting profile: {e}")
@@ -235,8 +340,8 @@ class ConfigManager:
             True if imported successfully
         """
         try:
-            with open(import_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            with open(import_path, 'rb') as f:
+                config = _json_loads(f.read())
 
             # Use provided name or name from config
             profile_name = new_profile_name or config.get("profile_name", "imported")
@@ -1,7 +1,11 @@
 """Default configuration values for mmMCounter."""
 
-# Default profile configuration
-DEFAULT_PROFILE = {
+from enum import IntEnum
+from types import MappingProxyType
+from typing import NamedTuple
+
+# Default profile configuration (read-only; copy before modifying)
+DEFAULT_PROFILE = MappingProxyType({
     "profile_name": "Default",
     "version": "1.0",
     "global_settings": {
@@ -28,14 +32,15 @@ DEFAULT_PROFILE = {
                 "file": "assets/sounds/beepbeep.wav",
                 "volume": 80
             }
-        }
+        },
+        "timer_label_counter": 0  # Last number used for "Timer N" labels
     },
     "timers": []
-}
+})
 
 # Default timer configuration
 DEFAULT_TIMER = {
-    "id": None,  # Will be generated as UUID
+    "id": None,  # Will be generated when the timer is created
     "label": "New Timer",
     "duration_seconds": 240,  # 4 minutes default
     "hotkey": None,  # No hotkey by default
@@ -48,52 +53,82 @@ DEFAULT_TIMER = {
 }
 
 # Timer states
-class TimerState:
-    """Timer state constants."""
-    STOPPED = "stopped"
-    RUNNING = "running"
-    PAUSED = "paused"
-    COMPLETED = "completed"
+class TimerState(IntEnum):
+    """Timer state constants. Saved in profiles by lowercase name."""
+    STOPPED = 0
+    RUNNING = 1
+    PAUSED = 2
+    COMPLETED = 3
 
-# Theme definitions (moved here from themes.py for now)
-DARK_THEME = {
-    "bg_color": "#2b2b2b",
-    "fg_color": "#ffffff",
-    "button_bg": "#3c3f41",
-    "button_fg": "#ffffff",
-    "button_active_bg": "#4b6eaf",
-    "entry_bg": "#3c3f41",
-    "entry_fg": "#ffffff",
-    "alert_flash_color": "#ff4444",
-    "alert_normal_color": "#ffffff"
-}
+    @classmethod
+    def parse(cls, value) -> 'TimerState':
+        """
+        Convert a saved state to a TimerState.
 
-LIGHT_THEME = {
-    "bg_color": "#f0f0f0",
-    "fg_color": "#000000",
-    "button_bg": "#e0e0e0",
-    "button_fg": "#000000",
-    "button_active_bg": "#4b9ef0",
-    "entry_bg": "#ffffff",
-    "entry_fg": "#000000",
-    "alert_flash_color": "#ff0000",
-    "alert_normal_color": "#000000"
-}
+        Args:
+            value: State name (e.g. "running") or integer value
 
-HIGH_CONTRAST_THEME = {
-    "bg_color": "#000000",
-    "fg_color": "#ffffff",
-    "button_bg": "#000000",
-    "button_fg": "#ffff00",  # Yellow text
-    "button_active_bg": "#ffff00",
-    "entry_bg": "#000000",
-    "entry_fg": "#ffffff",
-    "alert_flash_color": "#ff00ff",  # Magenta for alerts
-    "alert_normal_color": "#00ff00"   # Green for normal
-}
+        Returns:
+            Matching TimerState, or STOPPED if unrecognized
+        """
+        try:
+            if isinstance(value, str):
+                return cls[value.upper()]
+            return cls(value)
+        except (KeyError, ValueError):
+            return cls.STOPPED
 
-THEMES = {
+# Theme definitions (moved here from themes.py for now, read-only)
+class ThemePalette(NamedTuple):
+    """Immutable set of colors for one theme."""
+    bg_color: str
+    fg_color: str
+    button_bg: str
+    button_fg: str
+    button_active_bg: str
+    entry_bg: str
+    entry_fg: str
+    alert_flash_color: str
+    alert_normal_color: str
+
+DARK_THEME = ThemePalette(
+    bg_color="#2b2b2b",
+    fg_color="#ffffff",
+    button_bg="#3c3f41",
+    button_fg="#ffffff",
+    button_active_bg="#4b6eaf",
+    entry_bg="#3c3f41",
+    entry_fg="#ffffff",
+    alert_flash_color="#ff4444",
+    alert_normal_color="#ffffff"
+)
+
+LIGHT_THEME = ThemePalette(
+    bg_color="#f0f0f0",
+    fg_color="#000000",
+    button_bg="#e0e0e0",
+    button_fg="#000000",
+    button_active_bg="#4b9ef0",
+    entry_bg="#ffffff",
+    entry_fg="#000000",
+    alert_flash_color="#ff0000",
+    alert_normal_color="#000000"
+)
+
+HIGH_CONTRAST_THEME = ThemePalette(
+    bg_color="#000000",
+    fg_color="#ffffff",
+    button_bg="#000000",
+    button_fg="#ffff00",  # Yellow text
+    button_active_bg="#ffff00",
+    entry_bg="#000000",
+    entry_fg="#ffffff",
+    alert_flash_color="#ff00ff",  # Magenta for alerts
+    alert_normal_color="#00ff00"   # Green for normal
+)
+
+THEMES = MappingProxyType({
     "dark": DARK_THEME,
     "light": LIGHT_THEME,
     "high_contrast": HIGH_CONTRAST_THEME
-}
+})
@@ -2,7 +2,13 @@
 
 import pygame
 import os
-from typing import Dict, Optional
+import threading
+from typing import Dict, Iterable, List, Optional
+
+
+# Channels reserved for alerts; more than this many overlapping alerts
+# cut off the oldest one
+NUM_CHANNELS = 4
 
 
 class AudioManager:
@@ -16,9 +22,22 @@ class AudioManager:
         """Initialize audio manager."""
         self.initialized = False
         self.sounds: Dict[str, pygame.mixer.Sound] = {}  # file_path -> Sound object
+        self._last_volume: Dict[str, float] = {}  # file_path -> volume last set
+        self._channels: List[pygame.mixer.Channel] = []
+        self._next_channel = 0
+        # preload() runs on a worker thread. _load_lock serializes decoding
+        # so a file is loaded once; _lock guards the dicts and channel index
+        # and is never held while decoding, so playback doesn't wait on it
+        self._load_lock = threading.Lock()
+        self._lock = threading.Lock()
 
         try:
+            # 44.1 kHz 16-bit mono with a small buffer: matches the bundled
+            # alert sounds (no resampling) and keeps playback latency low
+            pygame.mixer.pre_init(frequency=44100, size=-16, channels=1, buffer=512)
             pygame.mixer.init()
+            pygame.mixer.set_num_channels(NUM_CHANNELS)
+            self._channels = [pygame.mixer.Channel(i) for i in range(NUM_CHANNELS)]
             self.initialized = True
         except Exception as e:
             print(f"Warning: Failed to initialize audio: {e}")
@@ -36,18 +55,40 @@ class AudioManager:
         if not self.initialized:
             return False
 
-        if not os.path.exists(file_path):
-            print(f"Warning: Sound file not found: {file_path}")
-            return False
+        with self._load_lock:
+            # Another thread may have loaded it while we waited
+            if file_path in self.sounds:
+                return True
 
-        try:
-            # Load sound
-            sound = pygame.mixer.Sound(file_path)
-            self.sounds[file_path] = sound
+            if not os.path.exists(file_path):
+                print(f"Warning: Sound file not found: {file_path}")
+                return False
+
+            try:
+                # Load sound
+                sound = pygame.mixer.Sound(file_path)
+            except Exception as e:
+                print(f"Error loading sound '{file_path}': {e}")
+                return False
+
+            with self._lock:
+                self.sounds[file_path] = sound
+                self._last_volume.pop(file_path, None)
             return True
-        except Exception as e:
-            print(f"Error loading sound '{file_path}': {e}")
-            return False
+
+    def preload(self, paths: Iterable[str]):
+        """
+        Load several sound files ahead of time.
+
+        Avoids disk I/O and decoding on the first alert. Already loaded
+        and empty paths are skipped.
+
+        Args:
+            paths: Sound file paths to load
+        """
+        for file_path in paths:
+            if file_path and file_path not in self.sounds:
+                self.load_sound(file_path)
 
     def play_sound(self, file_path: str, volume: float = 1.0) -> bool:
         """
@@ -64,19 +105,25 @@ class AudioManager:
             return False
 
         # Load sound if not already loaded
-        if file_path not in self.sounds:
-            if not self.load_sound(file_path):
-                return False
+        if file_path not in self.sounds and not self.load_sound(file_path):
+            return False
 
         try:
-            sound = self.sounds[file_path]
-
-            # Set volume (0.0 to 1.0)
             volume = max(0.0, min(1.0, volume))
-            sound.set_volume(volume)
-
-            # Play sound
-            sound.play()
+            with self._lock:
+                sound = self.sounds.get(file_path)
+                if sound is None:
+                    return False  # Unloaded meanwhile
+
+                # Set volume (0.0 to 1.0), skipping the mixer call if unchanged
+                if self._last_volume.get(file_path) != volume:
+                    sound.set_volume(volume)
+                    self._last_volume[file_path] = volume
+
+                # Play sound on the next channel in the pool
+                channel = self._channels[self._next_channel]
+                self._next_channel = (self._next_channel + 1) % NUM_CHANNELS
+            channel.play(sound)
             return True
         except Exception as e:
             print(f"Error playing sound '{file_path}': {e}")
@@ -94,12 +141,15 @@ class AudioManager:
         Args:
             file_path: Path to sound file
         """
-        if file_path in self.sounds:
-            del self.sounds[file_path]
+        with self._lock:
+            self.sounds.pop(file_path, None)
+            self._last_volume.pop(file_path, None)
 
     def clear_all(self):
         """Unload all sounds."""
-        self.sounds.clear()
+        with self._lock:
+            self.sounds.clear()
+            self._last_volume.clear()
 
     def __repr__(self) -> str:
         """String representation for debugging."""
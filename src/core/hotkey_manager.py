@@ -1,24 +1,156 @@
 """Global hotkey manager using pynput."""
 
+from functools import lru_cache
 from pynput import keyboard
-from typing import Dict, Callable, Set, Optional
+from typing import Dict, Callable, Optional, Tuple
+import queue
 import threading
 
 
+# Modifier bits for hotkey matching
+MOD_CTRL = 1
+MOD_SHIFT = 2
+MOD_ALT = 4
+
+_MODIFIER_NAMES = {'ctrl': MOD_CTRL, 'shift': MOD_SHIFT, 'alt': MOD_ALT}
+
+# Left/right and generic variants all map to the same bit
+_MODIFIER_KEYS = {
+    keyboard.Key.ctrl: MOD_CTRL,
+    keyboard.Key.ctrl_l: MOD_CTRL,
+    keyboard.Key.ctrl_r: MOD_CTRL,
+    keyboard.Key.shift: MOD_SHIFT,
+    keyboard.Key.shift_l: MOD_SHIFT,
+    keyboard.Key.shift_r: MOD_SHIFT,
+    keyboard.Key.alt: MOD_ALT,
+    keyboard.Key.alt_l: MOD_ALT,
+    keyboard.Key.alt_r: MOD_ALT,
+}
+
+# Virtual key codes for the number row and letters, so Shift+1 still
+# reads as "1" rather than "!" (matches the capture dialog)
+_VK_TO_CHAR = {vk: chr(vk) for vk in range(48, 58)}
+_VK_TO_CHAR.update({vk: chr(vk).lower() for vk in range(65, 91)})
+# Punctuation (VK_OEM_* codes, US layout), so Ctrl+- reads as "-"
+_VK_TO_CHAR.update({
+    186: ';', 187: '=', 188: ',', 189: '-', 190: '.', 191: '/', 192: '`',
+    219: '[', 220: '\\', 221: ']', 222: "'"
+})
+
+# Hotkey-string key names -> pynput Key names
+_KEY_ALIASES = {
+    # Function keys
+    'f1': 'f1', 'f2': 'f2', 'f3': 'f3', 'f4': 'f4',
+    'f5': 'f5', 'f6': 'f6', 'f7': 'f7', 'f8': 'f8',
+    'f9': 'f9', 'f10': 'f10', 'f11': 'f11', 'f12': 'f12',
+    'f13': 'f13', 'f14': 'f14', 'f15': 'f15', 'f16': 'f16',
+    'f17': 'f17', 'f18': 'f18', 'f19': 'f19', 'f20': 'f20',
+    'f21': 'f21', 'f22': 'f22', 'f23': 'f23', 'f24': 'f24',
+    # Navigation keys
+    'page_up': 'page_up', 'pageup': 'page_up',
+    'page_down': 'page_down', 'pagedown': 'page_down',
+    'home': 'home', 'end': 'end',
+    'insert': 'insert', 'ins': 'insert',
+    'delete': 'delete', 'del': 'delete',
+    # Arrow keys
+    'up': 'up', 'down': 'down', 'left': 'left', 'right': 'right',
+    # Numpad keys
+    'num0': 'num0', 'num1': 'num1', 'num2': 'num2',
+    'num3': 'num3', 'num4': 'num4', 'num5': 'num5',
+    'num6': 'num6', 'num7': 'num7', 'num8': 'num8',
+    'num9': 'num9',
+    'num_multiply': 'num_multiply', 'num_add': 'num_add',
+    'num_subtract': 'num_subtract', 'num_divide': 'num_divide',
+    'num_decimal': 'num_decimal',
+    # Lock keys
+    'num_lock': 'num_lock', 'scroll_lock': 'scroll_lock',
+    'caps_lock': 'caps_lock',
+    # Special keys
+    'space': 'space', 'enter': 'enter', 'tab': 'tab',
+    'backspace': 'backspace', 'esc': 'esc', 'escape': 'esc',
+    'pause': 'pause', 'print_screen': 'print_screen'
+}
+
+# Resolved once at import: only names this pynput version supports
+_KEY_NAMES = {
+    alias: name for alias, name in _KEY_ALIASES.items()
+    if getattr(keyboard.Key, name, None) is not None
+}
+
+# Keys Minecraft uses by default; hotkeys containing them get a warning
+_MINECRAFT_KEYS = frozenset({'e', 'q', 'w', 'a', 's', 'd', 'space'})
+_MINECRAFT_MODIFIERS = MOD_CTRL | MOD_SHIFT
+
+
+@lru_cache(maxsize=128)
+def _parse_hotkey_string(hotkey_string: str) -> Tuple[Optional[Tuple[int, str]], str]:
+    """
+    Parse hotkey string into a modifier mask and trigger key.
+
+    Cached because validate_hotkey re-parses the same strings repeatedly.
+    Nothing is printed here, since a cached call would only report once;
+    callers report the returned error instead.
+
+    Args:
+        hotkey_string: String like "ctrl+shift+1" or "ctrl+f13"
+
+    Returns:
+        Tuple of ((modifier bitmask, key name), "") or (None, error message)
+    """
+    mask = 0
+    trigger = None
+
+    for part in hotkey_string.lower().strip().split('+'):
+        part = part.strip()
+
+        # Modifiers
+        if part in _MODIFIER_NAMES:
+            mask |= _MODIFIER_NAMES[part]
+            continue
+
+        if trigger is not None:
+            return None, "Hotkey can only have one non-modifier key"
+
+        # Single character keys, then named special keys
+        if len(part) == 1:
+            trigger = part
+        elif part in _KEY_NAMES:
+            trigger = _KEY_NAMES[part]
+        else:
+            return None, f"Unsupported key '{part}'"
+
+    if trigger is None:
+        return None, "Hotkey must include a non-modifier key"
+
+    return (mask, trigger), ""
+
+
 class HotkeyManager:
     """
     Manages global hotkey registration and handling.
 
     Uses pynput to capture keyboard events even when app is not focused.
-    Thread-safe for use with Tkinter.
+    Thread-safe for use with Tkinter. Callbacks run on a dispatch thread,
+    never on pynput's listener thread, so slow callbacks can't delay
+    keyboard input.
     """
 
     def __init__(self):
         """Initialize hotkey manager."""
-        self.hotkeys: Dict[str, Dict] = {}  # hotkey_string -> {keys, callback}
+        self.hotkeys: Dict[str, Dict] = {}  # hotkey_string -> {mask, key, callback}
         self.listener: Optional[keyboard.Listener] = None
-        self.current_keys: Set = set()
-        self._lock = threading.Lock()
+        self.current_mask = 0
+        self.current_key: Optional[str] = None
+        # (mask, key) -> (hotkey_string, callback). Never mutated in place:
+        # writers build a new dict and swap the reference, so the listener
+        # thread can read it without taking _write_lock.
+        self._hotkey_index: Dict[Tuple[int, str], Tuple[str, Callable]] = {}
+        # True if any hotkey has no modifiers (e.g. a bare "f13")
+        self._has_bare_hotkey = False
+        # Serializes register/unregister/clear_all only; readers never lock
+        self._write_lock = threading.Lock()
+        self._dispatch_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._dispatch_thread: Optional[threading.Thread] = None
 
     def register_hotkey(self, hotkey_string: str, callback: Callable) -> bool:
         """
@@ -34,23 +166,26 @@ class HotkeyManager:
         if not hotkey_string:
             return False
 
-        with self._lock:
+        with self._write_lock:
             # Check for conflicts
             if hotkey_string in self.hotkeys:
                 print(f"Warning: Hotkey '{hotkey_string}' already registered")
                 return False
 
             # Parse hotkey string
-            keys = self._parse_hotkey(hotkey_string)
-            if not keys:
-                print(f"Error: Invalid hotkey string '{hotkey_string}'")
+            parsed, error = self._parse_hotkey(hotkey_string)
+            if not parsed:
+                print(f"Error: Invalid hotkey string '{hotkey_string}': {error}")
                 return False
 
             # Register hotkey
+            mask, key = parsed
             self.hotkeys[hotkey_string] = {
-                'keys': keys,
+                'mask': mask,
+                'key': key,
                 'callback': callback
             }
+            self._rebuild_index()
 
             # Restart listener if needed
             self._restart_listener()
@@ -67,111 +202,68 @@ class HotkeyManager:
         Returns:
             True if unregistered, False if not found
         """
-        with self._lock:
-            if hotkey_string in self.hotkeys:
-                del self.hotkeys[hotkey_string]
-                return True
-            return False
+        with self._write_lock:
+            if self.hotkeys.pop(hotkey_string, None) is None:
+                return False
+            self._rebuild_index()
+            return True
 
     def clear_all(self):
         """Remove all registered hotkeys."""
-        with self._lock:
+        with self._write_lock:
             self.hotkeys.clear()
+            self._rebuild_index()
 
     def stop(self):
-        """Stop the hotkey listener."""
+        """Stop the hotkey listener and dispatch thread."""
         if self.listener:
             self.listener.stop()
             self.listener = None
 
-    def _parse_hotkey(self, hotkey_string: str) -> Optional[Set]:
+        if self._dispatch_thread:
+            self._dispatch_queue.put(None)
+            self._dispatch_thread = None
+
+    def _rebuild_index(self):
+        """Rebuild the (mask, key) lookup table. Caller must hold _write_lock."""
+        self._hotkey_index = {
+            (data['mask'], data['key']): (hotkey_string, data['callback'])
+            for hotkey_string, data in self.hotkeys.items()
+        }
+        self._has_bare_hotkey = any(mask == 0 for mask, _ in self._hotkey_index)
+
+    def _parse_hotkey(self, hotkey_string: str) -> Tuple[Optional[Tuple[int, str]], str]:
         """
-        Parse hotkey string into set of Key objects.
+        Parse hotkey string into a modifier mask and trigger key.
 
         Args:
             hotkey_string: String like "ctrl+shift+1" or "ctrl+f13"
 
         Returns:
-            Set of Key/KeyCode objects or None if invalid
+            Tuple of ((modifier bitmask, key name), "") or (None, error message)
+        """
+        return _parse_hotkey_string(hotkey_string)
+
+    @staticmethod
+    def _key_name(key) -> Optional[str]:
+        """
+        Get the hotkey-string name for a pynput key event.
+
+        Args:
+            key: Key or KeyCode from the listener
+
+        Returns:
+            Name like "1" or "f13", or None if unknown
         """
-        parts = hotkey_string.lower().strip().split('+')
-        keys = set()
-
-        for part in parts:
-            part = part.strip()
-
-            # Modifiers
-            if part == 'ctrl':
-                keys.add(keyboard.Key.ctrl_l)
-                keys.add(keyboard.Key.ctrl_r)
-            elif part == 'shift':
-                keys.add(keyboard.Key.shift_l)
-                keys.add(keyboard.Key.shift_r)
-            elif part == 'alt':
-                keys.add(keyboard.Key.alt_l)
-                keys.add(keyboard.Key.alt_r)
-            # Single character keys
-            elif len(part) == 1:
-                try:
-                    keys.add(keyboard.KeyCode.from_char(part))
-                except Exception:
-                    print(f"Warning: Invalid key '{part}'")
-                    return None
-            # Named special keys
-            else:
-                # Try to get named key from pynput
-                # Map common name variations to pynput Key names
-                key_map = {
-                    # Function keys
-                    'f1': 'f1', 'f2': 'f2', 'f3': 'f3', 'f4': 'f4',
-                    'f5': 'f5', 'f6': 'f6', 'f7': 'f7', 'f8': 'f8',
-                    'f9': 'f9', 'f10': 'f10', 'f11': 'f11', 'f12': 'f12',
-                    'f13': 'f13', 'f14': 'f14', 'f15': 'f15', 'f16': 'f16',
-                    'f17': 'f17', 'f18': 'f18', 'f19': 'f19', 'f20': 'f20',
-                    'f21': 'f21', 'f22': 'f22', 'f23': 'f23', 'f24': 'f24',
-                    # Navigation keys
-                    'page_up': 'page_up', 'pageup': 'page_up',
-                    'page_down': 'page_down', 'pagedown': 'page_down',
-                    'home': 'home', 'end': 'end',
-                    'insert': 'insert', 'ins': 'insert',
-                    'delete': 'delete', 'del': 'delete',
-                    # Arrow keys
-                    'up': 'up', 'down': 'down', 'left': 'left', 'right': 'right',
-                    # Numpad keys
-                    'num0': 'num0', 'num1': 'num1', 'num2': 'num2',
-                    'num3': 'num3', 'num4': 'num4', 'num5': 'num5',
-                    'num6': 'num6', 'num7': 'num7', 'num8': 'num8',
-                    'num9': 'num9',
-                    'num_multiply': 'num_multiply', 'num_add': 'num_add',
-                    'num_subtract': 'num_subtract', 'num_divide': 'num_divide',
-                    'num_decimal': 'num_decimal',
-                    # Lock keys
-                    'num_lock': 'num_lock', 'scroll_lock': 'scroll_lock',
-                    'caps_lock': 'caps_lock',
-                    # Special keys
-                    'space': 'space', 'enter': 'enter', 'tab': 'tab',
-                    'backspace': 'backspace', 'esc': 'esc', 'escape': 'esc',
-                    'pause': 'pause', 'print_screen': 'print_screen'
-                }
-
-                pynput_name = key_map.get(part)
-                if pynput_name:
-                    try:
-                        # Get the key from pynput's Key enum
-                        key_obj = getattr(keyboard.Key, pynput_name, None)
-                        if key_obj:
-                            keys.add(key_obj)
-                        else:
-                            print(f"Warning: Unsupported key '{part}'")
-                            return None
-                    except AttributeError:
-                        print(f"Warning: Unsupported key '{part}'")
-                        return None
-                else:
-                    print(f"Warning: Unsupported key '{part}'")
-                    return None
-
-        return keys if keys else None
+        if isinstance(key, keyboard.Key):
+            return key.name
+
+        vk = getattr(key, 'vk', None)
+        if vk in _VK_TO_CHAR:
+            return _VK_TO_CHAR[vk]
+
+        char = getattr(key, 'char', None)
+        return char.lower() if char else None
 
     def _restart_listener(self):
         """Restart the keyboard listener."""
@@ -184,66 +276,55 @@ class HotkeyManager:
         )
         self.listener.start()
 
+        if self._dispatch_thread is None:
+            self._dispatch_thread = threading.Thread(
+                target=self._dispatch_loop, daemon=True
+            )
+            self._dispatch_thread.start()
+
+    def _dispatch_loop(self):
+        """Run hotkey callbacks queued by the listener thread."""
+        while True:
+            entry = self._dispatch_queue.get()
+            if entry is None:
+                break
+
+            hotkey_string, callback = entry
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error in hotkey callback for '{hotkey_string}': {e}")
+
     def _on_press(self, key):
         """Handle key press event."""
-        self.current_keys.add(key)
+        bit = _MODIFIER_KEYS.get(key)
+        if bit:
+            self.current_mask |= bit
+            return
+
+        self.current_key = self._key_name(key)
+
+        # Plain typing can't match anything unless a bare hotkey exists
+        if self.current_mask == 0 and not self._has_bare_hotkey:
+            return
+
         self._check_hotkeys()
 
     def _on_release(self, key):
         """Handle key release event."""
-        if key in self.current_keys:
-            self.current_keys.discard(key)
+        bit = _MODIFIER_KEYS.get(key)
+        if bit:
+            self.current_mask &= ~bit
+        elif self._key_name(key) == self.current_key:
+            self.current_key = None
 
     def _check_hotkeys(self):
         """Check if current key combination matches any registered hotkey."""
-        with self._lock:
-            for hotkey_string, hotkey_data in self.hotkeys.items():
-                required_keys = hotkey_data['keys']
-
-                # Check if all required keys are pressed
-                if self._keys_match(required_keys, self.current_keys):
-                    # Invoke callback
-                    try:
-                        hotkey_data['callback']()
-                    except Exception as e:
-                        print(f"Error in hotkey callback for '{hotkey_string}': {e}")
-
-    def _keys_match(self, required: Set, current: Set) -> bool:
-        """
-        Check if required keys are pressed.
-
-        Handles modifier key variants (left/right).
-
-        Args:
-            required: Set of required keys
-            current: Set of currently pressed keys
-
-        Returns:
-            True if all required keys are pressed
-        """
-        # For each required key, check if it or its variant is pressed
-        for req_key in required:
-            # Check if this exact key is in current keys
-            if req_key in current:
-                continue
-
-            # For modifier keys, check if either left or right variant is pressed
-            if isinstance(req_key, keyboard.Key):
-                # It's a modifier - check if any variant is pressed
-                if req_key not in current:
-                    # Check if we need to match left/right variants
-                    key_name = str(req_key)
-                    if '_l' in key_name or '_r' in key_name:
-                        # Already specific, must match exactly
-                        return False
-                    # It's a general modifier, already checked above
-                    return False
-            else:
-                # Regular key must match exactly
-                return False
+        entry = self._hotkey_index.get((self.current_mask, self.current_key))
 
-        # All required keys found
-        return True
+        # Hand off to the dispatch thread; never run callbacks on the listener
+        if entry:
+            self._dispatch_queue.put(entry)
 
     def validate_hotkey(self, hotkey_string: str) -> Dict[str, any]:
         """
@@ -259,17 +340,17 @@ class HotkeyManager:
             return {"valid": False, "error": "Hotkey cannot be empty"}
 
         # Try to parse
-        keys = self._parse_hotkey(hotkey_string)
-        if not keys:
-            return {"valid": False, "error": "Invalid hotkey format"}
+        parsed, error = self._parse_hotkey(hotkey_string)
+        if not parsed:
+            return {"valid": False, "error": error}
 
         # Check for conflicts
         if hotkey_string in self.hotkeys:
             return {"valid": False, "error": "Hotkey already in use"}
 
         # Warn about common Minecraft keys
-        minecraft_keys = ['e', 'q', 'w', 'a', 's', 'd', 'space', 'shift', 'ctrl']
-        if any(key in hotkey_string.lower() for key in minecraft_keys):
+        mask, key = parsed
+        if mask & _MINECRAFT_MODIFIERS or key in _MINECRAFT_KEYS:
             return {
                 "valid": True,
                 "warning": "This hotkey may conflict with Minecraft controls"
@@ -6,6 +6,12 @@ from typing import Optional, Callable, Dict, Any
 from src.config.defaults import TimerState
 
 
+_RUNNING = TimerState.RUNNING
+
+# Precomputed "MM:SS" strings for 00:00 through 99:59
+_MMSS = tuple(f"{m:02d}:{s:02d}" for m in range(100) for s in range(60))
+
+
 class Timer:
     """
     Manages individual timer state and countdown logic.
@@ -21,6 +27,13 @@ class Timer:
         font_config: Font settings
     """
 
+    __slots__ = (
+        'id', 'label', 'duration', 'state', 'hotkey', 'alert_config',
+        'font_config', '_deadline', '_remaining', '_generation',
+        '_last_tick_seconds', '_on_complete_callback', '_on_tick_callback',
+        '_on_schedule_callback'
+    )
+
     def __init__(
         self,
         label: str,
@@ -41,45 +54,85 @@ class Timer:
             alert_config: Optional alert configuration
             font_config: Optional font configuration
         """
+        # Internal state for countdown. While running, remaining time is
+        # derived from a time.monotonic() deadline; otherwise it's stored.
+        self._deadline: Optional[float] = None
+        self._remaining = duration
+        # Bumped whenever the deadline changes so schedulers can discard
+        # stale entries
+        self._generation = 0
+        # Whole seconds remaining at the last tick callback
+        self._last_tick_seconds: Optional[int] = None
+        self._on_complete_callback: Optional[Callable] = None
+        self._on_tick_callback: Optional[Callable] = None
+        self._on_schedule_callback: Optional[Callable] = None
+
         self.id = timer_id or str(uuid.uuid4())
         self.label = label
         self.duration = duration
-        self.remaining = duration
         self.state = TimerState.STOPPED
         self.hotkey = hotkey
         self.alert_config = alert_config
         self.font_config = font_config
 
-        # Internal state for countdown
-        self._last_update = None
-        self._on_complete_callback: Optional[Callable] = None
-        self._on_tick_callback: Optional[Callable] = None
+    @property
+    def remaining(self) -> float:
+        """Remaining time in seconds."""
+        if self._deadline is not None:
+            return max(0, self._deadline - time.monotonic())
+        return self._remaining
+
+    @remaining.setter
+    def remaining(self, value: float):
+        self._remaining = value
+        if self._deadline is not None:
+            self._set_deadline(time.monotonic() + value)
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """time.monotonic() value at which a running timer completes."""
+        return self._deadline
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped each time the deadline changes."""
+        return self._generation
+
+    def _set_deadline(self, deadline: Optional[float]):
+        """Set or clear the deadline and notify the scheduler."""
+        self._deadline = deadline
+        self._generation += 1
+        # A new run must tick again even if it lands on the same second
+        self._last_tick_seconds = None
+        if deadline is not None and self._on_schedule_callback:
+            self._on_schedule_callback(self)
 
     def start(self):
         """Start or resume the timer."""
         if self.state == TimerState.STOPPED:
-            self.remaining = self.duration  # Reset to full duration
+            self._remaining = self.duration  # Reset to full duration
 
         self.state = TimerState.RUNNING
-        self._last_update = time.time()
+        self._set_deadline(time.monotonic() + self._remaining)
 
     def pause(self):
         """Pause the timer."""
         if self.state == TimerState.RUNNING:
+            self._remaining = self.remaining
             self.state = TimerState.PAUSED
-            self._last_update = None
+            self._set_deadline(None)
 
     def resume(self):
         """Resume a paused timer."""
         if self.state == TimerState.PAUSED:
             self.state = TimerState.RUNNING
-            self._last_update = time.time()
+            self._set_deadline(time.monotonic() + self._remaining)
 
     def reset(self):
         """Reset timer to initial duration and stop."""
         self.state = TimerState.STOPPED
-        self.remaining = self.duration
-        self._last_update = None
+        self._remaining = self.duration
+        self._set_deadline(None)
 
     def stop(self):
         """Stop the timer (same as reset for now)."""
@@ -100,29 +153,26 @@ class Timer:
         Update timer countdown (called by TimerManager).
 
         Args:
-            current_time: Current time from time.time()
+            current_time: Current time from time.monotonic()
         """
-        if self.state != TimerState.RUNNING or self._last_update is None:
+        if self.state is not _RUNNING or self._deadline is None:
             return
 
-        # Calculate elapsed time since last update
-        elapsed = current_time - self._last_update
-        self._last_update = current_time
-
-        # Update remaining time
-        self.remaining -= elapsed
+        seconds = max(0, int(self._deadline - current_time))
 
         # Check for completion
-        if self.remaining <= 0:
-            self.remaining = 0
+        if current_time >= self._deadline:
+            self._remaining = 0
             self.state = TimerState.COMPLETED
+            self._set_deadline(None)
 
             # Trigger completion callback
             if self._on_complete_callback:
                 self._on_complete_callback(self)
 
-        # Trigger tick callback
-        if self._on_tick_callback:
+        # Trigger tick callback, only when the displayed second changes
+        if self._on_tick_callback and seconds != self._last_tick_seconds:
+            self._last_tick_seconds = seconds
             self._on_tick_callback(self)
 
     def is_complete(self) -> bool:
@@ -137,6 +187,10 @@ class Timer:
         """Set callback function to call on each update tick."""
         self._on_tick_callback = callback
 
+    def set_on_schedule(self, callback: Callable):
+        """Set callback function to call when a new deadline is set."""
+        self._on_schedule_callback = callback
+
     def get_display_time(self) -> str:
         """
         Get formatted time string for display (MM:SS).
@@ -145,6 +199,9 @@ class Timer:
             Formatted time string
         """
         total_seconds = max(0, int(self.remaining))
+        if total_seconds < len(_MMSS):
+            return _MMSS[total_seconds]
+
         minutes = total_seconds // 60
         seconds = total_seconds % 60
         return f"{minutes:02d}:{seconds:02d}"
@@ -162,7 +219,7 @@ class Timer:
             "duration_seconds": self.duration,
             "hotkey": self.hotkey,
             "state": {
-                "current_state": self.state,
+                "current_state": self.state.name.lower(),
                 "remaining_seconds": int(self.remaining)
             },
             "alert": self.alert_config,
@@ -192,7 +249,7 @@ class Timer:
         # Restore state
         if "state" in data:
             state_data = data["state"]
-            timer.state = state_data.get("current_state", TimerState.STOPPED)
+            timer.state = TimerState.parse(state_data.get("current_state", TimerState.STOPPED))
             timer.remaining = state_data.get("remaining_seconds", timer.duration)
 
         return timer
@@ -202,5 +259,5 @@ class Timer:
         return (
             f"Timer(id={self.id[:8]}..., label='{self.label}', "
             f"duration={self.duration}s, remaining={self.remaining:.1f}s, "
-            f"state={self.state})"
+            f"state={self.state.name})"
         )
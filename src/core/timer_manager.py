@@ -1,8 +1,10 @@
 """Timer manager for orchestrating multiple timers."""
 
+import heapq
+import queue
 import time
 import threading
-from typing import List, Optional, Callable, Dict
+from typing import List, Optional, Callable, Dict, Tuple
 from src.core.timer import Timer
 from src.config.defaults import TimerState
 
@@ -11,7 +13,10 @@ class TimerManager:
     """
     Manages multiple timers with a single update thread.
 
-    Handles timer lifecycle, update loop, and event coordination.
+    Handles timer lifecycle, update loop, and event coordination. The
+    update thread sleeps until the next timer deadline (or the next tick
+    while a tick callback is set) and blocks indefinitely when no timer
+    is running.
     """
 
     def __init__(self, update_interval_ms: int = 100):
@@ -22,10 +27,23 @@ class TimerManager:
             update_interval_ms: Update tick interval in milliseconds (default: 100ms)
         """
         self.timers: List[Timer] = []
+        self._by_id: Dict[str, Timer] = {}  # timer_id -> Timer
         self.update_interval = update_interval_ms / 1000.0  # Convert to seconds
         self._running = False
         self._update_thread: Optional[threading.Thread] = None
-        self._lock = threading.Lock()
+        # Reentrant so a callback that calls back into the manager can't
+        # deadlock against itself
+        self._lock = threading.RLock()
+        self._wakeup = threading.Condition(self._lock)
+        # Min-heap of (deadline, generation, timer_id); entries whose
+        # generation no longer matches the timer are stale and skipped
+        self._deadlines: List[Tuple[float, int, str]] = []
+
+        # timer_id -> (state, whole seconds) as of the last get_dirty_timers
+        self._displayed: Dict[str, Tuple[TimerState, int]] = {}
+
+        # Completed timers waiting for process_events on the UI thread
+        self._event_queue: queue.SimpleQueue = queue.SimpleQueue()
 
         # Callbacks for UI integration
         self._on_timer_complete: Optional[Callable] = None
@@ -40,10 +58,15 @@ class TimerManager:
         """
         with self._lock:
             self.timers.append(timer)
+            self._by_id[timer.id] = timer
 
             # Set completion callback
             timer.set_on_complete(self._handle_timer_complete)
             timer.set_on_tick(self._handle_timer_tick)
+            timer.set_on_schedule(self._schedule_timer)
+
+            if timer.deadline is not None:
+                self._push_deadline(timer)
 
     def remove_timer(self, timer_id: str) -> bool:
         """
@@ -56,11 +79,11 @@ class TimerManager:
             True if timer was removed, False if not found
         """
         with self._lock:
-            for i, timer in enumerate(self.timers):
-                if timer.id == timer_id:
-                    del self.timers[i]
-                    return True
-        return False
+            timer = self._by_id.pop(timer_id, None)
+            if timer is None:
+                return False
+            self.timers.remove(timer)
+            return True
 
     def get_timer(self, timer_id: str) -> Optional[Timer]:
         """
@@ -72,17 +95,59 @@ class TimerManager:
         Returns:
             Timer instance or None if not found
         """
-        with self._lock:
-            for timer in self.timers:
-                if timer.id == timer_id:
-                    return timer
-        return None
+        return self._by_id.get(timer_id)
 
     def get_all_timers(self) -> List[Timer]:
         """Get a copy of all timers."""
         with self._lock:
             return list(self.timers)
 
+    def get_dirty_timers(self) -> List[str]:
+        """
+        Get timers whose displayed state changed since the last call.
+
+        A timer is dirty when its state or whole seconds remaining
+        changed, i.e. when its MM:SS display or buttons would change.
+
+        Returns:
+            List of timer IDs
+        """
+        dirty = []
+        displayed = {}
+        for timer in self.get_all_timers():
+            shown = (timer.state, int(timer.remaining))
+            displayed[timer.id] = shown
+            if self._displayed.get(timer.id) != shown:
+                dirty.append(timer.id)
+
+        self._displayed = displayed
+        return dirty
+
+    def get_next_display_change(self) -> Optional[float]:
+        """
+        Get time until the next running timer's MM:SS display changes.
+
+        Returns:
+            Seconds until the nearest whole-second boundary, 0 if a running
+            timer is past its deadline but not yet marked complete, or None
+            if no timer is counting down
+        """
+        # Timers restored as running from a saved profile have no deadline
+        # and never change on their own, so only deadlines count
+        now = time.monotonic()
+        next_change = None
+        for timer in self.get_all_timers():
+            deadline = timer.deadline
+            if timer.state != TimerState.RUNNING or deadline is None:
+                continue
+            if deadline <= now:
+                # The update thread is about to complete it; check again soon
+                return 0.0
+            fraction = (deadline - now) % 1
+            if next_change is None or fraction < next_change:
+                next_change = fraction
+        return next_change
+
     def start(self):
         """Start the update loop thread."""
         if not self._running:
@@ -92,38 +157,123 @@ class TimerManager:
 
     def stop(self):
         """Stop the update loop thread."""
-        self._running = False
+        with self._wakeup:
+            self._running = False
+            self._wakeup.notify_all()
         if self._update_thread:
             self._update_thread.join(timeout=1.0)
             self._update_thread = None
 
     def _update_loop(self):
-        """Background thread that updates all timers."""
+        """Background thread that updates timers as their deadlines pass."""
         while self._running:
             try:
-                current_time = time.time()
-
-                # Update all running timers
-                with self._lock:
-                    for timer in self.timers:
-                        if timer.state == TimerState.RUNNING:
-                            timer.update(current_time)
-
-                # Sleep for update interval
-                time.sleep(self.update_interval)
+                with self._wakeup:
+                    self._wakeup.wait(self._next_timeout(time.monotonic()))
+                    if not self._running:
+                        break
+
+                    current_time = time.monotonic()
+                    if self._on_timer_tick:
+                        # Every running timer ticks
+                        due = [t for t in self.timers if t.state == TimerState.RUNNING]
+                    else:
+                        due = self._pop_due(current_time)
+
+                # Update outside the lock so callbacks can use the manager
+                for timer in due:
+                    timer.update(current_time)
 
             except Exception as e:
                 print(f"Error in timer update loop: {e}")
 
+    def _next_timeout(self, now: float) -> Optional[float]:
+        """
+        Get how long the update thread should sleep. Caller must hold _lock.
+
+        Args:
+            now: Current time from time.monotonic()
+
+        Returns:
+            Seconds until the next deadline or tick, or None if idle
+        """
+        # Drop stale entries so they don't cause pointless wakeups
+        while self._deadlines and self._is_stale(self._deadlines[0]):
+            heapq.heappop(self._deadlines)
+
+        if not self._deadlines:
+            return None
+
+        timeout = self._deadlines[0][0] - now
+        if self._on_timer_tick:
+            timeout = min(timeout, self.update_interval)
+        return max(0.0, timeout)
+
+    def _pop_due(self, now: float) -> List[Timer]:
+        """Pop timers whose deadline has passed. Caller must hold _lock."""
+        due = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            entry = heapq.heappop(self._deadlines)
+            if not self._is_stale(entry):
+                due.append(self._by_id.get(entry[2]))
+        return due
+
+    def _is_stale(self, entry: Tuple[float, int, str]) -> bool:
+        """Check if a heap entry no longer matches its timer."""
+        timer = self._by_id.get(entry[2])
+        return timer is None or timer.generation != entry[1]
+
+    def _push_deadline(self, timer: Timer):
+        """Add a timer's deadline to the heap. Caller must hold _lock."""
+        heapq.heappush(self._deadlines, (timer.deadline, timer.generation, timer.id))
+
+    def _schedule_timer(self, timer: Timer):
+        """
+        Handle a timer getting a new deadline.
+
+        Args:
+            timer: Timer that was started, resumed, or had its time changed
+        """
+        with self._wakeup:
+            if timer.deadline is not None:
+                self._push_deadline(timer)
+                self._wakeup.notify()
+
     def _handle_timer_complete(self, timer: Timer):
         """
         Handle timer completion event.
 
+        Queues the event instead of running the callback here, so alert
+        handling never blocks the update thread.
+
         Args:
             timer: Timer that completed
         """
-        if self._on_timer_complete:
-            self._on_timer_complete(timer)
+        self._event_queue.put(timer)
+
+    def process_events(self, max_events: int = 32) -> int:
+        """
+        Run completion callbacks for queued timer events.
+
+        Call periodically from the UI thread.
+
+        Args:
+            max_events: Maximum number of events to handle in this call
+
+        Returns:
+            Number of events handled
+        """
+        handled = 0
+        while handled < max_events:
+            try:
+                timer = self._event_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            handled += 1
+            if self._on_timer_complete:
+                self._on_timer_complete(timer)
+        return handled
 
     def _handle_timer_tick(self, timer: Timer):
         """
@@ -139,6 +289,8 @@ class TimerManager:
         """
         Set callback for timer completion events.
 
+        The callback runs from process_events, not the update thread.
+
         Callback signature: callback(timer: Timer) -> None
         """
         self._on_timer_complete = callback
@@ -149,7 +301,9 @@ class TimerManager:
 
         Callback signature: callback(timer: Timer) -> None
         """
-        self._on_timer_tick = callback
+        with self._wakeup:
+            self._on_timer_tick = callback
+            self._wakeup.notify()
 
     def execute_timer_action(self, timer_id: str, action: str):
         """
@@ -172,13 +326,15 @@ class TimerManager:
 
     def to_dict_list(self) -> List[Dict]:
         """Serialize all timers to list of dictionaries."""
-        with self._lock:
-            return [timer.to_dict() for timer in self.timers]
+        # Serialize outside the lock; only the list copy needs it
+        return [timer.to_dict() for timer in self.get_all_timers()]
 
     def clear(self):
         """Remove all timers."""
         with self._lock:
             self.timers.clear()
+            self._by_id.clear()
+            self._deadlines.clear()
 
     def load_from_dict_list(self, timer_data_list: List[Dict]):
         """
@@ -2,6 +2,7 @@
 
 import os
 import sys
+import threading
 import traceback
 
 # Add parent directory to path for imports
@@ -14,29 +15,31 @@ from src.utils.persistence import get_config_dir
 from src.utils.logger import setup_logger, get_logger, log_exception, log_startup_validation
 
 
+def _run_startup_validation(logger):
+    """Run startup validation checks and log a summary."""
+    validation_issues = log_startup_validation()
+
+    if validation_issues:
+        logger.warning('Starting with %d validation warnings', len(validation_issues))
+
+
 def main():
     """Main application entry point."""
     logger = None
 
     try:
-        # Set up logging (beta testing mode - verbose)
-        logger = setup_logger(enable_console=True)
+        # Set up logging (console output only in beta mode: MMM_BETA=1)
+        logger = setup_logger(enable_console=bool(os.environ.get('MMM_BETA')))
 
         # Install custom exception handler
         sys.excepthook = log_exception
 
         logger.info('Starting mmMCounter...')
 
-        # Run startup validation
-        validation_issues = log_startup_validation()
-
-        if validation_issues:
-            logger.warning(f'Starting with {len(validation_issues)} validation warnings')
-
         # Initialize config manager
         logger.info('Initializing configuration manager...')
         config_dir = get_config_dir()
-        logger.info(f'Config directory: {config_dir}')
+        logger.info('Config directory: %s', config_dir)
         config_manager = ConfigManager(config_dir)
 
         # Create default profile if it doesn't exist
@@ -53,6 +56,12 @@ def main():
         logger.info('Creating main window...')
         app = MainWindow(config_manager, timer_manager)
         logger.info('[OK] Main window created')
+
+        # Startup validation only logs, so don't delay the window for it
+        threading.Thread(
+            target=_run_startup_validation, args=(logger,), daemon=True
+        ).start()
+
         logger.info('Starting main event loop...')
         logger.info('=' * 80)
 
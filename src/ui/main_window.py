@@ -2,15 +2,16 @@
 
 import tkinter as tk
 from tkinter import messagebox
-from typing import Dict
-import uuid
+from typing import Dict, List, Optional
+import itertools
+import threading
 
 from src.core.timer import Timer
 from src.core.timer_manager import TimerManager
 from src.core.hotkey_manager import HotkeyManager
 from src.core.audio_manager import AudioManager
 from src.ui.timer_row import TimerRow
-from src.ui.themes import Theme
+from src.ui.themes import get_theme
 from src.ui.timer_config_dialog import TimerConfigDialog
 from src.ui.settings_dialog import SettingsDialog
 from src.ui.profile_manager import ProfileManagerDialog
@@ -18,6 +19,12 @@ from src.config.config_manager import ConfigManager
 from src.config.defaults import DEFAULT_TIMER
 from src.utils.alert_manager import AlertManager
 
+# Timer rows created per event-loop turn while a profile loads
+ROW_BATCH_SIZE = 8
+
+# How often queued timer completions are handed to the UI thread
+EVENT_DRAIN_MS = 10
+
 
 class MainWindow(tk.Tk):
     """
@@ -30,6 +37,9 @@ class MainWindow(tk.Tk):
     - Menu bar for settings and profiles
     """
 
+    # Process-local source of new timer IDs
+    _timer_ids = itertools.count(1)
+
     def __init__(self, config_manager: ConfigManager, timer_manager: TimerManager):
         """
         Initialize main window.
@@ -42,7 +52,15 @@ class MainWindow(tk.Tk):
 
         self.config_manager = config_manager
         self.timer_manager = timer_manager
-        self.timer_rows: Dict[str, TimerRow] = {}  # timer_id -> TimerRow
+        # Timer rows as parallel lists plus a timer_id -> index map
+        self._row_ids: List[str] = []
+        self._rows: List[TimerRow] = []
+        self._row_index: Dict[str, int] = {}
+        self._row_batch_job: Optional[str] = None
+        self._update_after_id: Optional[str] = None
+        self._drain_after_id: Optional[str] = None
+        self._label_counter = 0  # Last number used for "Timer N" labels
+        self._cfg_dialog: Optional[TimerConfigDialog] = None  # Reused across opens
 
         # Initialize hotkey, audio, and alert managers
         self.hotkey_manager = HotkeyManager()
@@ -59,7 +77,8 @@ class MainWindow(tk.Tk):
         if profile:
             theme_name = profile.get("global_settings", {}).get("theme", "dark")
 
-        self.theme = Theme(theme_name)
+        self.theme = get_theme(theme_name)
+        self.theme.apply_option_defaults(self)
 
         # Window setup
         self.title("mmMCounter")
@@ -72,22 +91,24 @@ class MainWindow(tk.Tk):
         self.geometry("480x300")
         self.resizable(True, True)
 
-        # Create UI
-        self._create_menu()
+        # Create UI (menu bar after first paint)
+        self.after_idle(self._create_menu)
         self._create_toolbar()
         self._create_scrollable_frame()
 
         # Set up timer callbacks
-        self.timer_manager.set_on_timer_tick(self._on_timer_tick)
         self.timer_manager.set_on_timer_complete(self._on_timer_complete)
 
-        # Load timers from profile
-        self._load_profile(self.current_profile_name)
+        # Load timers from profile once the empty window has painted
+        self.after_idle(self._load_profile, self.current_profile_name)
 
         # Start timer update loop
         self.timer_manager.start()
 
-        # Update UI every 100ms
+        # Deliver completions promptly, independent of display refreshes
+        self._drain_events()
+
+        # Refresh timer rows as their displays change
         self._schedule_ui_update()
 
         # Handle window close
@@ -95,75 +116,98 @@ class MainWindow(tk.Tk):
 
     def _create_menu(self):
         """Create menu bar."""
-        menubar = tk.Menu(self)
-        self.config(menu=menubar)
-
-        # File menu
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="Save Profile", command=self._save_current_profile)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self._on_close)
-
-        # Profiles menu (placeholder for Phase 4)
-        profiles_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Profiles", menu=profiles_menu)
-        profiles_menu.add_command(label="Manage Profiles...", command=self._show_profile_manager)
+        # (label, command) for menubar entries, (label, items) for menus;
+        # None in an item list is a separator
+        menu_spec = (
+            ("File", (
+                ("Save Profile", self._save_current_profile),
+                None,
+                ("Exit", self._on_close),
+            )),
+            ("Profiles...", self._show_profile_manager),
+            ("Settings...", self._show_settings),
+            ("Help", (
+                ("About", self._show_about),
+            )),
+        )
 
-        # Settings menu (placeholder for Phase 4)
-        settings_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Settings", menu=settings_menu)
-        settings_menu.add_command(label="Preferences...", command=self._show_settings)
+        menubar = tk.Menu(self)
+        for label, entry in menu_spec:
+            if callable(entry):
+                menubar.add_command(label=label, command=entry)
+                continue
+
+            menu = tk.Menu(menubar, tearoff=0)
+            menubar.add_cascade(label=label, menu=menu)
+            for item in entry:
+                if item is None:
+                    menu.add_separator()
+                else:
+                    menu.add_command(label=item[0], command=item[1])
 
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="About", command=self._show_about)
+        self.config(menu=menubar)
 
     def _create_toolbar(self):
         """Create toolbar with Add Timer button."""
-        toolbar = tk.Frame(self, bg=self.theme.bg_color)
+        toolbar = tk.Frame(self)
         toolbar.pack(side=tk.TOP, fill=tk.X, padx=5, pady=5)
 
         add_button = tk.Button(
             toolbar,
             text="+ Add Timer",
-            command=self._add_timer
+            command=self._add_timer,
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(add_button, "button")
         add_button.pack(side=tk.LEFT, padx=2)
 
     def _create_scrollable_frame(self):
         """Create scrollable frame for timer rows."""
         # Container frame
-        container = tk.Frame(self, bg=self.theme.bg_color)
+        container = tk.Frame(self)
         container.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         # Canvas for scrolling
-        self.canvas = tk.Canvas(container, bg=self.theme.bg_color, highlightthickness=0)
+        self.canvas = tk.Canvas(container, highlightthickness=0)
         scrollbar = tk.Scrollbar(container, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = tk.Frame(self.canvas, bg=self.theme.bg_color)
+        self._scrollregion_pending = False
+        self.scrollable_frame = self._create_rows_frame()
 
-        # Configure scrolling
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self._canvas_window = self.canvas.create_window(
+            (0, 0), window=self.scrollable_frame, anchor="nw"
         )
-
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=scrollbar.set)
 
         # Pack canvas and scrollbar
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
+    def _create_rows_frame(self) -> tk.Frame:
+        """Create the frame that holds timer rows inside the canvas."""
+        frame = tk.Frame(self.canvas)
+
+        # Configure scrolling (recomputed once per burst of resizes)
+        frame.bind("<Configure>", self._queue_scrollregion_update)
+        return frame
+
+    def _queue_scrollregion_update(self, event=None):
+        """Schedule a single scrollregion update for when Tk is idle."""
+        if not self._scrollregion_pending:
+            self._scrollregion_pending = True
+            self.after_idle(self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        """Resize the canvas scrollregion to fit the timer rows."""
+        self._scrollregion_pending = False
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
     def _add_timer(self):
         """Add a new timer."""
         # Create new timer with default values
+        self._label_counter += 1
         new_timer = Timer(
-            label=f"Timer {len(self.timer_manager) + 1}",
+            label=f"Timer {self._label_counter}",
             duration=DEFAULT_TIMER["duration_seconds"],
-            timer_id=str(uuid.uuid4())
+            timer_id=self._new_timer_id()
         )
 
         # Add to manager
@@ -172,6 +216,18 @@ class MainWindow(tk.Tk):
         # Create timer row widget
         self._create_timer_row(new_timer)
 
+    def _new_timer_id(self) -> str:
+        """
+        Generate a short timer ID not used by any loaded timer.
+
+        Returns:
+            New timer ID
+        """
+        while True:
+            timer_id = f"t{next(self._timer_ids)}"
+            if self.timer_manager.get_timer(timer_id) is None:
+                return timer_id
+
     def _create_timer_row(self, timer: Timer):
         """
         Create a timer row widget for a timer.
@@ -188,7 +244,45 @@ class MainWindow(tk.Tk):
         )
         row.pack(fill=tk.X, padx=2, pady=2)
 
-        self.timer_rows[timer.id] = row
+        self._row_index[timer.id] = len(self._rows)
+        self._row_ids.append(timer.id)
+        self._rows.append(row)
+
+    def _get_row(self, timer_id: str) -> Optional[TimerRow]:
+        """
+        Get the row widget for a timer.
+
+        Args:
+            timer_id: ID of timer
+
+        Returns:
+            TimerRow or None if the timer has no row
+        """
+        index = self._row_index.get(timer_id)
+        return None if index is None else self._rows[index]
+
+    def _remove_row(self, timer_id: str) -> Optional[TimerRow]:
+        """
+        Remove a timer's row from the row lists (swap with last and pop).
+
+        Args:
+            timer_id: ID of timer
+
+        Returns:
+            Removed TimerRow or None if the timer has no row
+        """
+        index = self._row_index.pop(timer_id, None)
+        if index is None:
+            return None
+
+        row = self._rows[index]
+        last_id = self._row_ids.pop()
+        last_row = self._rows.pop()
+        if index < len(self._rows):
+            self._row_ids[index] = last_id
+            self._rows[index] = last_row
+            self._row_index[last_id] = index
+        return row
 
     def _on_timer_config(self, timer_id: str):
         """
@@ -202,7 +296,16 @@ class MainWindow(tk.Tk):
             return
 
         # Show config dialog
-        dialog = TimerConfigDialog(self, timer, self.theme, self.hotkey_manager)
+        # Reuse one dialog; building its widgets costs more than refilling them.
+        # Rebuild it after a theme change, since its colors are set at build time
+        dialog = self._cfg_dialog
+        if dialog is None or not dialog.winfo_exists() or dialog.theme is not self.theme:
+            if dialog is not None and dialog.winfo_exists():
+                dialog.destroy()
+            dialog = TimerConfigDialog(self, timer, self.theme, self.hotkey_manager)
+            self._cfg_dialog = dialog
+        else:
+            dialog._populate_from_timer(timer)
         config = dialog.show()
 
         if config:
@@ -223,9 +326,10 @@ class MainWindow(tk.Tk):
                 self._register_timer_hotkey(timer)
 
             # Update UI
-            if timer_id in self.timer_rows:
-                self.timer_rows[timer_id].label_widget.configure(text=timer.label)
-                self.timer_rows[timer_id].update_display()
+            row = self._get_row(timer_id)
+            if row:
+                row.label_widget.configure(text=timer.label)
+                row.update_display()
 
     def _on_timer_delete(self, timer_id: str):
         """
@@ -240,22 +344,13 @@ class MainWindow(tk.Tk):
             self.hotkey_manager.unregister_hotkey(timer.hotkey)
 
         # Remove from UI
-        if timer_id in self.timer_rows:
-            self.timer_rows[timer_id].destroy()
-            del self.timer_rows[timer_id]
+        row = self._remove_row(timer_id)
+        if row:
+            row.destroy()
 
         # Remove from manager
         self.timer_manager.remove_timer(timer_id)
 
-    def _on_timer_tick(self, timer: Timer):
-        """
-        Handle timer tick event.
-
-        Args:
-            timer: Timer that ticked
-        """
-        # UI update is handled by scheduled update in _schedule_ui_update
-
     def _on_timer_complete(self, timer: Timer):
         """
         Handle timer completion event.
@@ -265,6 +360,11 @@ class MainWindow(tk.Tk):
         """
         print(f"Timer completed: {timer.label}")
 
+        # Show the completed state now rather than on the next display refresh
+        row = self._get_row(timer.id)
+        if row:
+            row.update_display()
+
         # Get alert configuration
         alert_config = timer.alert_config or {}
         visual_config = alert_config.get('visual', {})
@@ -291,14 +391,26 @@ class MainWindow(tk.Tk):
             if sound_file:
                 self.audio_manager.play_sound(sound_file, volume)
 
+    def _drain_events(self):
+        """Handle timer completions queued by the update thread."""
+        self.timer_manager.process_events()
+        self._drain_after_id = self.after(EVENT_DRAIN_MS, self._drain_events)
+
     def _schedule_ui_update(self):
         """Schedule periodic UI updates."""
-        # Update all timer row displays
-        for timer_row in self.timer_rows.values():
-            timer_row.update_display()
-
-        # Schedule next update (100ms)
-        self.after(100, self._schedule_ui_update)
+        # Update only rows whose display changed
+        for timer_id in self.timer_manager.get_dirty_timers():
+            row = self._get_row(timer_id)
+            if row:
+                row.update_display()
+
+        # Wake just after the next visible second change, or slowly if idle
+        next_change = self.timer_manager.get_next_display_change()
+        if next_change is None:
+            delay_ms = 500
+        else:
+            delay_ms = max(16, int(next_change * 1000) + 1)
+        self._update_after_id = self.after(delay_ms, self._schedule_ui_update)
 
     def _register_timer_hotkey(self, timer: Timer):
         """Register global hotkey for a timer."""
@@ -316,20 +428,24 @@ class MainWindow(tk.Tk):
         timer = self.timer_manager.get_timer(timer_id)
         if timer:
             timer.toggle()
+            row = self._get_row(timer_id)
+            if row:
+                row.update_display()
 
     def _start_timer_flash(self, timer_id: str):
         """Start visual alert flashing for a timer."""
-        if timer_id in self.timer_rows:
-            # Simple flash implementation - toggle every 500ms for 3 seconds
-            self._flash_timer_row(timer_id, count=0, max_count=6)
+        # Simple flash implementation - toggle every 500ms for 3 seconds
+        # (_flash_timer_row stops on its own if the timer has no row)
+        self._flash_timer_row(timer_id, count=0, max_count=6)
 
     def _flash_timer_row(self, timer_id: str, count: int, max_count: int):
         """Flash timer row recursively."""
-        if timer_id not in self.timer_rows or count >= max_count:
+        row = self._get_row(timer_id)
+        if not row or count >= max_count:
             return
 
-        # Toggle flash
-        self.timer_rows[timer_id].flash_alert()
+        # Completed rows already show the alert color, so odd counts flash
+        row.flash_alert(count % 2 == 1)
 
         # Schedule next flash
         self.after(500, lambda: self._flash_timer_row(
@@ -349,18 +465,76 @@ class MainWindow(tk.Tk):
             self.config_manager.create_default_profile()
             profile = self.config_manager.load_profile("default")
 
+        # Stop streaming rows for a previously loading profile
+        if self._row_batch_job is not None:
+            self.after_cancel(self._row_batch_job)
+            self._row_batch_job = None
+
         # Clear existing timers
-        for timer_id in list(self.timer_rows.keys()):
-            self._on_timer_delete(timer_id)
+        for timer in self.timer_manager.get_all_timers():
+            if timer.hotkey:
+                self.hotkey_manager.unregister_hotkey(timer.hotkey)
+
+        # Swap in a fresh frame and destroy the old one in a single call
+        # instead of one destroy per row
+        old_frame = self.scrollable_frame
+        self.scrollable_frame = self._create_rows_frame()
+        self._row_ids, self._rows, self._row_index = [], [], {}
+        self.canvas.itemconfigure(self._canvas_window, window=self.scrollable_frame)
+        old_frame.destroy()
 
         # Load timers from profile
         timer_data_list = profile.get("timers", [])
         self.timer_manager.load_from_dict_list(timer_data_list)
+        self._label_counter = max(
+            profile.get("global_settings", {}).get("timer_label_counter", 0),
+            len(timer_data_list)
+        )
 
-        # Create UI rows for each timer and register hotkeys
-        for timer in self.timer_manager.get_all_timers():
-            self._create_timer_row(timer)
+        # Register hotkeys now; rows are created in batches so the event
+        # loop keeps painting while a large profile loads
+        timers = self.timer_manager.get_all_timers()
+        for timer in timers:
             self._register_timer_hotkey(timer)
+        self._create_timer_row_batch(timers)
+
+        self._preload_sounds(profile)
+
+    def _create_timer_row_batch(self, timers: List[Timer]):
+        """
+        Create rows for the first ROW_BATCH_SIZE timers and schedule the rest.
+
+        Args:
+            timers: Timers still waiting for a row
+        """
+        self._row_batch_job = None
+        for timer in timers[:ROW_BATCH_SIZE]:
+            # Skip timers deleted before their row was built
+            if self.timer_manager.get_timer(timer.id) is timer:
+                self._create_timer_row(timer)
+
+        remaining = timers[ROW_BATCH_SIZE:]
+        if remaining:
+            self._row_batch_job = self.after(1, self._create_timer_row_batch, remaining)
+
+    def _preload_sounds(self, profile: Dict):
+        """
+        Load alert sounds used by a profile in the background.
+
+        Args:
+            profile: Profile configuration dictionary
+        """
+        default_audio = (profile.get("global_settings", {})
+                         .get("default_alert", {}).get("audio", {}))
+        paths = {default_audio.get("file", "")}
+        for timer in self.timer_manager.get_all_timers():
+            audio_config = (timer.alert_config or {}).get('audio', {})
+            if audio_config.get('enabled', False):
+                paths.add(audio_config.get('file', ''))
+
+        threading.Thread(
+            target=self.audio_manager.preload, args=(paths,), daemon=True
+        ).start()
 
     def _save_current_profile(self):
         """Save current timers to active profile."""
@@ -368,6 +542,7 @@ class MainWindow(tk.Tk):
         if profile:
             # Update timers in profile
             profile["timers"] = self.timer_manager.to_dict_list()
+            profile["global_settings"]["timer_label_counter"] = self._label_counter
 
             # Save profile
             if self.config_manager.save_profile(self.current_profile_name, profile):
@@ -398,13 +573,14 @@ class MainWindow(tk.Tk):
         Args:
             theme_name: Theme name ("dark" or "light")
         """
-        self.theme = Theme(theme_name)
+        self.theme = get_theme(theme_name)
+        self.theme.apply_option_defaults(self)
 
         # Update window background
         self.configure(bg=self.theme.bg_color)
 
         # Update all timer rows
-        for timer_row in self.timer_rows.values():
+        for timer_row in self._rows:
             timer_row.configure(bg=self.theme.bg_color)
             # Note: Full theme re-application would require rebuilding widgets
             # For now, user should restart app after theme change
@@ -435,7 +611,7 @@ class MainWindow(tk.Tk):
         global_settings = profile.get("global_settings", {})
 
         # Show dialog
-        dialog = SettingsDialog(self, global_settings, self.theme)
+        dialog = SettingsDialog.get(self, global_settings, self.theme)
         new_settings = dialog.show()
 
         if new_settings:
@@ -482,5 +658,11 @@ class MainWindow(tk.Tk):
         self.timer_manager.stop()
         self.hotkey_manager.stop()
 
+        # Cancel pending callbacks so none run against destroyed widgets
+        for after_id in (self._update_after_id, self._drain_after_id, self._row_batch_job):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._update_after_id = self._drain_after_id = self._row_batch_job = None
+
         # Close window
         self.destroy()
@@ -1,12 +1,26 @@
 """Profile manager dialog for managing timer profiles."""
 
+import os
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import ttk, messagebox, filedialog, simpledialog
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, List, Sequence, Set, Tuple
 from src.ui.themes import Theme
 from src.config.config_manager import ConfigManager
 from src.utils.validators import validate_profile_name, sanitize_filename
 
+# How long footer status messages stay visible
+STATUS_DISPLAY_MS = 3000
+
+# Worker threads used when importing several profiles at once
+IMPORT_WORKERS = 4
+
+# File types offered when exporting or importing profiles
+_PROFILE_FILETYPES = (
+    ("JSON files", "*.json"),
+    ("All files", "*.*")
+)
+
 
 class ProfileManagerDialog:
     """
@@ -22,6 +36,10 @@ class ProfileManagerDialog:
     - Switch active profile
     """
 
+    # Placement from the last open, keyed on parent position and size
+    _last_parent_key: Optional[Tuple[int, int, int, int]] = None
+    _last_geometry: Optional[str] = None
+
     def __init__(
         self,
         parent: tk.Tk,
@@ -46,17 +64,22 @@ class ProfileManagerDialog:
         self.theme = theme
         self.on_profile_switch = on_profile_switch
         self.selected_profile: Optional[str] = None
+        self._profile_names: List[str] = []  # Listbox index -> profile name
+        self._status_clear_job: Optional[str] = None
+        self._import_poll_job: Optional[str] = None
 
         # Create dialog window
         self.dialog = tk.Toplevel(parent)
         self.dialog.title("Profile Manager")
         self.dialog.configure(bg=theme.bg_color)
+        theme.apply_option_defaults(self.dialog)
         self.dialog.geometry("500x400")
         self.dialog.resizable(True, True)
 
         # Make modal
         self.dialog.transient(parent)
         self.dialog.grab_set()
+        self.dialog.protocol("WM_DELETE_WINDOW", self._on_close)
 
         # Build UI
         self._build_ui()
@@ -70,21 +93,19 @@ class ProfileManagerDialog:
     def _build_ui(self):
         """Build the profile manager UI."""
         # Main container
-        main_frame = tk.Frame(self.dialog, bg=self.theme.bg_color)
+        main_frame = tk.Frame(self.dialog)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
 
         # Header
         header_label = tk.Label(
             main_frame,
             text="Manage Profiles",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
             font=("Segoe UI", 12, "bold")
         )
         header_label.pack(anchor=tk.W, pady=(0, 10))
 
         # Profile list frame
-        list_frame = tk.Frame(main_frame, bg=self.theme.bg_color)
+        list_frame = tk.Frame(main_frame)
         list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
         # Listbox with scrollbar
@@ -105,20 +126,20 @@ class ProfileManagerDialog:
         self.profile_listbox.bind('<Double-Button-1>', self._on_load_profile)
 
         # Action buttons frame
-        action_frame = tk.Frame(main_frame, bg=self.theme.bg_color)
+        action_frame = tk.Frame(main_frame)
         action_frame.pack(fill=tk.X, pady=10)
 
         # Left side buttons (profile actions)
-        left_buttons = tk.Frame(action_frame, bg=self.theme.bg_color)
+        left_buttons = tk.Frame(action_frame)
         left_buttons.pack(side=tk.LEFT)
 
         new_btn = tk.Button(
             left_buttons,
             text="New",
             command=self._on_new_profile,
-            width=10
+            width=10,
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(new_btn, "button")
         new_btn.pack(side=tk.LEFT, padx=2)
 
         self.load_btn = tk.Button(
@@ -126,9 +147,9 @@ class ProfileManagerDialog:
             text="Load",
             command=self._on_load_profile,
             width=10,
-            state="disabled"
+            state="disabled",
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(self.load_btn, "button")
         self.load_btn.pack(side=tk.LEFT, padx=2)
 
         self.rename_btn = tk.Button(
@@ -136,9 +157,9 @@ class ProfileManagerDialog:
             text="Rename",
             command=self._on_rename_profile,
             width=10,
-            state="disabled"
+            state="disabled",
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(self.rename_btn, "button")
         self.rename_btn.pack(side=tk.LEFT, padx=2)
 
         self.duplicate_btn = tk.Button(
@@ -146,16 +167,16 @@ class ProfileManagerDialog:
             text="Duplicate",
             command=self._on_duplicate_profile,
             width=10,
-            state="disabled"
+            state="disabled",
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(self.duplicate_btn, "button")
         self.duplicate_btn.pack(side=tk.LEFT, padx=2)
 
         # Second row of action buttons
-        action_frame2 = tk.Frame(main_frame, bg=self.theme.bg_color)
+        action_frame2 = tk.Frame(main_frame)
         action_frame2.pack(fill=tk.X, pady=(0, 10))
 
-        left_buttons2 = tk.Frame(action_frame2, bg=self.theme.bg_color)
+        left_buttons2 = tk.Frame(action_frame2)
         left_buttons2.pack(side=tk.LEFT)
 
         self.delete_btn = tk.Button(
@@ -163,9 +184,9 @@ class ProfileManagerDialog:
             text="Delete",
             command=self._on_delete_profile,
             width=10,
-            state="disabled"
+            state="disabled",
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(self.delete_btn, "button")
         self.delete_btn.pack(side=tk.LEFT, padx=2)
 
         self.export_btn = tk.Button(
@@ -173,54 +194,82 @@ class ProfileManagerDialog:
             text="Export",
             command=self._on_export_profile,
             width=10,
-            state="disabled"
+            state="disabled",
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(self.export_btn, "button")
         self.export_btn.pack(side=tk.LEFT, padx=2)
 
         import_btn = tk.Button(
             left_buttons2,
             text="Import",
             command=self._on_import_profile,
-            width=10
+            width=10,
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(import_btn, "button")
         import_btn.pack(side=tk.LEFT, padx=2)
 
-        # Close button
-        close_frame = tk.Frame(main_frame, bg=self.theme.bg_color)
+        # Status line and close button
+        close_frame = tk.Frame(main_frame)
         close_frame.pack(fill=tk.X)
 
+        self.status_label = tk.Label(close_frame, text="", anchor=tk.W)
+        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
         close_btn = tk.Button(
             close_frame,
             text="Close",
-            command=self.dialog.destroy,
-            width=10
+            command=self._on_close,
+            width=10,
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(close_btn, "button")
         close_btn.pack(side=tk.RIGHT)
 
+    def _set_status(self, message: str):
+        """
+        Show a short-lived status message in the dialog footer.
+
+        Args:
+            message: Message to display
+        """
+        if self._status_clear_job is not None:
+            self.dialog.after_cancel(self._status_clear_job)
+        self.status_label.config(text=message)
+        self._status_clear_job = self.dialog.after(
+            STATUS_DISPLAY_MS, self._clear_status
+        )
+
+    def _clear_status(self):
+        """Clear the footer status message."""
+        self._status_clear_job = None
+        self.status_label.config(text="")
+
+    def _on_close(self):
+        """Cancel pending callbacks and close the dialog."""
+        for job in (self._status_clear_job, self._import_poll_job):
+            if job is not None:
+                self.dialog.after_cancel(job)
+        self._status_clear_job = self._import_poll_job = None
+        self.dialog.destroy()
+
     def _refresh_profile_list(self):
         """Refresh the profile listbox."""
         self.profile_listbox.delete(0, tk.END)
 
         profiles = self.config_manager.list_profiles()
+        self._profile_names = profiles
 
-        for profile in profiles:
-            display_text = profile
-            if profile == self.current_profile:
-                display_text += " (active)"
-
-            self.profile_listbox.insert(tk.END, display_text)
+        display_list = [
+            profile + (" (active)" if profile == self.current_profile else "")
+            for profile in profiles
+        ]
+        if display_list:
+            self.profile_listbox.insert(tk.END, *display_list)
 
     def _on_profile_select(self, event):
         """Handle profile selection."""
         selection = self.profile_listbox.curselection()
         if selection:
-            idx = selection[0]
-            profile_text = self.profile_listbox.get(idx)
-            # Remove " (active)" suffix if present
-            self.selected_profile = profile_text.replace(" (active)", "")
+            self.selected_profile = self._profile_names[selection[0]]
 
             # Enable buttons
             self.load_btn.config(state="normal")
@@ -259,7 +308,7 @@ class ProfileManagerDialog:
             return
 
         # Check if profile already exists
-        if self.config_manager.load_profile(name) is not None:
+        if self.config_manager.profile_exists(name):
             messagebox.showerror(
                 "Profile Exists",
                 f"Profile '{name}' already exists",
@@ -275,11 +324,7 @@ class ProfileManagerDialog:
             current_config["profile_name"] = name
 
             if self.config_manager.save_profile(name, current_config):
-                messagebox.showinfo(
-                    "Success",
-                    f"Profile '{name}' created",
-                    parent=self.dialog
-                )
+                self._set_status(f"Profile '{name}' created")
                 self._refresh_profile_list()
             else:
                 messagebox.showerror(
@@ -294,11 +339,7 @@ class ProfileManagerDialog:
             return
 
         if self.selected_profile == self.current_profile:
-            messagebox.showinfo(
-                "Already Active",
-                f"Profile '{self.selected_profile}' is already active",
-                parent=self.dialog
-            )
+            self._set_status(f"Profile '{self.selected_profile}' is already active")
             return
 
         # Call profile switch callback
@@ -307,11 +348,7 @@ class ProfileManagerDialog:
             self.current_profile = self.selected_profile
             self._refresh_profile_list()
 
-            messagebox.showinfo(
-                "Profile Loaded",
-                f"Switched to profile '{self.selected_profile}'",
-                parent=self.dialog
-            )
+            self._set_status(f"Switched to profile '{self.selected_profile}'")
 
     def _on_rename_profile(self):
         """Rename selected profile."""
@@ -344,7 +381,7 @@ class ProfileManagerDialog:
             return
 
         # Check if new name already exists
-        if self.config_manager.load_profile(new_name) is not None:
+        if self.config_manager.profile_exists(new_name):
             messagebox.showerror(
                 "Profile Exists",
                 f"Profile '{new_name}' already exists",
@@ -366,11 +403,7 @@ class ProfileManagerDialog:
                     if self.on_profile_switch:
                         self.on_profile_switch(new_name)
 
-                messagebox.showinfo(
-                    "Success",
-                    f"Profile renamed to '{new_name}'",
-                    parent=self.dialog
-                )
+                self._set_status(f"Profile renamed to '{new_name}'")
                 self._refresh_profile_list()
             else:
                 messagebox.showerror(
@@ -401,7 +434,7 @@ class ProfileManagerDialog:
             return
 
         # Check if new name already exists
-        if self.config_manager.load_profile(new_name) is not None:
+        if self.config_manager.profile_exists(new_name):
             messagebox.showerror(
                 "Profile Exists",
                 f"Profile '{new_name}' already exists",
@@ -415,11 +448,7 @@ class ProfileManagerDialog:
             config["profile_name"] = new_name
 
             if self.config_manager.save_profile(new_name, config):
-                messagebox.showinfo(
-                    "Success",
-                    f"Profile duplicated as '{new_name}'",
-                    parent=self.dialog
-                )
+                self._set_status(f"Profile duplicated as '{new_name}'")
                 self._refresh_profile_list()
             else:
                 messagebox.showerror(
@@ -460,11 +489,7 @@ class ProfileManagerDialog:
 
         if confirm:
             if self.config_manager.delete_profile(self.selected_profile):
-                messagebox.showinfo(
-                    "Success",
-                    f"Profile '{self.selected_profile}' deleted",
-                    parent=self.dialog
-                )
+                self._set_status(f"Profile '{self.selected_profile}' deleted")
                 self.selected_profile = None
                 self._refresh_profile_list()
             else:
@@ -484,19 +509,12 @@ class ProfileManagerDialog:
             title="Export Profile",
             defaultextension=".json",
             initialfile=f"{self.selected_profile}.json",
-            filetypes=[
-                ("JSON files", "*.json"),
-                ("All files", "*.*")
-            ]
+            filetypes=_PROFILE_FILETYPES
         )
 
         if filename:
             if self.config_manager.export_profile(self.selected_profile, filename):
-                messagebox.showinfo(
-                    "Success",
-                    f"Profile exported to:\n{filename}",
-                    parent=self.dialog
-                )
+                self._set_status(f"Profile exported to {os.path.basename(filename)}")
             else:
                 messagebox.showerror(
                     "Error",
@@ -505,21 +523,29 @@ class ProfileManagerDialog:
                 )
 
     def _on_import_profile(self):
-        """Import profile from file."""
-        filename = filedialog.askopenfilename(
+        """Import one or more profiles from files."""
+        filenames = filedialog.askopenfilenames(
             parent=self.dialog,
             title="Import Profile",
-            filetypes=[
-                ("JSON files", "*.json"),
-                ("All files", "*.*")
-            ]
+            filetypes=_PROFILE_FILETYPES
         )
 
-        if not filename:
+        if not filenames:
             return
 
+        if len(filenames) == 1:
+            self._import_single(filenames[0])
+        else:
+            self._import_many(filenames)
+
+    def _import_single(self, filename: str):
+        """
+        Import one profile, asking for its name.
+
+        Args:
+            filename: Path of the file to import
+        """
         # Ask for profile name
-        import os
         default_name = os.path.splitext(os.path.basename(filename))[0]
         default_name = sanitize_filename(default_name)
 
@@ -540,7 +566,7 @@ class ProfileManagerDialog:
             return
 
         # Check if profile already exists
-        if self.config_manager.load_profile(new_name) is not None:
+        if self.config_manager.profile_exists(new_name):
             overwrite = messagebox.askyesno(
                 "Profile Exists",
                 f"Profile '{new_name}' already exists.\nOverwrite?",
@@ -551,11 +577,7 @@ class ProfileManagerDialog:
 
         # Import
         if self.config_manager.import_profile(filename, new_name):
-            messagebox.showinfo(
-                "Success",
-                f"Profile imported as '{new_name}'",
-                parent=self.dialog
-            )
+            self._set_status(f"Profile imported as '{new_name}'")
             self._refresh_profile_list()
         else:
             messagebox.showerror(
@@ -564,16 +586,99 @@ class ProfileManagerDialog:
                 parent=self.dialog
             )
 
+    def _import_many(self, filenames: Sequence[str]):
+        """
+        Import several profiles, naming each after its file.
+
+        Files are read and saved on worker threads; the list is refreshed
+        once when all imports finish.
+
+        Args:
+            filenames: Paths of the files to import
+        """
+        imports: Dict[str, str] = {}  # profile name -> file path
+        # Windows file names are case-insensitive, so "PvP" and "pvp"
+        # would write the same file
+        seen: Set[str] = set()
+        skipped: List[str] = []
+        for filename in filenames:
+            name = sanitize_filename(os.path.splitext(os.path.basename(filename))[0])
+            is_valid, _ = validate_profile_name(name)
+            if not is_valid or name.casefold() in seen:
+                skipped.append(os.path.basename(filename))
+            else:
+                seen.add(name.casefold())
+                imports[name] = filename
+
+        existing = [name for name in imports if self.config_manager.profile_exists(name)]
+        if existing:
+            overwrite = messagebox.askyesno(
+                "Profiles Exist",
+                "These profiles already exist:\n"
+                f"{', '.join(existing)}\nOverwrite them?",
+                parent=self.dialog
+            )
+            if not overwrite:
+                for name in existing:
+                    skipped.append(os.path.basename(imports.pop(name)))
+
+        executor = ThreadPoolExecutor(max_workers=IMPORT_WORKERS)
+        futures = {
+            executor.submit(self.config_manager.import_profile, filename, name):
+                os.path.basename(filename)
+            for name, filename in imports.items()
+        }
+        executor.shutdown(wait=False)
+        self._poll_imports(futures, skipped)
+
+    def _poll_imports(self, futures: Dict[Future, str], skipped: List[str]):
+        """
+        Wait for background imports without blocking the event loop.
+
+        Args:
+            futures: Pending import futures mapped to file names
+            skipped: Files that were not imported
+        """
+        self._import_poll_job = None
+        if not all(future.done() for future in futures):
+            self._import_poll_job = self.dialog.after(
+                50, self._poll_imports, futures, skipped
+            )
+            return
+
+        failed = [
+            basename for future, basename in futures.items()
+            if future.exception() is not None or not future.result()
+        ]
+        imported = len(futures) - len(failed)
+        if imported:
+            self._refresh_profile_list()
+        self._set_status(f"Imported {imported} profile(s)")
+
+        if failed or skipped:
+            messagebox.showerror(
+                "Import Incomplete",
+                "Some files were not imported:\n" + "\n".join(failed + skipped),
+                parent=self.dialog
+            )
+
     def _center_on_parent(self):
         """Center dialog on parent window with screen bounds checking."""
-        self.dialog.update_idletasks()
-
         # Get parent position and size
         parent_x = self.parent.winfo_x()
         parent_y = self.parent.winfo_y()
         parent_width = self.parent.winfo_width()
         parent_height = self.parent.winfo_height()
 
+        # Reuse the last position if the parent hasn't moved or resized
+        key = (parent_x, parent_y, parent_width, parent_height)
+        cls = ProfileManagerDialog
+        if cls._last_geometry is not None and cls._last_parent_key == key:
+            self.dialog.geometry(cls._last_geometry)
+            return
+
+        self.dialog.update_idletasks()
+
         # Get dialog size
         dialog_width = self.dialog.winfo_width()
         dialog_height = self.dialog.winfo_height()
@@ -590,7 +695,9 @@ class ProfileManagerDialog:
         x = max(0, min(x, screen_width - dialog_width))
         y = max(0, min(y, screen_height - dialog_height))
 
-        self.dialog.geometry(f"+{x}+{y}")
+        cls._last_parent_key = key
+        cls._last_geometry = f"+{x}+{y}"
+        self.dialog.geometry(cls._last_geometry)
 
     def show(self):
         """Show the dialog and wait for it to close."""
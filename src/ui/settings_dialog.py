@@ -1,9 +1,52 @@
 """Settings dialog for global application preferences."""
 
+import re
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from tkinter import ttk
+from tkinter import font as tkfont
+from typing import Optional, Dict, Any, Tuple
 from src.ui.themes import Theme
+from src.config.defaults import DEFAULT_PROFILE
+
+# Parses winfo_geometry() results: WIDTHxHEIGHT+X+Y
+_GEOMETRY_RE = re.compile(r"(\d+)x(\d+)\+(-?\d+)\+(-?\d+)")
+
+# Visual alert settings not edited here (durations, flash_window) come from
+# the defaults; shared, so only ever copied
+_VISUAL_TEMPLATE = DEFAULT_PROFILE["global_settings"]["default_alert"]["visual"]
+
+# Widget fonts as (family, size, weight)
+_FONT_SPECS = {
+    "text": ("Segoe UI", 9, "normal"),
+    "header": ("Segoe UI", 10, "bold"),
+    "group": ("Segoe UI", 9, "bold"),
+}
+
+# File types offered when browsing for a sound file
+_SOUND_FILETYPES = (
+    ("Audio files", "*.wav *.mp3"),
+    ("WAV files", "*.wav"),
+    ("MP3 files", "*.mp3"),
+    ("All files", "*.*")
+)
+
+
+@lru_cache(maxsize=4)
+def _get_fonts(root: tk.Misc) -> Dict[str, tkfont.Font]:
+    """
+    Get the dialog's named fonts, created once per Tk root.
+
+    Args:
+        root: Tk root window the fonts belong to
+
+    Returns:
+        Dictionary mapping font role ('text', 'header', 'group') to Font
+    """
+    return {
+        role: tkfont.Font(root=root, family=family, size=size, weight=weight)
+        for role, (family, size, weight) in _FONT_SPECS.items()
+    }
 
 
 class SettingsDialog:
@@ -15,8 +58,44 @@ class SettingsDialog:
     - Always-on-top preference
     - Default alert configuration
     - Default timer settings
+
+    The dialog is hidden rather than destroyed when closed; use get() to
+    reuse it across opens.
     """
 
+    # Dialog reused by get()
+    _instance: Optional["SettingsDialog"] = None
+    # Screen (width, height), cached by _center_on_parent
+    _screen_size: Optional[Tuple[int, int]] = None
+
+    @classmethod
+    def get(cls, parent: tk.Tk, current_settings: Dict[str, Any],
+            theme: Theme) -> "SettingsDialog":
+        """
+        Get the shared settings dialog, loaded with the given settings.
+
+        A new dialog is built the first time, or when the parent or theme
+        has changed since the last one was built.
+
+        Args:
+            parent: Parent window
+            current_settings: Current global settings dictionary
+            theme: Current theme
+
+        Returns:
+            SettingsDialog ready to show()
+        """
+        dialog = cls._instance
+        if (dialog is not None and dialog.parent is parent
+                and dialog.theme is theme and dialog.dialog.winfo_exists()):
+            dialog._load_settings(current_settings)
+            return dialog
+
+        if dialog is not None and dialog.dialog.winfo_exists():
+            dialog.dialog.destroy()
+        cls._instance = cls(parent, current_settings, theme)
+        return cls._instance
+
     def __init__(self, parent: tk.Tk, current_settings: Dict[str, Any], theme: Theme):
         """
         Initialize settings dialog.
@@ -27,192 +106,212 @@ class SettingsDialog:
             theme: Current theme
         """
         self.parent = parent
-        self.current_settings = current_settings.copy()
         self.theme = theme
         self.result = None
+        self.volume_label: Optional[ttk.Label] = None  # Set when Alerts tab is built
 
-        # Create dialog window
+        # Create dialog window (hidden until show())
         self.dialog = tk.Toplevel(parent)
+        self.dialog.withdraw()
         self.dialog.title("Settings")
         self.dialog.configure(bg=theme.bg_color)
         self.dialog.resizable(False, False)
-
-        # Make modal
         self.dialog.transient(parent)
-        self.dialog.grab_set()
+        self.dialog.protocol("WM_DELETE_WINDOW", self._on_cancel)
+        self._done_var = tk.BooleanVar(self.dialog, value=False)
 
         # Build UI
+        self._create_variables()
+        self._load_settings(current_settings)
         self._build_ui()
 
-        # Center on parent
-        self._center_on_parent()
+    def _create_variables(self):
+        """Create setting variables up front so _on_ok works for unbuilt tabs."""
+        self.theme_var = tk.StringVar(self.dialog)
+        self.always_on_top_var = tk.BooleanVar(self.dialog)
+        self.flash_numbers_var = tk.BooleanVar(self.dialog)
+        self.flash_background_var = tk.BooleanVar(self.dialog)
+        self.flash_taskbar_var = tk.BooleanVar(self.dialog)
+        self.audio_enabled_var = tk.BooleanVar(self.dialog)
+        self.sound_file_var = tk.StringVar(self.dialog)
+        self.volume_var = tk.IntVar(self.dialog)
+
+    def _load_settings(self, current_settings: Dict[str, Any]):
+        """
+        Populate the setting variables and dependent widgets.
+
+        Args:
+            current_settings: Current global settings dictionary
+        """
+        self.current_settings = current_settings  # Read-only here
+        self.result = None
+
+        self.theme_var.set(self.current_settings.get("theme", "dark"))
+        self.always_on_top_var.set(self.current_settings.get("always_on_top", True))
+
+        default_alert = self.current_settings.get("default_alert", {})
+        visual = default_alert.get("visual", {})
+        audio = default_alert.get("audio", {})
+
+        self.flash_numbers_var.set(visual.get("flash_numbers", True))
+        self.flash_background_var.set(visual.get("flash_background", False))
+        self.flash_taskbar_var.set(visual.get("flash_taskbar", True))
+
+        self.audio_enabled_var.set(audio.get("enabled", False))
+        self.sound_file_var.set(audio.get("file", ""))
+        self.volume_var.set(audio.get("volume", 80))
+
+        if self.volume_label is not None:
+            self._toggle_audio_settings()
+            self._on_volume_change(str(self.volume_var.get()))
 
     def _build_ui(self):
         """Build the settings dialog UI."""
         # Main container
-        main_frame = tk.Frame(self.dialog, bg=self.theme.bg_color)
+        self._configure_styles()
+        main_frame = ttk.Frame(self.dialog, style="Settings.TFrame")
         main_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=15)
 
-        # Appearance Section
-        self._create_appearance_section(main_frame)
+        # One tab per section; a tab's widgets are built when first shown
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.pack(fill=tk.BOTH, expand=True)
+        self._tab_builders = []
+        self._built_tabs = set()
+        for title, builder in (
+            ("Appearance", self._create_appearance_section),
+            ("Alerts", self._create_default_alert_section),
+        ):
+            tab = ttk.Frame(self.notebook, style="Settings.TFrame")
+            self.notebook.add(tab, text=title)
+            self._tab_builders.append((builder, tab))
+
+        self._build_current_tab()
+        self.notebook.bind("<<NotebookTabChanged>>", self._build_current_tab)
 
-        # Separator
-        ttk.Separator(main_frame, orient='horizontal').pack(fill=tk.X, pady=10)
+        # Buttons
+        self._create_buttons(main_frame)
 
-        # Default Alert Section
-        self._create_default_alert_section(main_frame)
+    def _configure_styles(self):
+        """Configure the ttk styles shared by the dialog's frames, labels and checkbuttons."""
+        t = self.theme
+        fonts = _get_fonts(self.parent)
+        style = ttk.Style(self.dialog)
+        style.configure("Settings.TFrame", background=t.bg_color)
+        style.configure(
+            "Settings.TLabel",
+            background=t.bg_color, foreground=t.fg_color, font=fonts["text"]
+        )
+        style.configure("Header.Settings.TLabel", font=fonts["header"])
+        style.configure("Group.Settings.TLabel", font=fonts["group"])
+        style.configure(
+            "Settings.TCheckbutton",
+            background=t.bg_color, foreground=t.fg_color, font=fonts["text"]
+        )
+        style.map(
+            "Settings.TCheckbutton",
+            background=[("active", t.bg_color)],
+            foreground=[("active", t.fg_color)]
+        )
 
-        # Separator
-        ttk.Separator(main_frame, orient='horizontal').pack(fill=tk.X, pady=10)
+    def _build_current_tab(self, event=None):
+        """Build the selected notebook tab's widgets if not already built."""
+        index = self.notebook.index("current")
+        if index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        builder, tab = self._tab_builders[index]
+        builder(tab)
 
-        # Buttons
-        self._create_buttons(main_frame)
+    def _create_group(self, parent, title: str, label_style: str) -> ttk.Frame:
+        """
+        Create a plain frame with a text header, used in place of LabelFrame.
+
+        Args:
+            parent: Parent widget
+            title: Header text
+            label_style: ttk style for the header label
+
+        Returns:
+            Frame to pack the group's widgets into
+        """
+        group = ttk.Frame(parent, style="Settings.TFrame")
+        ttk.Label(group, text=title, style=label_style).pack(anchor=tk.W)
+        return group
 
     def _create_appearance_section(self, parent):
         """Create appearance settings section."""
-        section = tk.LabelFrame(
-            parent,
-            text="Appearance",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            font=("Segoe UI", 10, "bold")
-        )
+        section = self._create_group(parent, "Appearance", "Header.Settings.TLabel")
         section.pack(fill=tk.X, pady=5)
 
         # Theme selection
-        theme_frame = tk.Frame(section, bg=self.theme.bg_color)
+        theme_frame = ttk.Frame(section, style="Settings.TFrame")
         theme_frame.pack(fill=tk.X, padx=10, pady=5)
 
-        tk.Label(
+        ttk.Label(
             theme_frame,
             text="Theme:",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            font=("Segoe UI", 9)
+            style="Settings.TLabel"
         ).pack(side=tk.LEFT, padx=5)
 
-        self.theme_var = tk.StringVar(value=self.current_settings.get("theme", "dark"))
         theme_combo = ttk.Combobox(
             theme_frame,
             textvariable=self.theme_var,
-            values=["dark", "light", "high_contrast"],
+            values=Theme.available(),
             state="readonly",
             width=15
         )
         theme_combo.pack(side=tk.LEFT, padx=5)
 
         # Always on top
-        self.always_on_top_var = tk.BooleanVar(
-            value=self.current_settings.get("always_on_top", True)
-        )
-        always_on_top_check = tk.Checkbutton(
+        always_on_top_check = ttk.Checkbutton(
             section,
             text="Always on top",
             variable=self.always_on_top_var,
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            selectcolor=self.theme.bg_color,
-            activebackground=self.theme.bg_color,
-            activeforeground=self.theme.fg_color,
-            font=("Segoe UI", 9)
+            style="Settings.TCheckbutton"
         )
         always_on_top_check.pack(anchor=tk.W, padx=10, pady=5)
 
     def _create_default_alert_section(self, parent):
         """Create default alert settings section."""
-        section = tk.LabelFrame(
-            parent,
-            text="Default Alert Settings",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            font=("Segoe UI", 10, "bold")
-        )
+        section = self._create_group(parent, "Default Alert Settings", "Header.Settings.TLabel")
         section.pack(fill=tk.X, pady=5)
 
-        default_alert = self.current_settings.get("default_alert", {})
-        visual = default_alert.get("visual", {})
-        audio = default_alert.get("audio", {})
-
         # Visual alerts
-        visual_frame = tk.LabelFrame(
-            section,
-            text="Visual Alerts",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            font=("Segoe UI", 9)
-        )
+        visual_frame = self._create_group(section, "Visual Alerts", "Group.Settings.TLabel")
         visual_frame.pack(fill=tk.X, padx=10, pady=5)
 
-        self.flash_numbers_var = tk.BooleanVar(value=visual.get("flash_numbers", True))
-        self.flash_background_var = tk.BooleanVar(value=visual.get("flash_background", False))
-        self.flash_taskbar_var = tk.BooleanVar(value=visual.get("flash_taskbar", True))
-
-        tk.Checkbutton(
-            visual_frame,
-            text="Flash numbers",
-            variable=self.flash_numbers_var,
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            selectcolor=self.theme.bg_color,
-            font=("Segoe UI", 9)
-        ).pack(anchor=tk.W, padx=5, pady=2)
-
-        tk.Checkbutton(
-            visual_frame,
-            text="Flash background",
-            variable=self.flash_background_var,
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            selectcolor=self.theme.bg_color,
-            font=("Segoe UI", 9)
-        ).pack(anchor=tk.W, padx=5, pady=2)
-
-        tk.Checkbutton(
-            visual_frame,
-            text="Flash taskbar",
-            variable=self.flash_taskbar_var,
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            selectcolor=self.theme.bg_color,
-            font=("Segoe UI", 9)
-        ).pack(anchor=tk.W, padx=5, pady=2)
+        for text, var in (
+            ("Flash numbers", self.flash_numbers_var),
+            ("Flash background", self.flash_background_var),
+            ("Flash taskbar", self.flash_taskbar_var),
+        ):
+            ttk.Checkbutton(
+                visual_frame, text=text, variable=var, style="Settings.TCheckbutton"
+            ).pack(anchor=tk.W, padx=5, pady=2)
 
         # Audio alert
-        audio_frame = tk.LabelFrame(
-            section,
-            text="Audio Alert",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            font=("Segoe UI", 9)
-        )
+        audio_frame = self._create_group(section, "Audio Alert", "Group.Settings.TLabel")
         audio_frame.pack(fill=tk.X, padx=10, pady=5)
 
-        self.audio_enabled_var = tk.BooleanVar(value=audio.get("enabled", False))
-        audio_check = tk.Checkbutton(
+        audio_check = ttk.Checkbutton(
             audio_frame,
             text="Enable sound",
             variable=self.audio_enabled_var,
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            selectcolor=self.theme.bg_color,
-            font=("Segoe UI", 9),
-            command=self._toggle_audio_settings
+            command=self._toggle_audio_settings,
+            style="Settings.TCheckbutton"
         )
         audio_check.pack(anchor=tk.W, padx=5, pady=2)
 
         # Sound file selection
-        sound_frame = tk.Frame(audio_frame, bg=self.theme.bg_color)
+        sound_frame = ttk.Frame(audio_frame, style="Settings.TFrame")
         sound_frame.pack(fill=tk.X, padx=5, pady=2)
 
-        tk.Label(
+        ttk.Label(
             sound_frame,
             text="Sound file:",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            font=("Segoe UI", 9)
+            style="Settings.TLabel"
         ).pack(side=tk.LEFT, padx=5)
 
-        self.sound_file_var = tk.StringVar(value=audio.get("file", ""))
         self.sound_file_entry = tk.Entry(
             sound_frame,
             textvariable=self.sound_file_var,
@@ -225,30 +324,28 @@ class SettingsDialog:
             sound_frame,
             text="Browse...",
             command=self._browse_sound_file,
-            state="disabled" if not self.audio_enabled_var.get() else "normal"
+            state="disabled" if not self.audio_enabled_var.get() else "normal",
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(self.browse_button, "button")
         self.browse_button.pack(side=tk.LEFT, padx=5)
 
         # Volume
-        volume_frame = tk.Frame(audio_frame, bg=self.theme.bg_color)
+        volume_frame = ttk.Frame(audio_frame, style="Settings.TFrame")
         volume_frame.pack(fill=tk.X, padx=5, pady=2)
 
-        tk.Label(
+        ttk.Label(
             volume_frame,
             text="Volume:",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            font=("Segoe UI", 9)
+            style="Settings.TLabel"
         ).pack(side=tk.LEFT, padx=5)
 
-        self.volume_var = tk.IntVar(value=audio.get("volume", 80))
         self.volume_slider = tk.Scale(
             volume_frame,
             from_=0,
             to=100,
             orient=tk.HORIZONTAL,
             variable=self.volume_var,
+            command=self._on_volume_change,
             bg=self.theme.bg_color,
             fg=self.theme.fg_color,
             highlightthickness=0,
@@ -256,20 +353,22 @@ class SettingsDialog:
         )
         self.volume_slider.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
 
-        self.volume_label = tk.Label(
+        self.volume_label = ttk.Label(
             volume_frame,
             text=f"{self.volume_var.get()}%",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            font=("Segoe UI", 9),
-            width=5
+            width=5,
+            style="Settings.TLabel"
         )
         self.volume_label.pack(side=tk.LEFT, padx=5)
 
-        # Update volume label when slider changes
-        self.volume_var.trace_add("write", lambda *args: self.volume_label.config(
-            text=f"{self.volume_var.get()}%"
-        ))
+    def _on_volume_change(self, value: str):
+        """
+        Update the volume label while the slider moves.
+
+        Args:
+            value: New slider value from tk.Scale
+        """
+        self.volume_label.config(text=f"{int(float(value))}%")
 
     def _toggle_audio_settings(self):
         """Enable/disable audio settings based on checkbox."""
@@ -282,15 +381,13 @@ class SettingsDialog:
 
     def _browse_sound_file(self):
         """Open file browser for sound file selection."""
+        # Imported here; only needed when browsing
+        from tkinter import filedialog
+
         filename = filedialog.askopenfilename(
             parent=self.dialog,
             title="Select sound file",
-            filetypes=[
-                ("Audio files", "*.wav *.mp3"),
-                ("WAV files", "*.wav"),
-                ("MP3 files", "*.mp3"),
-                ("All files", "*.*")
-            ]
+            filetypes=_SOUND_FILETYPES
         )
 
         if filename:
@@ -298,7 +395,7 @@ class SettingsDialog:
 
     def _create_buttons(self, parent):
         """Create dialog buttons."""
-        button_frame = tk.Frame(parent, bg=self.theme.bg_color)
+        button_frame = ttk.Frame(parent, style="Settings.TFrame")
         button_frame.pack(fill=tk.X, pady=10)
 
         # Cancel button
@@ -306,9 +403,9 @@ class SettingsDialog:
             button_frame,
             text="Cancel",
             command=self._on_cancel,
-            width=10
+            width=10,
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(cancel_btn, "button")
         cancel_btn.pack(side=tk.RIGHT, padx=5)
 
         # OK button
@@ -316,9 +413,9 @@ class SettingsDialog:
             button_frame,
             text="OK",
             command=self._on_ok,
-            width=10
+            width=10,
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(ok_btn, "button")
         ok_btn.pack(side=tk.RIGHT, padx=5)
 
     def _on_ok(self):
@@ -328,13 +425,12 @@ class SettingsDialog:
             "theme": self.theme_var.get(),
             "always_on_top": self.always_on_top_var.get(),
             "default_alert": {
-                "visual": {
-                    "flash_numbers": self.flash_numbers_var.get(),
-                    "flash_background": self.flash_background_var.get(),
-                    "flash_taskbar": self.flash_taskbar_var.get(),
-                    "flash_duration_ms": 3000,
-                    "flash_interval_ms": 500
-                },
+                "visual": dict(
+                    _VISUAL_TEMPLATE,
+                    flash_numbers=self.flash_numbers_var.get(),
+                    flash_background=self.flash_background_var.get(),
+                    flash_taskbar=self.flash_taskbar_var.get()
+                ),
                 "audio": {
                     "enabled": self.audio_enabled_var.get(),
                     "file": self.sound_file_var.get(),
@@ -343,34 +439,43 @@ class SettingsDialog:
             }
         }
 
-        self.dialog.destroy()
+        self._done_var.set(True)
 
     def _on_cancel(self):
         """Handle Cancel button click."""
         self.result = None
-        self.dialog.destroy()
+        self._done_var.set(True)
 
     def _center_on_parent(self):
-        """Center dialog on parent window with screen bounds checking."""
+        """
+        Center dialog on parent window with screen bounds checking.
+
+        Called while the dialog is withdrawn, so it maps once at its final
+        position.
+        """
         self.dialog.update_idletasks()
 
-        # Get parent position and size
-        parent_x = self.parent.winfo_x()
-        parent_y = self.parent.winfo_y()
-        parent_width = self.parent.winfo_width()
-        parent_height = self.parent.winfo_height()
+        # Get parent position and size from one geometry query
+        match = _GEOMETRY_RE.match(self.parent.winfo_geometry())
+        if not match:
+            return
+        parent_width, parent_height, parent_x, parent_y = map(int, match.groups())
 
-        # Get dialog size
-        dialog_width = self.dialog.winfo_width()
-        dialog_height = self.dialog.winfo_height()
+        # Get dialog size (requested size, since it isn't mapped yet)
+        dialog_width = self.dialog.winfo_reqwidth()
+        dialog_height = self.dialog.winfo_reqheight()
 
         # Calculate center position
         x = parent_x + (parent_width - dialog_width) // 2
         y = parent_y + (parent_height - dialog_height) // 2
 
-        # Get screen dimensions
-        screen_width = self.dialog.winfo_screenwidth()
-        screen_height = self.dialog.winfo_screenheight()
+        # Get screen dimensions (read once per process)
+        cls = SettingsDialog
+        if cls._screen_size is None:
+            cls._screen_size = (
+                self.dialog.winfo_screenwidth(), self.dialog.winfo_screenheight()
+            )
+        screen_width, screen_height = cls._screen_size
 
         # Clamp to screen bounds
         x = max(0, min(x, screen_width - dialog_width))
@@ -385,5 +490,13 @@ class SettingsDialog:
         Returns:
             Updated settings dictionary if OK clicked, None if cancelled
         """
-        self.dialog.wait_window()
+        self._done_var.set(False)
+        self._center_on_parent()
+        self.dialog.deiconify()
+        self.dialog.grab_set()
+
+        self.dialog.wait_variable(self._done_var)
+
+        self.dialog.grab_release()
+        self.dialog.withdraw()
         return self.result
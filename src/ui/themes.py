@@ -1,8 +1,11 @@
 """Theme definitions and management for UI styling."""
 
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Tuple
 from src.config.defaults import THEMES, DARK_THEME, LIGHT_THEME
 
+_THEME_NAMES = tuple(THEMES)
+
 
 class Theme:
     """
@@ -20,62 +23,93 @@ class Theme:
         """
         self.name = theme_name
         self._colors = THEMES.get(theme_name, DARK_THEME)
+        self._refresh()
+
+    @staticmethod
+    def available() -> Tuple[str, ...]:
+        """
+        Get the names of all built-in themes.
 
-    @property
-    def bg_color(self) -> str:
-        """Background color."""
-        return self._colors["bg_color"]
-
-    @property
-    def fg_color(self) -> str:
-        """Foreground (text) color."""
-        return self._colors["fg_color"]
-
-    @property
-    def button_bg(self) -> str:
-        """Button background color."""
-        return self._colors["button_bg"]
-
-    @property
-    def button_fg(self) -> str:
-        """Button foreground color."""
-        return self._colors["button_fg"]
-
-    @property
-    def button_active_bg(self) -> str:
-        """Active button background color."""
-        return self._colors["button_active_bg"]
-
-    @property
-    def entry_bg(self) -> str:
-        """Entry field background color."""
-        return self._colors["entry_bg"]
-
-    @property
-    def entry_fg(self) -> str:
-        """Entry field foreground color."""
-        return self._colors["entry_fg"]
-
-    @property
-    def alert_flash_color(self) -> str:
-        """Alert flash color (for visual alerts)."""
-        return self._colors["alert_flash_color"]
-
-    @property
-    def alert_normal_color(self) -> str:
-        """Normal color when not alerting."""
-        return self._colors["alert_normal_color"]
-
-    def switch_theme(self, theme_name: str):
+        Returns:
+            Theme names in definition order
+        """
+        return _THEME_NAMES
+
+    def _refresh(self):
+        """Copy the current theme's colors onto plain attributes."""
+        c = self._colors
+        self.bg_color = c.bg_color
+        self.fg_color = c.fg_color
+        self.button_bg = c.button_bg
+        self.button_fg = c.button_fg
+        self.button_active_bg = c.button_active_bg
+        self.entry_bg = c.entry_bg
+        self.entry_fg = c.entry_fg
+        self.alert_flash_color = c.alert_flash_color
+        self.alert_normal_color = c.alert_normal_color
+
+        # Constructor/configure options per widget type
+        self._styles: Dict[str, Dict[str, str]] = {
+            "frame": {"bg": c.bg_color},
+            "button": {
+                "bg": c.button_bg,
+                "fg": c.button_fg,
+                "activebackground": c.button_active_bg
+            },
+            "entry": {
+                "bg": c.entry_bg,
+                "fg": c.entry_fg,
+                "insertbackground": c.entry_fg
+            },
+            "label": {"bg": c.bg_color, "fg": c.fg_color},
+        }
+
+    def switch_theme(self, theme_name: str) -> "Theme":
         """
-        Switch to a different theme.
+        Get the theme to switch to.
+
+        Themes are shared through get_theme(), so this returns the other
+        theme instead of changing this one.
 
         Args:
             theme_name: Name of theme to switch to
+
+        Returns:
+            The named theme, or this theme if unchanged or unknown
+        """
+        if theme_name == self.name or theme_name not in THEMES:
+            return self
+        return get_theme(theme_name)
+
+    def apply_option_defaults(self, widget):
+        """
+        Register theme colors as Tk option database defaults.
+
+        Frames, labels and canvases created afterwards pick up the theme
+        colors without per-widget bg/fg options.
+
+        Args:
+            widget: Any tkinter widget (the option database is per interpreter)
+        """
+        widget.option_add("*Frame.background", self.bg_color)
+        widget.option_add("*Label.background", self.bg_color)
+        widget.option_add("*Label.foreground", self.fg_color)
+        widget.option_add("*Canvas.background", self.bg_color)
+
+    def widget_style(self, widget_type: str = "frame") -> Dict[str, str]:
+        """
+        Get the theme color options for a widget type.
+
+        The result can be passed straight to a widget constructor, e.g.
+        ``tk.Button(parent, text="OK", **theme.widget_style("button"))``.
+
+        Args:
+            widget_type: Type of widget ('frame', 'button', 'entry', 'label')
+
+        Returns:
+            Dictionary of tkinter configuration options (shared; do not mutate)
         """
-        if theme_name in THEMES:
-            self.name = theme_name
-            self._colors = THEMES[theme_name]
+        return self._styles[widget_type]
 
     def apply_to_widget(self, widget, widget_type: str = "frame"):
         """
@@ -85,26 +119,18 @@ class Theme:
             widget: Tkinter widget
             widget_type: Type of widget ('frame', 'button', 'entry', 'label')
         """
-        try:
-            if widget_type == "frame":
-                widget.configure(bg=self.bg_color)
-            elif widget_type == "button":
-                widget.configure(
-                    bg=self.button_bg,
-                    fg=self.button_fg,
-                    activebackground=self.button_active_bg
-                )
-            elif widget_type == "entry":
-                widget.configure(
-                    bg=self.entry_bg,
-                    fg=self.entry_fg,
-                    insertbackground=self.entry_fg
-                )
-            elif widget_type == "label":
-                widget.configure(
-                    bg=self.bg_color,
-                    fg=self.fg_color
-                )
-        except Exception as e:
-            # Some widgets may not support all config options
-            print(f"Warning: Could not apply theme to {widget_type}: {e}")
+        widget.configure(**self._styles[widget_type])
+
+
+@lru_cache(maxsize=8)
+def get_theme(theme_name: str = "dark") -> Theme:
+    """
+    Get the shared Theme instance for a theme name.
+
+    Args:
+        theme_name: Name of theme
+
+    Returns:
+        Theme instance (the same object for repeated calls)
+    """
+    return Theme(theme_name)
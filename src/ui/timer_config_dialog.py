@@ -1,9 +1,125 @@
 """Timer configuration dialog for per-timer settings."""
 
+import os
+import re
+import sys
 import tkinter as tk
 from tkinter import messagebox
+from types import MappingProxyType
+from typing import Optional, Tuple
 from src.core.timer import Timer
 
+# Parses winfo_geometry() results: WIDTHxHEIGHT+X+Y
+_GEOMETRY_RE = re.compile(r"(\d+)x(\d+)\+(-?\d+)\+(-?\d+)")
+
+# Alert settings used where a timer's alert config leaves them out
+_VISUAL_DEFAULTS = MappingProxyType({
+    'flash_numbers': True,
+    'flash_background': True,
+    'flash_taskbar': True
+})
+_AUDIO_DEFAULTS = MappingProxyType({
+    'enabled': False,
+    'volume': 80,
+    'file': ''
+})
+
+# Tk reports Windows virtual key codes as event.keycode
+_KEYCODE_IS_VK = sys.platform == 'win32'
+
+# Map of virtual key codes to readable names (physical keys)
+_VK_TO_CHAR = {
+    # Number row
+    48: '0', 49: '1', 50: '2', 51: '3', 52: '4',
+    53: '5', 54: '6', 55: '7', 56: '8', 57: '9',
+    # Letter keys (A-Z)
+    65: 'a', 66: 'b', 67: 'c', 68: 'd', 69: 'e', 70: 'f',
+    71: 'g', 72: 'h', 73: 'i', 74: 'j', 75: 'k', 76: 'l',
+    77: 'm', 78: 'n', 79: 'o', 80: 'p', 81: 'q', 82: 'r',
+    83: 's', 84: 't', 85: 'u', 86: 'v', 87: 'w', 88: 'x',
+    89: 'y', 90: 'z',
+    # Function keys (F1-F24)
+    112: 'f1', 113: 'f2', 114: 'f3', 115: 'f4',
+    116: 'f5', 117: 'f6', 118: 'f7', 119: 'f8',
+    120: 'f9', 121: 'f10', 122: 'f11', 123: 'f12',
+    124: 'f13', 125: 'f14', 126: 'f15', 127: 'f16',
+    128: 'f17', 129: 'f18', 130: 'f19', 131: 'f20',
+    132: 'f21', 133: 'f22', 134: 'f23', 135: 'f24',
+    # Navigation keys
+    33: 'page_up', 34: 'page_down',
+    35: 'end', 36: 'home',
+    45: 'insert', 46: 'delete',
+    # Arrow keys
+    37: 'left', 38: 'up', 39: 'right', 40: 'down',
+    # Numpad
+    96: 'num0', 97: 'num1', 98: 'num2', 99: 'num3',
+    100: 'num4', 101: 'num5', 102: 'num6', 103: 'num7',
+    104: 'num8', 105: 'num9',
+    106: 'num_multiply', 107: 'num_add', 109: 'num_subtract',
+    110: 'num_decimal', 111: 'num_divide',
+    # Special keys
+    144: 'num_lock', 145: 'scroll_lock',
+    19: 'pause', 44: 'print_screen',
+    # Punctuation (VK_OEM_* codes, US layout)
+    186: ';', 187: '=', 188: ',', 189: '-', 190: '.', 191: '/', 192: '`',
+    219: '[', 220: '\\', 221: ']', 222: "'"
+}
+
+# Tk keysyms of modifier keys -> hotkey modifier names
+_TK_MODIFIERS = {
+    'Control_L': 'ctrl', 'Control_R': 'ctrl',
+    'Shift_L': 'shift', 'Shift_R': 'shift',
+    'Alt_L': 'alt', 'Alt_R': 'alt',
+}
+
+# Modifier names in hotkey-string order
+_MODIFIER_ORDER = ('ctrl', 'shift', 'alt')
+
+# Tk keysyms whose hotkey names differ from the lowercased keysym
+_TK_KEYSYMS = {
+    'Prior': 'page_up', 'Next': 'page_down',
+    'Return': 'enter', 'Escape': 'esc',
+    'Print': 'print_screen',
+    'KP_Multiply': 'num_multiply', 'KP_Add': 'num_add',
+    'KP_Subtract': 'num_subtract', 'KP_Decimal': 'num_decimal',
+    'KP_Divide': 'num_divide',
+}
+_TK_KEYSYMS.update({f'KP_{n}': f'num{n}' for n in range(10)})
+# Punctuation keysyms -> the character on the unshifted key (US layout),
+# so Shift+- reads as "-" like it does from the Windows key code
+_TK_KEYSYMS.update({
+    'semicolon': ';', 'colon': ';',
+    'equal': '=', 'plus': '=',
+    'comma': ',', 'less': ',',
+    'minus': '-', 'underscore': '-',
+    'period': '.', 'greater': '.',
+    'slash': '/', 'question': '/',
+    'grave': '`', 'asciitilde': '`',
+    'bracketleft': '[', 'braceleft': '[',
+    'backslash': '\\', 'bar': '\\',
+    'bracketright': ']', 'braceright': ']',
+    'apostrophe': "'", 'quotedbl': "'",
+})
+
+# Dialog form, one grid row per entry: (kind, text, name)
+#   field:  text label beside the widget returned by builder method `name`
+#   header: bold section title
+#   check:  checkbutton bound to the variable attribute `name`
+#   wide:   widget from builder method `name` spanning both columns
+_FORM_SPEC = (
+    ('field', "Timer Label:", '_build_label_entry'),
+    ('field', "Duration (MM:SS):", '_build_duration'),
+    ('field', "Hotkey:", '_build_hotkey'),
+    ('header', "Visual Alerts:", None),
+    ('check', "Flash timer numbers", 'flash_numbers_var'),
+    ('check', "Flash timer background", 'flash_background_var'),
+    ('check', "Flash taskbar", 'flash_taskbar_var'),
+    ('header', "Audio Alert:", None),
+    ('check', "Enable sound", 'audio_enabled_var'),
+    ('wide', None, '_build_volume'),
+    ('wide', None, '_build_sound'),
+)
+
 
 class TimerConfigDialog(tk.Toplevel):
     """
@@ -17,10 +133,16 @@ class TimerConfigDialog(tk.Toplevel):
     - Font settings (placeholder for Phase 5)
     """
 
+    # Screen (width, height), cached by _center_on_parent
+    _screen_size: Optional[Tuple[int, int]] = None
+
     def __init__(self, parent, timer: Timer, theme, hotkey_manager=None):
         """
         Initialize timer config dialog.
 
+        The dialog starts withdrawn; call show() to display it. The same
+        instance can be reused for other timers via _populate_from_timer().
+
         Args:
             parent: Parent window
             timer: Timer to configure
@@ -28,36 +150,92 @@ class TimerConfigDialog(tk.Toplevel):
             hotkey_manager: HotkeyManager for validation (optional)
         """
         super().__init__(parent)
+        self.withdraw()
 
-        self.timer = timer
+        self.parent = parent
         self.theme = theme
         self.hotkey_manager = hotkey_manager
         self.result = None  # Will be set to timer config dict if OK clicked
 
         # Window setup
-        self.title(f"Configure Timer: {timer.label}")
         self.configure(bg=theme.bg_color)
         self.resizable(False, False)
-
-        # Make modal
         self.transient(parent)
-        self.grab_set()
+        self.protocol("WM_DELETE_WINDOW", self._on_cancel)
+
+        # Set by OK/Cancel to end the wait in show()
+        self._done_var = tk.BooleanVar(self, value=False)
+
+        # Create UI once, then fill it in for this timer
+        self._build_once()
+        self._populate_from_timer(timer)
 
-        # Create UI
-        self._create_widgets()
+    def _populate_from_timer(self, timer: Timer):
+        """
+        Load a timer's settings into the existing widgets.
+
+        Args:
+            timer: Timer to configure
+        """
+        self.timer = timer
+        self.result = None
+        self.title(f"Configure Timer: {timer.label}")
 
-        # Center on parent with screen bounds checking
+        self.label_entry.delete(0, tk.END)
+        self.label_entry.insert(0, timer.label)
+
+        # Convert duration to MM:SS
+        minutes = int(timer.duration) // 60
+        seconds = int(timer.duration) % 60
+
+        self.minutes_entry.delete(0, tk.END)
+        self.minutes_entry.insert(0, str(minutes))
+        self.seconds_entry.delete(0, tk.END)
+        self.seconds_entry.insert(0, str(seconds))
+
+        self.hotkey_var.set(timer.hotkey or "None")
+        self.capturing_hotkey = False
+        self.captured_keys = set()
+
+        alert_config = timer.alert_config or {}
+        visual = {**_VISUAL_DEFAULTS, **alert_config.get('visual', {})}
+        self.flash_numbers_var.set(visual['flash_numbers'])
+        self.flash_background_var.set(visual['flash_background'])
+        self.flash_taskbar_var.set(visual['flash_taskbar'])
+
+        audio = {**_AUDIO_DEFAULTS, **alert_config.get('audio', {})}
+        self.audio_enabled_var.set(audio['enabled'])
+        self.audio_volume_var.set(audio['volume'])
+        self.audio_file_var.set(audio['file'])
+
+        # Extract just the filename for display (default sound if empty)
+        current_sound = audio['file']
+        sound_filename = os.path.basename(current_sound) if current_sound else 'beepbeep.wav'
+        self.sound_label.configure(text=f"Sound: {sound_filename}")
+
+    def _center_on_parent(self):
+        """Center dialog on parent window with screen bounds checking."""
         self.update_idletasks()
 
+        # Get parent position and size from one geometry query
+        match = _GEOMETRY_RE.match(self.parent.winfo_geometry())
+        if not match:
+            return
+        parent_width, parent_height, parent_x, parent_y = map(int, match.groups())
+
+        # Requested size is valid while the dialog is still withdrawn
+        dialog_width = self.winfo_reqwidth()
+        dialog_height = self.winfo_reqheight()
+
         # Calculate centered position
-        x = parent.winfo_x() + (parent.winfo_width() // 2) - (self.winfo_width() // 2)
-        y = parent.winfo_y() + (parent.winfo_height() // 2) - (self.winfo_height() // 2)
+        x = parent_x + (parent_width - dialog_width) // 2
+        y = parent_y + (parent_height - dialog_height) // 2
 
-        # Get screen dimensions
-        screen_width = self.winfo_screenwidth()
-        screen_height = self.winfo_screenheight()
-        dialog_width = self.winfo_width()
-        dialog_height = self.winfo_height()
+        # Get screen dimensions (read once per process)
+        cls = TimerConfigDialog
+        if cls._screen_size is None:
+            cls._screen_size = (self.winfo_screenwidth(), self.winfo_screenheight())
+        screen_width, screen_height = cls._screen_size
 
         # Clamp X position (keep within screen bounds)
         x = max(0, min(x, screen_width - dialog_width))
@@ -70,66 +248,104 @@ class TimerConfigDialog(tk.Toplevel):
 
         self.geometry(f"+{x}+{y}")
 
-    def _create_widgets(self):
-        """Create all dialog widgets."""
+    def _build_once(self):
+        """Create all dialog widgets. Values are filled in by _populate_from_timer."""
+        self.hotkey_var = tk.StringVar(self, value="None")
+        self.flash_numbers_var = tk.BooleanVar(self)
+        self.flash_background_var = tk.BooleanVar(self)
+        self.flash_taskbar_var = tk.BooleanVar(self)
+        self.audio_enabled_var = tk.BooleanVar(self)
+        self.audio_volume_var = tk.IntVar(self)
+        self.audio_file_var = tk.StringVar(self)
+
+        # Hotkey capture state
+        self.capturing_hotkey = False
+        self.captured_keys = set()
+
         # Main frame
-        main_frame = tk.Frame(self, bg=self.theme.bg_color, padx=20, pady=20)
+        main_frame = tk.Frame(self, padx=20, pady=20)
         main_frame.pack(fill=tk.BOTH, expand=True)
 
-        # Label
-        tk.Label(
-            main_frame,
-            text="Timer Label:",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color
-        ).grid(row=0, column=0, sticky='w', pady=5)
-
-        self.label_entry = tk.Entry(main_frame, width=30)
-        self.label_entry.insert(0, self.timer.label)
-        self.theme.apply_to_widget(self.label_entry, "entry")
-        self.label_entry.grid(row=0, column=1, pady=5)
-
-        # Duration
-        tk.Label(
-            main_frame,
-            text="Duration (MM:SS):",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color
-        ).grid(row=1, column=0, sticky='w', pady=5)
+        self._build_form(main_frame, _FORM_SPEC)
 
-        duration_frame = tk.Frame(main_frame, bg=self.theme.bg_color)
-        duration_frame.grid(row=1, column=1, sticky='w', pady=5)
+        # Buttons
+        button_frame = tk.Frame(main_frame)
+        button_frame.grid(row=len(_FORM_SPEC), column=0, columnspan=2, pady=(20, 0))
 
-        self.minutes_entry = tk.Entry(duration_frame, width=5)
-        self.seconds_entry = tk.Entry(duration_frame, width=5)
+        button_style = self.theme.widget_style("button")
+        ok_button = tk.Button(button_frame, text="OK", width=10, command=self._on_ok, **button_style)
+        cancel_button = tk.Button(button_frame, text="Cancel", width=10, command=self._on_cancel,
+                                  **button_style)
 
-        # Convert duration to MM:SS
-        minutes = int(self.timer.duration) // 60
-        seconds = int(self.timer.duration) % 60
+        ok_button.pack(side=tk.LEFT, padx=5)
+        cancel_button.pack(side=tk.LEFT, padx=5)
 
-        self.minutes_entry.insert(0, str(minutes))
-        self.seconds_entry.insert(0, str(seconds))
+    def _build_form(self, parent, spec):
+        """
+        Create and grid one form row per spec entry.
+
+        Args:
+            parent: Frame to grid the rows into
+            spec: Sequence of (kind, text, name) rows, see _FORM_SPEC
+        """
+        check_options = {
+            'bg': self.theme.bg_color,
+            'fg': self.theme.fg_color,
+            'selectcolor': self.theme.button_bg
+        }
 
-        self.theme.apply_to_widget(self.minutes_entry, "entry")
-        self.theme.apply_to_widget(self.seconds_entry, "entry")
+        for row, (kind, text, name) in enumerate(spec):
+            if kind == 'field':
+                tk.Label(parent, text=text).grid(row=row, column=0, sticky='w', pady=5)
+                getattr(self, name)(parent).grid(row=row, column=1, sticky='w', pady=5)
+            elif kind == 'header':
+                tk.Label(
+                    parent,
+                    text=text,
+                    font=('Arial', 10, 'bold')
+                ).grid(row=row, column=0, columnspan=2, sticky='w', pady=(15, 5))
+            elif kind == 'check':
+                tk.Checkbutton(
+                    parent,
+                    text=text,
+                    variable=getattr(self, name),
+                    **check_options
+                ).grid(row=row, column=0, columnspan=2, sticky='w')
+            else:  # 'wide'
+                getattr(self, name)(parent).grid(
+                    row=row, column=0, columnspan=2, sticky='ew', pady=5
+                )
+
+    def _build_label_entry(self, parent):
+        """Create the timer label entry."""
+        self.label_entry = tk.Entry(parent, width=30, **self.theme.widget_style("entry"))
+        return self.label_entry
+
+    def _build_duration(self, parent):
+        """Create the minutes/seconds entries."""
+        duration_frame = tk.Frame(parent)
+
+        # Reject non-digit edits as they are typed
+        entry_style = self.theme.widget_style("entry")
+        self.minutes_entry = tk.Entry(
+            duration_frame, width=5, validate='key',
+            validatecommand=(self.register(_is_minutes_text), '%P'), **entry_style
+        )
+        self.seconds_entry = tk.Entry(
+            duration_frame, width=5, validate='key',
+            validatecommand=(self.register(_is_seconds_text), '%P'), **entry_style
+        )
 
         self.minutes_entry.pack(side=tk.LEFT)
-        tk.Label(duration_frame, text=":", bg=self.theme.bg_color, fg=self.theme.fg_color).pack(side=tk.LEFT)
+        tk.Label(duration_frame, text=":").pack(side=tk.LEFT)
         self.seconds_entry.pack(side=tk.LEFT)
+        return duration_frame
 
-        # Hotkey
-        tk.Label(
-            main_frame,
-            text="Hotkey:",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color
-        ).grid(row=2, column=0, sticky='w', pady=5)
-
-        hotkey_frame = tk.Frame(main_frame, bg=self.theme.bg_color)
-        hotkey_frame.grid(row=2, column=1, sticky='w', pady=5)
+    def _build_hotkey(self, parent):
+        """Create the hotkey display with its capture and clear buttons."""
+        hotkey_frame = tk.Frame(parent)
 
         # Current hotkey display
-        self.hotkey_var = tk.StringVar(value=self.timer.hotkey or "None")
         self.hotkey_display = tk.Label(
             hotkey_frame,
             textvariable=self.hotkey_var,
@@ -148,9 +364,9 @@ class TimerConfigDialog(tk.Toplevel):
             hotkey_frame,
             text="Press keys...",
             width=12,
-            command=self._start_hotkey_capture
+            command=self._start_hotkey_capture,
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(self.capture_button, "button")
         self.capture_button.pack(side=tk.LEFT, padx=2)
 
         # Clear button
@@ -158,93 +374,17 @@ class TimerConfigDialog(tk.Toplevel):
             hotkey_frame,
             text="X",
             width=3,
-            command=self._clear_hotkey
+            command=self._clear_hotkey,
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(clear_button, "button")
         clear_button.pack(side=tk.LEFT, padx=2)
+        return hotkey_frame
 
-        # Hotkey capture state
-        self.capturing_hotkey = False
-        self.captured_keys = set()
-        self.hotkey_listener = None
-
-        # Visual Alerts section
-        tk.Label(
-            main_frame,
-            text="Visual Alerts:",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            font=('Arial', 10, 'bold')
-        ).grid(row=3, column=0, columnspan=2, sticky='w', pady=(15, 5))
-
-        alert_config = self.timer.alert_config or {}
-        visual_config = alert_config.get('visual', {})
-
-        self.flash_numbers_var = tk.BooleanVar(value=visual_config.get('flash_numbers', True))
-        self.flash_background_var = tk.BooleanVar(value=visual_config.get('flash_background', True))
-        self.flash_taskbar_var = tk.BooleanVar(value=visual_config.get('flash_taskbar', True))
-
-        tk.Checkbutton(
-            main_frame,
-            text="Flash timer numbers",
-            variable=self.flash_numbers_var,
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            selectcolor=self.theme.button_bg
-        ).grid(row=4, column=0, columnspan=2, sticky='w')
-
-        tk.Checkbutton(
-            main_frame,
-            text="Flash timer background",
-            variable=self.flash_background_var,
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            selectcolor=self.theme.button_bg
-        ).grid(row=5, column=0, columnspan=2, sticky='w')
-
-        tk.Checkbutton(
-            main_frame,
-            text="Flash taskbar",
-            variable=self.flash_taskbar_var,
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            selectcolor=self.theme.button_bg
-        ).grid(row=6, column=0, columnspan=2, sticky='w')
-
-        # Audio Alerts section
-        tk.Label(
-            main_frame,
-            text="Audio Alert:",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            font=('Arial', 10, 'bold')
-        ).grid(row=7, column=0, columnspan=2, sticky='w', pady=(15, 5))
+    def _build_volume(self, parent):
+        """Create the volume slider."""
+        volume_frame = tk.Frame(parent)
 
-        audio_config = alert_config.get('audio', {})
-
-        self.audio_enabled_var = tk.BooleanVar(value=audio_config.get('enabled', False))
-        self.audio_volume_var = tk.IntVar(value=audio_config.get('volume', 80))
-        self.audio_file_var = tk.StringVar(value=audio_config.get('file', ''))
-
-        tk.Checkbutton(
-            main_frame,
-            text="Enable sound",
-            variable=self.audio_enabled_var,
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            selectcolor=self.theme.button_bg
-        ).grid(row=8, column=0, columnspan=2, sticky='w')
-
-        # Volume slider
-        volume_frame = tk.Frame(main_frame, bg=self.theme.bg_color)
-        volume_frame.grid(row=9, column=0, columnspan=2, sticky='ew', pady=5)
-
-        tk.Label(
-            volume_frame,
-            text="Volume:",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color
-        ).pack(side=tk.LEFT)
+        tk.Label(volume_frame, text="Volume:").pack(side=tk.LEFT)
 
         volume_slider = tk.Scale(
             volume_frame,
@@ -257,36 +397,15 @@ class TimerConfigDialog(tk.Toplevel):
             highlightthickness=0
         )
         volume_slider.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        return volume_frame
 
-        # Sound file selection
-        sound_frame = tk.Frame(main_frame, bg=self.theme.bg_color)
-        sound_frame.grid(row=10, column=0, columnspan=2, sticky='ew', pady=5)
+    def _build_sound(self, parent):
+        """Create the sound file display."""
+        sound_frame = tk.Frame(parent)
 
-        # Get current sound file (or default if empty)
-        current_sound = audio_config.get('file', 'assets/sounds/beepbeep.wav')
-        # Extract just the filename for display
-        sound_filename = current_sound.split('/')[-1] if current_sound else 'beepbeep.wav'
-
-        tk.Label(
-            sound_frame,
-            text=f"Sound: {sound_filename}",
-            bg=self.theme.bg_color,
-            fg=self.theme.fg_color,
-            font=('Arial', 9)
-        ).pack(side=tk.LEFT)
-
-        # Buttons
-        button_frame = tk.Frame(main_frame, bg=self.theme.bg_color)
-        button_frame.grid(row=11, column=0, columnspan=2, pady=(20, 0))
-
-        ok_button = tk.Button(button_frame, text="OK", width=10, command=self._on_ok)
-        cancel_button = tk.Button(button_frame, text="Cancel", width=10, command=self._on_cancel)
-
-        self.theme.apply_to_widget(ok_button, "button")
-        self.theme.apply_to_widget(cancel_button, "button")
-
-        ok_button.pack(side=tk.LEFT, padx=5)
-        cancel_button.pack(side=tk.LEFT, padx=5)
+        self.sound_label = tk.Label(sound_frame, font=('Arial', 9))
+        self.sound_label.pack(side=tk.LEFT)
+        return sound_frame
 
     def _on_ok(self):
         """Handle OK button click."""
@@ -296,22 +415,13 @@ class TimerConfigDialog(tk.Toplevel):
             messagebox.showerror("Error", "Timer label cannot be empty")
             return
 
-        # Parse duration
-        try:
-            minutes = int(self.minutes_entry.get())
-            seconds = int(self.seconds_entry.get())
-
-            if minutes < 0 or seconds < 0:
-                raise ValueError("Duration cannot be negative")
-
-            duration = minutes * 60 + seconds
+        # Parse duration (the entry validators only admit digits)
+        minutes = int(self.minutes_entry.get() or '0')
+        seconds = int(self.seconds_entry.get() or '0')
+        duration = minutes * 60 + seconds
 
-            if duration == 0:
-                messagebox.showerror("Error", "Duration must be greater than 0")
-                return
-
-        except ValueError:
-            messagebox.showerror("Error", "Invalid duration format")
+        if duration == 0:
+            messagebox.showerror("Error", "Duration must be greater than 0")
             return
 
         # Get hotkey from captured value
@@ -350,72 +460,74 @@ class TimerConfigDialog(tk.Toplevel):
             }
         }
 
-        self.destroy()
+        self._done_var.set(True)
 
     def _on_cancel(self):
         """Handle Cancel button click."""
         self.result = None
-        self.destroy()
+        self._done_var.set(True)
 
     def show(self):
         """
         Show dialog and wait for result.
 
+        The dialog is withdrawn, not destroyed, when closed so it can be
+        shown again.
+
         Returns:
             Config dict if OK clicked, None if cancelled
         """
-        self.wait_window()
+        self._done_var.set(False)
+        self._center_on_parent()
+        self.deiconify()
+        self.grab_set()
+
+        self.wait_variable(self._done_var)
+
+        if self.capturing_hotkey:
+            self._stop_hotkey_capture()
+        self.grab_release()
+        self.withdraw()
         return self.result
 
     def _start_hotkey_capture(self):
         """Start capturing hotkey input."""
-        from pynput import keyboard
-
         # Update button text
         self.capture_button.configure(text="Listening... (Esc to cancel)")
         self.capturing_hotkey = True
         self.captured_keys = set()
 
-        def on_press(key):
-            if not self.capturing_hotkey:
-                return False  # Stop listener
-
-            # Add key to captured set
-            self.captured_keys.add(key)
-
-            # Build hotkey string
-            hotkey_string = self._build_hotkey_string(self.captured_keys)
-
-            # Update display in real-time
-            self.hotkey_var.set(hotkey_string)
-
-        def on_release(key):
-            if not self.capturing_hotkey:
-                return False  # Stop listener
-
-            # Check for Escape to cancel
-            if key == keyboard.Key.esc:
-                self._stop_hotkey_capture()
-                return False  # Stop listener
-
-            # If we have at least one key, stop capturing
-            if len(self.captured_keys) > 0:
-                # Small delay to capture all keys
-                self.after(100, self._stop_hotkey_capture)
-                return False  # Stop listener
-
-        # Start listener in background
-        self.hotkey_listener = keyboard.Listener(on_press=on_press, on_release=on_release)
-        self.hotkey_listener.start()
+        # The display label has no class key bindings, so with focus on it
+        # these handlers see every key first and can suppress Tab/Alt/etc.
+        self.hotkey_display.bind('<KeyPress>', self._on_capture_press)
+        self.hotkey_display.bind('<KeyRelease>', self._on_capture_release)
+        self.hotkey_display.focus_set()
+
+    def _on_capture_press(self, event):
+        """Add a pressed key to the captured hotkey."""
+        if event.keysym == 'Escape':
+            self.captured_keys = set()
+            self._stop_hotkey_capture()
+            return "break"
+
+        # Key auto-repeat sends the same press again; only new keys count
+        name = _TK_MODIFIERS.get(event.keysym) or _key_name(event)
+        if name and name not in self.captured_keys:
+            self.captured_keys.add(name)
+            self.hotkey_var.set(self._build_hotkey_string(self.captured_keys))
+        return "break"
+
+    def _on_capture_release(self, event):
+        """Finish capturing once the first key is released."""
+        if self.captured_keys:
+            self._stop_hotkey_capture()
+        return "break"
 
     def _stop_hotkey_capture(self):
         """Stop capturing hotkey input."""
         self.capturing_hotkey = False
-
-        # Stop listener if running
-        if self.hotkey_listener:
-            self.hotkey_listener.stop()
-            self.hotkey_listener = None
+        self.hotkey_display.unbind('<KeyPress>')
+        self.hotkey_display.unbind('<KeyRelease>')
 
         # Reset button text
         self.capture_button.configure(text="Press keys...")
@@ -438,106 +550,67 @@ class TimerConfigDialog(tk.Toplevel):
         Build a hotkey string from captured keys.
 
         Args:
-            keys: Set of pynput Key/KeyCode objects
+            keys: Set of hotkey key names, e.g. {"ctrl", "shift", "1"}
 
         Returns:
             Hotkey string like "ctrl+shift+1"
         """
-        from pynput import keyboard
-
-        modifiers = []
-        regular_keys = []
-        has_modifiers = False
-
-        # Map of virtual key codes to readable names (physical keys)
-        vk_to_char = {
-            # Number row
-            48: '0', 49: '1', 50: '2', 51: '3', 52: '4',
-            53: '5', 54: '6', 55: '7', 56: '8', 57: '9',
-            # Letter keys (A-Z)
-            65: 'a', 66: 'b', 67: 'c', 68: 'd', 69: 'e', 70: 'f',
-            71: 'g', 72: 'h', 73: 'i', 74: 'j', 75: 'k', 76: 'l',
-            77: 'm', 78: 'n', 79: 'o', 80: 'p', 81: 'q', 82: 'r',
-            83: 's', 84: 't', 85: 'u', 86: 'v', 87: 'w', 88: 'x',
-            89: 'y', 90: 'z',
-            # Function keys (F1-F24)
-            112: 'f1', 113: 'f2', 114: 'f3', 115: 'f4',
-            116: 'f5', 117: 'f6', 118: 'f7', 119: 'f8',
-            120: 'f9', 121: 'f10', 122: 'f11', 123: 'f12',
-            124: 'f13', 125: 'f14', 126: 'f15', 127: 'f16',
-            128: 'f17', 129: 'f18', 130: 'f19', 131: 'f20',
-            132: 'f21', 133: 'f22', 134: 'f23', 135: 'f24',
-            # Navigation keys
-            33: 'page_up', 34: 'page_down',
-            35: 'end', 36: 'home',
-            45: 'insert', 46: 'delete',
-            # Arrow keys
-            37: 'left', 38: 'up', 39: 'right', 40: 'down',
-            # Numpad
-            96: 'num0', 97: 'num1', 98: 'num2', 99: 'num3',
-            100: 'num4', 101: 'num5', 102: 'num6', 103: 'num7',
-            104: 'num8', 105: 'num9',
-            106: 'num_multiply', 107: 'num_add', 109: 'num_subtract',
-            110: 'num_decimal', 111: 'num_divide',
-            # Special keys
-            144: 'num_lock', 145: 'scroll_lock',
-            19: 'pause', 44: 'print_screen'
-        }
-
-        # First pass: collect modifiers
-        for key in keys:
-            if key in (keyboard.Key.ctrl_l, keyboard.Key.ctrl_r, keyboard.Key.ctrl):
-                if 'ctrl' not in modifiers:
-                    modifiers.append('ctrl')
-                    has_modifiers = True
-            elif key in (keyboard.Key.shift_l, keyboard.Key.shift_r, keyboard.Key.shift):
-                if 'shift' not in modifiers:
-                    modifiers.append('shift')
-                    has_modifiers = True
-            elif key in (keyboard.Key.alt_l, keyboard.Key.alt_r, keyboard.Key.alt):
-                if 'alt' not in modifiers:
-                    modifiers.append('alt')
-                    has_modifiers = True
-
-        # Second pass: collect regular keys
-        # If modifiers are present, ALWAYS use VK code to get physical key
-        # This prevents Shift+1 from becoming "!" instead of "1"
-        for key in keys:
-            # Skip modifier keys
-            if key in (keyboard.Key.ctrl_l, keyboard.Key.ctrl_r, keyboard.Key.ctrl,
-                      keyboard.Key.shift_l, keyboard.Key.shift_r, keyboard.Key.shift,
-                      keyboard.Key.alt_l, keyboard.Key.alt_r, keyboard.Key.alt):
-                continue
-
-            # Check if it's a named special key (e.g., Key.page_up, Key.f13)
-            if isinstance(key, keyboard.Key):
-                key_name = key.name.lower()
-                regular_keys.append(key_name)
-                continue
-
-            # Always prefer VK code for physical key
-            if hasattr(key, 'vk') and key.vk is not None:
-                vk = key.vk
-                if vk in vk_to_char:
-                    # Known physical key (letter, number, or special)
-                    regular_keys.append(vk_to_char[vk])
-                else:
-                    # Unknown VK - try to get readable name
-                    key_str = str(key).replace('Key.', '').replace('<', '').replace('>', '').replace("'", '')
-                    if key_str and key_str not in modifiers:
-                        regular_keys.append(key_str.lower())
-            elif hasattr(key, 'char') and key.char and not has_modifiers:
-                # Only use char if NO modifiers (plain key press)
-                regular_keys.append(key.char.lower())
-
-        # Sort modifiers for consistency
-        modifier_order = {'ctrl': 0, 'shift': 1, 'alt': 2}
-        modifiers.sort(key=lambda x: modifier_order.get(x, 99))
-
-        # Build string
-        parts = modifiers + regular_keys
+        modifiers = [name for name in _MODIFIER_ORDER if name in keys]
+        parts = modifiers + sorted(keys.difference(_MODIFIER_ORDER))
 
         if len(parts) == 0:
             return "None"
 
         return '+'.join(parts)
+
+
+def _is_minutes_text(text: str) -> bool:
+    """
+    Check a proposed minutes entry value: empty or up to 4 digits.
+
+    Args:
+        text: Entry contents after the edit
+
+    Returns:
+        True if the edit should be allowed
+    """
+    return text == '' or (len(text) <= 4 and text.isascii() and text.isdigit())
+
+
+def _is_seconds_text(text: str) -> bool:
+    """
+    Check a proposed seconds entry value: empty or 0-59.
+
+    Args:
+        text: Entry contents after the edit
+
+    Returns:
+        True if the edit should be allowed
+    """
+    return text == '' or (
+        len(text) <= 2 and text.isascii() and text.isdigit() and int(text) < 60
+    )
+
+
+def _key_name(event) -> Optional[str]:
+    """
+    Get the hotkey name for a Tk key event.
+
+    On Windows the virtual key code is used for known keys, so Shift+1
+    reads as "1" rather than "!".
+
+    Args:
+        event: Tk KeyPress event
+
+    Returns:
+        Key name like "a", "f13" or "page_up", or None if unknown
+    """
+    if _KEYCODE_IS_VK:
+        name = _VK_TO_CHAR.get(event.keycode)
+        if name is not None:
+            return name
+
+    keysym = event.keysym
+    if not keysym or keysym == '??':
+        return None
+    return _TK_KEYSYMS.get(keysym, keysym.lower())
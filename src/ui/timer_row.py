@@ -4,7 +4,15 @@ import tkinter as tk
 from typing import Callable, Optional
 from src.core.timer import Timer
 from src.config.defaults import TimerState
-from src.utils.tooltip import add_tooltip
+from src.utils.tooltip import add_lazy_tooltip
+
+# Start/pause button text for each timer state
+_BUTTON_TEXT = {
+    TimerState.STOPPED: "Start",
+    TimerState.RUNNING: "Pause",
+    TimerState.PAUSED: "Resume",
+    TimerState.COMPLETED: "Restart",
+}
 
 
 class TimerRow(tk.Frame):
@@ -38,6 +46,11 @@ class TimerRow(tk.Frame):
         self.on_config_click = on_config_click
         self.on_delete_click = on_delete_click
 
+        # Last values pushed to the widgets, so unchanged ones are skipped
+        self._last_time_text: Optional[str] = None
+        self._last_btn_text: Optional[str] = None
+        self._last_fg: Optional[str] = None
+
         # Apply theme
         self.configure(bg=theme.bg_color)
 
@@ -48,38 +61,38 @@ class TimerRow(tk.Frame):
         self.update_display()
 
     def _create_widgets(self):
-        """Create all widgets for the timer row."""
+        """Create all widgets for the timer row, packed left to right."""
         # Label (15 characters wide)
         self.label_widget = tk.Label(
             self,
             text=self.timer.label,
             width=15,
             anchor='w',
-            font=('Arial', 10)
+            font=('Arial', 10),
+            **self.theme.widget_style("label")
         )
-        self.theme.apply_to_widget(self.label_widget, "label")
-        self.label_widget.grid(row=0, column=0, padx=5, pady=2, sticky='w')
+        self.label_widget.pack(side=tk.LEFT, padx=5, pady=2)
 
         # Time display (MM:SS format, large font)
         self.time_display = tk.Label(
             self,
             text="00:00",
             width=8,
-            font=('Arial', 16, 'bold')
+            font=('Arial', 16, 'bold'),
+            **self.theme.widget_style("label")
         )
-        self.theme.apply_to_widget(self.time_display, "label")
-        self.time_display.grid(row=0, column=1, padx=5, pady=2)
+        self.time_display.pack(side=tk.LEFT, padx=5, pady=2)
 
         # Start/Pause button
         self.start_button = tk.Button(
             self,
             text="Start",
             width=8,
-            command=self._on_start_pause_click
+            command=self._on_start_pause_click,
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(self.start_button, "button")
-        self.start_button.grid(row=0, column=2, padx=2, pady=2)
-        add_tooltip(
+        self.start_button.pack(side=tk.LEFT, padx=2, pady=2)
+        add_lazy_tooltip(
             self.start_button,
             "Start/pause the timer (hotkey if configured)"
         )
@@ -89,22 +102,22 @@ class TimerRow(tk.Frame):
             self,
             text="Reset",
             width=8,
-            command=self._on_reset_click
+            command=self._on_reset_click,
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(self.reset_button, "button")
-        self.reset_button.grid(row=0, column=3, padx=2, pady=2)
-        add_tooltip(self.reset_button, "Reset timer to initial duration")
+        self.reset_button.pack(side=tk.LEFT, padx=2, pady=2)
+        add_lazy_tooltip(self.reset_button, "Reset timer to initial duration")
 
         # Config button (gear icon as text)
         self.config_button = tk.Button(
             self,
             text="Config",
             width=6,
-            command=self._on_config_button_click
+            command=self._on_config_button_click,
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(self.config_button, "button")
-        self.config_button.grid(row=0, column=4, padx=2, pady=2)
-        add_tooltip(
+        self.config_button.pack(side=tk.LEFT, padx=2, pady=2)
+        add_lazy_tooltip(
             self.config_button,
             "Configure timer settings (label, duration, hotkey, alerts)"
         )
@@ -114,11 +127,11 @@ class TimerRow(tk.Frame):
             self,
             text="X",
             width=3,
-            command=self._on_delete_button_click
+            command=self._on_delete_button_click,
+            **self.theme.widget_style("button")
         )
-        self.theme.apply_to_widget(self.delete_button, "button")
-        self.delete_button.grid(row=0, column=5, padx=2, pady=2)
-        add_tooltip(self.delete_button, "Delete this timer")
+        self.delete_button.pack(side=tk.LEFT, padx=2, pady=2)
+        add_lazy_tooltip(self.delete_button, "Delete this timer")
 
     def _on_start_pause_click(self):
         """Handle start/pause button click."""
@@ -150,31 +163,38 @@ class TimerRow(tk.Frame):
             self.on_delete_click(self.timer.id)
 
     def update_display(self):
-        """Update the display based on timer state."""
+        """Update the display based on timer state, touching only what changed."""
+        state = self.timer.state
+
         # Update time display
-        self.time_display.configure(text=self.timer.get_display_time())
+        time_text = self.timer.get_display_time()
+        if time_text != self._last_time_text:
+            self.time_display.configure(text=time_text)
+            self._last_time_text = time_text
 
         # Update start/pause button text
-        if self.timer.state == TimerState.STOPPED:
-            self.start_button.configure(text="Start")
-        elif self.timer.state == TimerState.RUNNING:
-            self.start_button.configure(text="Pause")
-        elif self.timer.state == TimerState.PAUSED:
-            self.start_button.configure(text="Resume")
-        elif self.timer.state == TimerState.COMPLETED:
-            self.start_button.configure(text="Restart")
+        btn_text = _BUTTON_TEXT.get(state)
+        if btn_text is not None and btn_text != self._last_btn_text:
+            self.start_button.configure(text=btn_text)
+            self._last_btn_text = btn_text
 
         # Change time color if completed
-        if self.timer.state == TimerState.COMPLETED:
-            self.time_display.configure(fg=self.theme.alert_flash_color)
+        if state == TimerState.COMPLETED:
+            fg = self.theme.alert_flash_color
         else:
-            self.time_display.configure(fg=self.theme.fg_color)
-
-    def flash_alert(self):
-        """Flash the timer display for visual alert."""
-        # Toggle between alert color and normal color
-        current_fg = self.time_display.cget('fg')
-        if current_fg == self.theme.alert_flash_color:
-            self.time_display.configure(fg=self.theme.alert_normal_color)
-        else:
-            self.time_display.configure(fg=self.theme.alert_flash_color)
+            fg = self.theme.fg_color
+        if fg != self._last_fg:
+            self.time_display.configure(fg=fg)
+            self._last_fg = fg
+
+    def flash_alert(self, flashing: bool):
+        """
+        Set the timer display's flash color for a visual alert.
+
+        Args:
+            flashing: True for the alert color, False for the normal color
+        """
+        fg = self.theme.alert_flash_color if flashing else self.theme.alert_normal_color
+        if fg != self._last_fg:
+            self.time_display.configure(fg=fg)
+            self._last_fg = fg
@@ -1,7 +1,81 @@
 """Alert manager for coordinating visual alerts."""
 
 import sys
-from typing import Optional, Callable
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Optional, Callable
+
+if sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+
+    class _FLASHWINFO(ctypes.Structure):
+        _fields_ = [
+            ('cbSize', wintypes.UINT),
+            ('hwnd', wintypes.HWND),
+            ('dwFlags', wintypes.DWORD),
+            ('uCount', wintypes.UINT),
+            ('dwTimeout', wintypes.DWORD)
+        ]
+
+    _FlashWindowEx = ctypes.windll.user32.FlashWindowEx
+    _FlashWindowEx.argtypes = [ctypes.POINTER(_FLASHWINFO)]
+    _FlashWindowEx.restype = wintypes.BOOL
+
+    FLASHW_ALL = 3  # Flash both caption and taskbar
+    FLASHW_TIMERNOFG = 12  # Flash until window comes to foreground
+
+
+# Shortest flash interval; update_alert would never finish toggling at 0
+MIN_INTERVAL_MS = 1
+
+
+@dataclass(frozen=True, slots=True)
+class AlertConfig:
+    """Visual alert settings; built once per timer and shared by its alerts."""
+
+    flash_numbers: bool = True
+    flash_background: bool = False
+    flash_window: bool = False
+    flash_taskbar: bool = True
+    duration_ms: int = 3000
+    interval_ms: int = 500
+
+    @classmethod
+    def from_dict(cls, visual: Dict[str, Any]) -> "AlertConfig":
+        """
+        Build an alert config from a stored visual alert dict.
+
+        Args:
+            visual: The 'visual' section of a timer's alert config
+
+        Returns:
+            AlertConfig with defaults for any missing keys, and the flash
+            interval raised to at least MIN_INTERVAL_MS
+        """
+        return cls(
+            flash_numbers=visual.get('flash_numbers', True),
+            flash_background=visual.get('flash_background', False),
+            flash_window=visual.get('flash_window', False),
+            flash_taskbar=visual.get('flash_taskbar', True),
+            duration_ms=visual.get('flash_duration_ms', 3000),
+            interval_ms=max(MIN_INTERVAL_MS, visual.get('flash_interval_ms', 500))
+        )
+
+
+# Shared by alerts started without an explicit config
+DEFAULT_ALERT_CONFIG = AlertConfig()
+
+
+@dataclass(slots=True)
+class AlertState:
+    """State of one running visual alert."""
+
+    config: AlertConfig
+    on_flash_callback: Optional[Callable]
+    elapsed_ms: int = 0
+    # Elapsed time at which the flash state next toggles
+    next_toggle_ms: int = 0
+    flash_state: bool = False
 
 
 class AlertManager:
@@ -17,17 +91,21 @@ class AlertManager:
 
     def __init__(self):
         """Initialize alert manager."""
-        self.active_alerts = {}  # timer_id -> alert state
+        self.active_alerts: Dict[str, AlertState] = {}
+        # Reused for every taskbar flash; only hwnd changes between calls
+        self._flash_info = None
+        if sys.platform == 'win32':
+            self._flash_info = _FLASHWINFO(
+                cbSize=ctypes.sizeof(_FLASHWINFO),
+                dwFlags=FLASHW_ALL | FLASHW_TIMERNOFG,
+                uCount=0,  # Flash until foreground
+                dwTimeout=0  # Default cursor blink rate
+            )
 
     def start_alert(
         self,
         timer_id: str,
-        flash_numbers: bool = True,
-        flash_background: bool = False,
-        flash_window: bool = False,
-        flash_taskbar: bool = True,
-        duration_ms: int = 3000,
-        interval_ms: int = 500,
+        config: AlertConfig = DEFAULT_ALERT_CONFIG,
         on_flash_callback: Optional[Callable] = None
     ):
         """
@@ -35,25 +113,14 @@ class AlertManager:
 
         Args:
             timer_id: ID of timer
-            flash_numbers: Flash the timer numbers
-            flash_background: Flash the timer row background
-            flash_window: Flash the window border
-            flash_taskbar: Flash the taskbar icon
-            duration_ms: Total alert duration
-            interval_ms: Flash interval
+            config: Alert settings (kept by reference, not copied)
             on_flash_callback: Callback for each flash (receives timer_id)
         """
-        self.active_alerts[timer_id] = {
-            'flash_numbers': flash_numbers,
-            'flash_background': flash_background,
-            'flash_window': flash_window,
-            'flash_taskbar': flash_taskbar,
-            'duration_ms': duration_ms,
-            'interval_ms': interval_ms,
-            'elapsed_ms': 0,
-            'flash_state': False,
-            'on_flash_callback': on_flash_callback
-        }
+        if config.interval_ms < MIN_INTERVAL_MS:
+            config = replace(config, interval_ms=MIN_INTERVAL_MS)
+        self.active_alerts[timer_id] = AlertState(
+            config, on_flash_callback, next_toggle_ms=config.interval_ms
+        )
 
     def update_alert(self, timer_id: str, elapsed_ms: int) -> bool:
         """
@@ -66,24 +133,26 @@ class AlertManager:
         Returns:
             True if alert should continue, False if complete
         """
-        if timer_id not in self.active_alerts:
+        alert = self.active_alerts.get(timer_id)
+        if alert is None:
             return False
 
-        alert = self.active_alerts[timer_id]
-        alert['elapsed_ms'] += elapsed_ms
+        alert.elapsed_ms += elapsed_ms
+        config = alert.config
 
         # Check if alert duration exceeded
-        if alert['elapsed_ms'] >= alert['duration_ms']:
+        if alert.elapsed_ms >= config.duration_ms:
             self.stop_alert(timer_id)
             return False
 
-        # Check if we should toggle flash state
-        if alert['elapsed_ms'] % alert['interval_ms'] < elapsed_ms:
-            alert['flash_state'] = not alert['flash_state']
+        # Toggle once per interval boundary crossed, however uneven the ticks
+        while alert.elapsed_ms >= alert.next_toggle_ms:
+            alert.flash_state = not alert.flash_state
+            alert.next_toggle_ms += config.interval_ms
 
             # Trigger flash callback
-            if alert['on_flash_callback']:
-                alert['on_flash_callback'](timer_id)
+            if alert.on_flash_callback:
+                alert.on_flash_callback(timer_id)
 
         return True
 
@@ -94,8 +163,7 @@ class AlertManager:
         Args:
             timer_id: ID of timer
         """
-        if timer_id in self.active_alerts:
-            del self.active_alerts[timer_id]
+        self.active_alerts.pop(timer_id, None)
 
     def is_flashing(self, timer_id: str) -> bool:
         """
@@ -107,9 +175,8 @@ class AlertManager:
         Returns:
             True if in flash state
         """
-        if timer_id in self.active_alerts:
-            return self.active_alerts[timer_id]['flash_state']
-        return False
+        alert = self.active_alerts.get(timer_id)
+        return alert is not None and alert.flash_state
 
     def flash_taskbar_windows(self, hwnd):
         """
@@ -118,34 +185,13 @@ class AlertManager:
         Args:
             hwnd: Window handle
         """
-        if sys.platform != 'win32':
+        flash_info = self._flash_info
+        if flash_info is None:
             return
 
         try:
-            import ctypes
-            from ctypes import wintypes
-
-            class FLASHWINFO(ctypes.Structure):
-                _fields_ = [
-                    ('cbSize', wintypes.UINT),
-                    ('hwnd', wintypes.HWND),
-                    ('dwFlags', wintypes.DWORD),
-                    ('uCount', wintypes.UINT),
-                    ('dwTimeout', wintypes.DWORD)
-                ]
-
-            FLASHW_ALL = 3  # Flash both caption and taskbar
-            FLASHW_TIMERNOFG = 12  # Flash until window comes to foreground
-
-            flash_info = FLASHWINFO(
-                cbSize=ctypes.sizeof(FLASHWINFO),
-                hwnd=hwnd,
-                dwFlags=FLASHW_ALL | FLASHW_TIMERNOFG,
-                uCount=0,  # Flash until foreground
-                dwTimeout=0  # Default cursor blink rate
-            )
-
-            ctypes.windll.user32.FlashWindowEx(ctypes.byref(flash_info))
+            flash_info.hwnd = hwnd
+            _FlashWindowEx(ctypes.byref(flash_info))
 
         except Exception as e:
             print(f"Warning: Could not flash taskbar: {e}")
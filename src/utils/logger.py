@@ -3,11 +3,92 @@ Logging utility for mmMCounter
 Provides file-based logging for debugging and beta testing
 """
 
+import atexit
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import sys
-from datetime import datetime
-from pathlib import Path
+import time
+from types import SimpleNamespace
+
+# Whether running as a PyInstaller executable, resolved once at import
+_FROZEN = bool(getattr(sys, 'frozen', False))
+
+# Project root when running as a script (src/utils -> project root)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The application logger; logging.getLogger always returns this same object
+_LOGGER = logging.getLogger('mmMCounter')
+
+# Background thread that writes queued records to the real handlers
+_listener = None
+
+# Log file write buffer; records below WARNING wait here until it fills
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Size at which a log file rolls over, and how many old files to keep
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+
+class BufferedFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that only flushes on WARNING and above.
+
+    The stock handler flushes after every record, turning chatty DEBUG
+    logging into one small write per line. Here lower-level records collect
+    in the file buffer and reach disk when it fills, on the next warning,
+    or when logging shuts down.
+
+    The file is opened on the first record. Rollover is decided from a
+    running count of written characters rather than the stock seek/tell
+    probe, which would flush the buffer on every record.
+    """
+
+    def __init__(self, filename, buffer_size: int = LOG_BUFFER_SIZE,
+                 max_bytes: int = LOG_MAX_BYTES, backup_count: int = LOG_BACKUP_COUNT):
+        """
+        Initialize the handler.
+
+        Args:
+            filename: Log file path
+            buffer_size: Size of the file write buffer in bytes
+            max_bytes: Approximate file size that triggers a rollover (0 disables)
+            backup_count: Number of rolled-over files to keep
+        """
+        self.buffer_size = buffer_size
+        self._written = 0
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count,
+                         encoding='utf-8', delay=True)
+
+    def _open(self):
+        """Open the log file with a large write buffer."""
+        return open(self.baseFilename, self.mode, buffering=self.buffer_size,
+                    encoding=self.encoding, errors=self.errors)
+
+    def doRollover(self):
+        """Roll over to a fresh file and restart the size count."""
+        super().doRollover()
+        self._written = 0
+
+    def emit(self, record):
+        """Write a record, flushing only for warnings and errors."""
+        try:
+            msg = self.format(record) + self.terminator
+            if self.maxBytes > 0 and self._written and self._written + len(msg) >= self.maxBytes:
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(msg)
+            self._written += len(msg)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
 
 
 def setup_logger(log_level=logging.DEBUG, enable_console=True):
@@ -21,31 +102,36 @@ def setup_logger(log_level=logging.DEBUG, enable_console=True):
     Returns:
         Logger instance
     """
+    global _listener
+
     # Create logger
-    logger = logging.getLogger('mmMCounter')
+    logger = _LOGGER
     logger.setLevel(log_level)
 
     # Remove existing handlers to avoid duplicates
     logger.handlers = []
+    stop_logger()
 
     # Create logs directory if it doesn't exist
-    if getattr(sys, 'frozen', False):
+    if _FROZEN:
         # Running as executable - logs next to exe
-        log_dir = Path(sys.executable).parent / 'logs'
+        log_dir = os.path.join(os.path.dirname(sys.executable), 'logs')
     else:
         # Running as script - logs in project root
-        log_dir = Path(__file__).parent.parent.parent / 'logs'
+        log_dir = os.path.join(_PROJECT_ROOT, 'logs')
 
-    log_dir.mkdir(exist_ok=True)
+    os.makedirs(log_dir, exist_ok=True)
 
     # Create file handler with timestamp
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    log_file = log_dir / f'mmMCounter_{timestamp}.log'
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    timestamp = time.strftime('%Y%m%d_%H%M%S')
+    log_file = os.path.join(log_dir, f'mmMCounter_{timestamp}.log')
+    file_handler = BufferedFileHandler(log_file)
     file_handler.setLevel(log_level)
 
+    handlers = []
+
     # Create console handler (optional)
-    if enable_console or not getattr(sys, 'frozen', False):
+    if enable_console or not _FROZEN:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
 
@@ -54,7 +140,7 @@ def setup_logger(log_level=logging.DEBUG, enable_console=True):
             '%(levelname)s: %(message)s'
         )
         console_handler.setFormatter(console_format)
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
     # File format (detailed)
     file_format = logging.Formatter(
@@ -62,23 +148,47 @@ def setup_logger(log_level=logging.DEBUG, enable_console=True):
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_format)
-    logger.addHandler(file_handler)
+    handlers.append(file_handler)
+
+    # Callers only enqueue records; disk and console writes happen on the
+    # listener thread so logging never blocks the Tk or timer threads
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _listener.start()
 
     # Log startup info
     logger.info('=' * 80)
     logger.info('mmMCounter - Beta Logging Started')
-    logger.info(f'Log file: {log_file}')
-    logger.info(f'Python version: {sys.version}')
-    logger.info(f'Running as executable: {getattr(sys, "frozen", False)}')
-    logger.info(f'Working directory: {os.getcwd()}')
+    logger.info('Log file: %s', log_file)
+    logger.info('Python version: %s', sys.version)
+    logger.info('Running as executable: %s', _FROZEN)
+    logger.info('Working directory: %s', os.getcwd())
     logger.info('=' * 80)
 
     return logger
 
 
+def stop_logger():
+    """Flush queued log records and stop the background writer."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        # Push buffered records to disk
+        for handler in _listener.handlers:
+            handler.flush()
+        _listener = None
+
+
+atexit.register(stop_logger)
+
+
 def get_logger():
     """Get the application logger instance"""
-    return logging.getLogger('mmMCounter')
+    return _LOGGER
 
 
 def log_exception(exc_type, exc_value, exc_traceback):
@@ -94,30 +204,56 @@ def log_exception(exc_type, exc_value, exc_traceback):
         sys.__excepthook__(exc_type, exc_value, exc_traceback)
         return
 
-    logger = get_logger()
+    logger = _LOGGER
     logger.critical(
         'Unhandled exception:',
         exc_info=(exc_type, exc_value, exc_traceback)
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _startup_paths() -> SimpleNamespace:
+    """
+    Resolve the paths checked by log_startup_validation.
+
+    Returns:
+        Namespace with sounds, fonts, config and default_profile paths
+    """
+    if _FROZEN:
+        base_path = sys._MEIPASS  # PyInstaller temp directory
+        config_dir = os.path.join(os.path.dirname(sys.executable), 'configs')
+    else:
+        base_path = _PROJECT_ROOT
+        config_dir = os.path.join(base_path, 'configs')
+
+    return SimpleNamespace(
+        sounds=os.path.join(base_path, 'assets', 'sounds'),
+        fonts=os.path.join(base_path, 'assets', 'fonts'),
+        config=config_dir,
+        default_profile=os.path.join(base_path, 'configs', 'profiles', 'default.json'),
+    )
+
+
 def log_startup_validation():
     """
     Log validation checks for application startup
     Helps identify missing files, config issues, etc.
+
+    The report is logged as one multi-line INFO record, followed by one
+    WARNING (or ERROR, if the sounds directory is missing) record listing
+    any issues.
     """
-    logger = get_logger()
-    logger.info('Running startup validation...')
+    logger = _LOGGER
+    # The detailed report is INFO; skip file sizes when it would be dropped
+    report = logger.isEnabledFor(logging.INFO)
+    lines = ['Running startup validation...']
 
     issues = []
+    summary_level = logging.WARNING
+    paths = _startup_paths()
 
     # Check sound files
-    if getattr(sys, 'frozen', False):
-        base_path = Path(sys._MEIPASS)  # PyInstaller temp directory
-    else:
-        base_path = Path(__file__).parent.parent.parent
-
-    sounds_dir = base_path / 'assets' / 'sounds'
+    sounds_dir = paths.sounds
     expected_sounds = [
         'beepbeep.wav',
         'sonar.wav',
@@ -127,55 +263,59 @@ def log_startup_validation():
         'CREDITS.txt'
     ]
 
-    if sounds_dir.exists():
-        logger.info(f'[OK] Sounds directory found: {sounds_dir}')
+    if os.path.isdir(sounds_dir):
+        lines.append(f'[OK] Sounds directory found: {sounds_dir}')
+        # One directory read; DirEntry caches stat results on Windows
+        with os.scandir(sounds_dir) as it:
+            entries = {entry.name: entry for entry in it}
         for sound in expected_sounds:
-            sound_path = sounds_dir / sound
-            if sound_path.exists():
-                logger.info(f'  [OK] {sound} ({sound_path.stat().st_size} bytes)')
-            else:
-                logger.warning(f'  [X] MISSING: {sound}')
+            entry = entries.get(sound)
+            if entry is None:
+                lines.append(f'  [X] MISSING: {sound}')
                 issues.append(f'Missing sound file: {sound}')
+            elif report:
+                lines.append(f'  [OK] {sound} ({entry.stat().st_size} bytes)')
     else:
-        logger.error(f'[X] Sounds directory NOT FOUND: {sounds_dir}')
+        lines.append(f'[X] Sounds directory NOT FOUND: {sounds_dir}')
         issues.append('Sounds directory missing')
+        summary_level = logging.ERROR
 
     # Check fonts directory
-    fonts_dir = base_path / 'assets' / 'fonts'
-    if fonts_dir.exists():
-        logger.info(f'[OK] Fonts directory found: {fonts_dir}')
+    fonts_dir = paths.fonts
+    if os.path.isdir(fonts_dir):
+        lines.append(f'[OK] Fonts directory found: {fonts_dir}')
     else:
-        logger.warning(f'[X] Fonts directory NOT FOUND: {fonts_dir}')
+        lines.append(f'[X] Fonts directory NOT FOUND: {fonts_dir}')
         issues.append('Fonts directory missing (non-critical)')
 
     # Check config directory
-    if getattr(sys, 'frozen', False):
-        config_dir = Path(sys.executable).parent / 'configs'
-    else:
-        config_dir = base_path / 'configs'
-
-    if config_dir.exists():
-        logger.info(f'[OK] Config directory found: {config_dir}')
+    config_dir = paths.config
+    if os.path.isdir(config_dir):
+        lines.append(f'[OK] Config directory found: {config_dir}')
     else:
-        logger.info(f'[i] Config directory will be created: {config_dir}')
+        lines.append(f'[i] Config directory will be created: {config_dir}')
 
     # Check default profile
-    default_profile = base_path / 'configs' / 'profiles' / 'default.json'
-    if default_profile.exists():
-        logger.info(f'[OK] Default profile found: {default_profile}')
+    default_profile = paths.default_profile
+    if os.path.isfile(default_profile):
+        lines.append(f'[OK] Default profile found: {default_profile}')
     else:
-        logger.warning(f'[X] Default profile NOT FOUND: {default_profile}')
+        lines.append(f'[X] Default profile NOT FOUND: {default_profile}')
         issues.append('Default profile missing')
 
     # Summary
-    if issues:
-        logger.warning(f'Startup validation found {len(issues)} issue(s):')
-        for issue in issues:
-            logger.warning(f'  - {issue}')
-    else:
-        logger.info('[OK] All startup validation checks passed')
+    if not issues:
+        lines.append('[OK] All startup validation checks passed')
+    lines.append('Startup validation complete.')
+    lines.append('-' * 80)
+    if report:
+        logger.info('\n'.join(lines))
 
-    logger.info('Startup validation complete.')
-    logger.info('-' * 80)
+    if issues:
+        logger.log(
+            summary_level,
+            'Startup validation found %d issue(s):\n%s',
+            len(issues), '\n'.join(f'  - {issue}' for issue in issues)
+        )
 
     return issues
@@ -2,29 +2,40 @@
 
 import sys
 import os
+from functools import lru_cache
 
 
+# Whether running as a PyInstaller executable, resolved once at import
+_FROZEN = bool(getattr(sys, 'frozen', False))
+
+# Project root when running as a script (src/utils -> project root)
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@lru_cache(maxsize=1)
 def get_config_dir() -> str:
     """
     Get configuration directory path.
 
     Handles both script execution and PyInstaller frozen executable.
+    The directory is created on the first call and the path cached.
 
     Returns:
         Path to config directory
     """
-    if getattr(sys, 'frozen', False):
+    if _FROZEN:
         # Running as compiled executable
         base_dir = os.path.dirname(sys.executable)
     else:
-        # Running as script - go up from src/utils to project root
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        # Running as script
+        base_dir = _PROJECT_ROOT
 
     config_dir = os.path.join(base_dir, 'configs')
     os.makedirs(config_dir, exist_ok=True)
     return config_dir
 
 
+@lru_cache(maxsize=1)
 def get_assets_dir() -> str:
     """
     Get assets directory path.
@@ -34,12 +45,12 @@ def get_assets_dir() -> str:
     Returns:
         Path to assets directory
     """
-    if getattr(sys, 'frozen', False):
+    if _FROZEN:
         # Running as compiled executable - assets bundled with exe
         base_dir = sys._MEIPASS  # PyInstaller temp directory
     else:
         # Running as script
-        base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        base_dir = _PROJECT_ROOT
 
     assets_dir = os.path.join(base_dir, 'assets')
     return assets_dir
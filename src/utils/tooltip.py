@@ -2,6 +2,9 @@
 
 import tkinter as tk
 
+# Bind tag shared by tooltips that haven't been hovered yet
+_LAZY_TAG = "LazyToolTip"
+
 
 class ToolTip:
     """
@@ -12,6 +15,11 @@ class ToolTip:
         ToolTip(button, "This button does something")
     """
 
+    # One hidden window and label shared by every tooltip, created on the
+    # first show and moved/re-texted instead of rebuilt on each hover
+    _shared_win = None
+    _shared_label = None
+
     def __init__(self, widget, text, delay=500):
         """
         Initialize tooltip.
@@ -26,6 +34,8 @@ class ToolTip:
         self.delay = delay
         self.tooltip_window = None
         self.schedule_id = None
+        # Screen position for the pending tooltip, taken from the <Enter> event
+        self._pending_pos = None
 
         # Bind events
         self.widget.bind("<Enter>", self._on_enter)
@@ -35,6 +45,8 @@ class ToolTip:
     def _on_enter(self, event=None):
         """Mouse entered widget - schedule tooltip display."""
         self._cancel_schedule()
+        if event is not None:
+            self._pending_pos = (event.x_root + 20, event.y_root + 20)
         self.schedule_id = self.widget.after(self.delay, self._show_tooltip)
 
     def _on_leave(self, event=None):
@@ -53,33 +65,52 @@ class ToolTip:
         if self.tooltip_window:
             return
 
-        # Get widget position
-        x = self.widget.winfo_rootx() + 20
-        y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
-
-        # Create tooltip window
-        self.tooltip_window = tk.Toplevel(self.widget)
-        self.tooltip_window.wm_overrideredirect(True)  # No window decorations
-        self.tooltip_window.wm_geometry(f"+{x}+{y}")
-
-        # Create label with tooltip text
-        label = tk.Label(
-            self.tooltip_window,
-            text=self.text,
-            background="#ffffe0",
-            foreground="#000000",
-            relief=tk.SOLID,
-            borderwidth=1,
-            font=("Segoe UI", 9),
-            padx=5,
-            pady=3
-        )
-        label.pack()
+        # Place near the pointer where it entered, else below the widget
+        if self._pending_pos is not None:
+            x, y = self._pending_pos
+        else:
+            x = self.widget.winfo_rootx() + 20
+            y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
+
+        win = self._get_shared_window()
+        ToolTip._shared_label.configure(text=self.text)
+        win.wm_geometry(f"+{x}+{y}")
+        win.deiconify()
+        win.lift()
+        self.tooltip_window = win
+
+    def _get_shared_window(self):
+        """
+        Get the shared tooltip window, creating it if needed.
+
+        Returns:
+            Withdrawn tooltip Toplevel
+        """
+        cls = ToolTip
+        if cls._shared_win is None or not cls._shared_win.winfo_exists():
+            # Owned by the root so it outlives any one widget
+            cls._shared_win = tk.Toplevel(self.widget._root())
+            cls._shared_win.withdraw()
+            cls._shared_win.wm_overrideredirect(True)  # No window decorations
+
+            # Create label for tooltip text
+            cls._shared_label = tk.Label(
+                cls._shared_win,
+                background="#ffffe0",
+                foreground="#000000",
+                relief=tk.SOLID,
+                borderwidth=1,
+                font=("Segoe UI", 9),
+                padx=5,
+                pady=3
+            )
+            cls._shared_label.pack()
+        return cls._shared_win
 
     def _hide_tooltip(self):
         """Hide the tooltip window."""
         if self.tooltip_window:
-            self.tooltip_window.destroy()
+            self.tooltip_window.withdraw()
             self.tooltip_window = None
 
 
@@ -96,3 +127,29 @@ def add_tooltip(widget, text, delay=500):
         ToolTip instance
     """
     return ToolTip(widget, text, delay)
+
+
+def add_lazy_tooltip(widget, text, delay=500):
+    """
+    Add a tooltip that is only set up when the widget is first hovered.
+
+    Until then the widget just carries a shared bind tag, so creating
+    many widgets doesn't register three event callbacks apiece.
+
+    Args:
+        widget: Widget to add tooltip to
+        text: Tooltip text
+        delay: Delay in milliseconds before showing tooltip
+    """
+    widget._tooltip_args = (text, delay)
+    if not widget.bind_class(_LAZY_TAG, "<Enter>"):
+        widget.bind_class(_LAZY_TAG, "<Enter>", _on_first_enter)
+    widget.bindtags((_LAZY_TAG,) + widget.bindtags())
+
+
+def _on_first_enter(event):
+    """Create the real tooltip for a widget on its first hover."""
+    widget = event.widget
+    text, delay = widget.__dict__.pop('_tooltip_args')
+    widget.bindtags(tuple(tag for tag in widget.bindtags() if tag != _LAZY_TAG))
+    ToolTip(widget, text, delay)._on_enter(event)
@@ -1,14 +1,36 @@
 """Input validation utilities for mmMCounter."""
 
 import re
+from functools import lru_cache
 from typing import Optional, Tuple
 
+# Characters not allowed in file names on Windows
+_UNSAFE_CHARS = '<>:"/\\|?*'
+_UNSAFE_CHARS_RE = re.compile(f'[{re.escape(_UNSAFE_CHARS)}]')
+
+# Modifier names accepted in hotkey strings
+_VALID_MODIFIERS = frozenset({'ctrl', 'shift', 'alt', 'win', 'cmd'})
+
+# Maps each unsafe character to an underscore
+_SANITIZE_TABLE = str.maketrans(dict.fromkeys(_UNSAFE_CHARS, '_'))
+
+# Entries kept per memoized validator; UI handlers re-check the same text
+_VALIDATOR_CACHE_SIZE = 256
+
+# Device names Windows reserves regardless of extension
+_RESERVED_NAMES = frozenset({
+    "CON", "PRN", "AUX", "NUL",
+    *(f"COM{i}" for i in range(1, 10)),
+    *(f"LPT{i}" for i in range(1, 10))
+})
+
 
 class ValidationError(Exception):
     """Raised when validation fails."""
     pass
 
 
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def validate_profile_name(name: str) -> Tuple[bool, str]:
     """
     Validate a profile name.
@@ -26,15 +48,11 @@ def validate_profile_name(name: str) -> Tuple[bool, str]:
         return False, "Profile name too long (max 50 characters)"
 
     # Disallow filesystem-unsafe characters
-    if re.search(r'[<>:"/\\|?*]', name):
+    if _UNSAFE_CHARS_RE.search(name):
         return False, "Profile name contains invalid characters"
 
     # Reserved names
-    reserved = ["CON", "PRN", "AUX", "NUL", "COM1", "COM2", "COM3", "COM4",
-                "COM5", "COM6", "COM7", "COM8", "COM9", "LPT1", "LPT2",
-                "LPT3", "LPT4", "LPT5", "LPT6", "LPT7", "LPT8", "LPT9"]
-
-    if name.upper() in reserved:
+    if name.upper() in _RESERVED_NAMES:
         return False, f"'{name}' is a reserved name"
 
     return True, ""
@@ -78,6 +96,7 @@ def validate_duration(duration: int) -> Tuple[bool, str]:
     return True, ""
 
 
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def parse_duration_string(duration_str: str) -> Optional[int]:
     """
     Parse a duration string into seconds.
@@ -95,36 +114,39 @@ def parse_duration_string(duration_str: str) -> Optional[int]:
     """
     duration_str = duration_str.strip()
 
-    # Try parsing as plain integer (seconds)
-    try:
-        seconds = int(duration_str)
-        if seconds > 0:
-            return seconds
-    except ValueError:
-        pass
-
-    # Try parsing as time format
-    parts = duration_str.split(':')
-
-    try:
-        if len(parts) == 2:
-            # MM:SS format
-            minutes, seconds = map(int, parts)
-            total = minutes * 60 + seconds
-            return total if total > 0 else None
-
-        elif len(parts) == 3:
-            # HH:MM:SS format
-            hours, minutes, seconds = map(int, parts)
-            total = hours * 3600 + minutes * 60 + seconds
-            return total if total > 0 else None
+    # Plain seconds is the common case; isascii() keeps isdigit() from
+    # accepting characters like '²' that int() rejects
+    if duration_str.isascii() and duration_str.isdigit():
+        total = int(duration_str)
+        return total if total > 0 else None
+
+    # Single pass: fold each colon-separated field into the running total,
+    # scaling by 60 at every colon (so "H:M:S" = (H * 60 + M) * 60 + S)
+    total = 0
+    field = 0
+    colons = 0
+    has_digits = False
+
+    for ch in duration_str:
+        if '0' <= ch <= '9':
+            field = field * 10 + (ord(ch) - 48)
+            has_digits = True
+        elif ch == ':' and has_digits and colons < 2:
+            total = (total + field) * 60
+            field = 0
+            colons += 1
+            has_digits = False
+        else:
+            return None
 
-    except ValueError:
-        pass
+    if not has_digits:
+        return None
 
-    return None
+    total += field
+    return total if total > 0 else None
 
 
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def validate_hotkey_string(hotkey: str) -> Tuple[bool, str]:
     """
     Validate a hotkey string format.
@@ -138,36 +160,26 @@ def validate_hotkey_string(hotkey: str) -> Tuple[bool, str]:
     if not hotkey:
         return True, ""  # Empty hotkey is allowed (disabled)
 
-    # Check for valid format
-    parts = [p.strip().lower() for p in hotkey.split('+')]
-
-    if len(parts) < 1:
-        return False, "Invalid hotkey format"
+    # One pass: count modifiers and keep the single regular key
+    mod_count = 0
+    regular_key = None
 
-    # Valid modifiers
-    valid_modifiers = {'ctrl', 'shift', 'alt', 'win', 'cmd'}
-
-    # Check each part
-    modifiers = []
-    regular_keys = []
-
-    for part in parts:
-        if part in valid_modifiers:
-            modifiers.append(part)
+    for part in hotkey.lower().split('+'):
+        part = part.strip()
+        if part in _VALID_MODIFIERS:
+            mod_count += 1
+        elif regular_key is None:
+            regular_key = part
         else:
-            regular_keys.append(part)
+            # Should not have multiple regular keys
+            return False, "Hotkey can only have one regular key"
 
     # Must have at least one regular key
-    if not regular_keys:
+    if regular_key is None:
         return False, "Hotkey must include at least one regular key"
 
-    # Should not have multiple regular keys
-    if len(regular_keys) > 1:
-        return False, "Hotkey can only have one regular key"
-
     # Warn about potentially conflicting keys
-    single_key = regular_keys[0]
-    if len(modifiers) == 0 and len(single_key) == 1:
+    if mod_count == 0 and len(regular_key) == 1:
         # Single letter/number with no modifiers might conflict with Minecraft
         return True, f"Warning: '{hotkey}' might conflict with Minecraft controls"
 
@@ -190,6 +202,7 @@ def validate_volume(volume: int) -> Tuple[bool, str]:
     return True, ""
 
 
+@lru_cache(maxsize=_VALIDATOR_CACHE_SIZE)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize a filename by removing/replacing unsafe characters.
@@ -201,7 +214,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Replace unsafe characters with underscore
-    sanitized = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    sanitized = filename.translate(_SANITIZE_TABLE)
 
     # Remove leading/trailing whitespace and dots
     sanitized = sanitized.strip(' .')
@@ -0,0 +1,72 @@
+"""Unit tests for AlertManager."""
+
+import unittest
+from src.utils.alert_manager import AlertConfig, AlertManager
+
+
+class TestAlertManager(unittest.TestCase):
+    """Test cases for visual alert timing."""
+
+    def setUp(self):
+        """Set up an alert manager that records flash callbacks."""
+        self.manager = AlertManager()
+        self.flashes = []
+
+    def _start(self, duration_ms=3000, interval_ms=500):
+        """Start an alert on timer t1."""
+        self.manager.start_alert(
+            "t1",
+            AlertConfig(duration_ms=duration_ms, interval_ms=interval_ms),
+            on_flash_callback=self.flashes.append
+        )
+
+    def test_toggles_once_per_interval(self):
+        """Test flash state toggles on each interval boundary."""
+        self._start()
+
+        self.assertTrue(self.manager.update_alert("t1", 400))
+        self.assertEqual(len(self.flashes), 0)
+        self.assertFalse(self.manager.is_flashing("t1"))
+
+        self.assertTrue(self.manager.update_alert("t1", 100))
+        self.assertEqual(len(self.flashes), 1)
+        self.assertTrue(self.manager.is_flashing("t1"))
+
+        self.assertTrue(self.manager.update_alert("t1", 100))
+        self.assertEqual(len(self.flashes), 1)
+
+    def test_long_tick_catches_up(self):
+        """Test a tick spanning several intervals toggles for each one."""
+        self._start()
+
+        self.manager.update_alert("t1", 1100)
+        self.assertEqual(len(self.flashes), 2)
+        self.assertFalse(self.manager.is_flashing("t1"))
+
+    def test_alert_stops_after_duration(self):
+        """Test alert ends once its duration has elapsed."""
+        self._start(duration_ms=1000)
+
+        self.assertFalse(self.manager.update_alert("t1", 1000))
+        self.assertNotIn("t1", self.manager.active_alerts)
+        self.assertFalse(self.manager.update_alert("t1", 100))
+
+    def test_config_from_dict(self):
+        """Test building a config from a stored visual alert dict."""
+        config = AlertConfig.from_dict({'flash_background': True, 'flash_interval_ms': 250})
+        self.assertTrue(config.flash_background)
+        self.assertEqual(config.interval_ms, 250)
+        self.assertEqual(config.duration_ms, 3000)
+
+    def test_non_positive_interval_is_clamped(self):
+        """Test a zero or negative flash interval cannot stall update_alert."""
+        config = AlertConfig.from_dict({'flash_interval_ms': 0})
+        self.assertEqual(config.interval_ms, 1)
+
+        self._start(duration_ms=100, interval_ms=-5)
+        self.assertTrue(self.manager.update_alert("t1", 10))
+        self.assertEqual(len(self.flashes), 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
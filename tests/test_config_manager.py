@@ -8,22 +8,30 @@ import json
 from src.config.config_manager import ConfigManager
 from src.config.defaults import DEFAULT_PROFILE
 
+# Serialized once; json.loads gives each test a deep, independent profile
+_TEMPLATE = json.dumps(dict(DEFAULT_PROFILE))
+
 
 class TestConfigManager(unittest.TestCase):
     """Test cases for ConfigManager functionality."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Create one temporary root shared by every test in the class."""
+        cls._root = tempfile.mkdtemp()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared temporary root."""
+        shutil.rmtree(cls._root, ignore_errors=True)
+
     def setUp(self):
         """Set up test fixtures."""
-        # Create temporary directory for test configs
-        self.test_dir = tempfile.mkdtemp()
+        # Each test gets its own subdirectory of the shared root
+        self.test_dir = os.path.join(self._root, self.id().split('.')[-1])
+        os.mkdir(self.test_dir)
         self.config_manager = ConfigManager(self.test_dir)
 
-    def tearDown(self):
-        """Clean up test fixtures."""
-        # Remove temporary directory
-        if os.path.exists(self.test_dir):
-            shutil.rmtree(self.test_dir)
-
     def test_initialization(self):
         """Test ConfigManager creates necessary directories."""
         self.assertTrue(os.path.exists(self.config_manager.profiles_dir))
@@ -31,7 +39,7 @@ class TestConfigManager(unittest.TestCase):
 
     def test_save_and_load_profile(self):
         """Test saving and loading a profile."""
-        test_profile = DEFAULT_PROFILE.copy()
+        test_profile = json.loads(_TEMPLATE)
         test_profile['profile_name'] = 'test_profile'
 
         # Save profile
@@ -43,6 +51,46 @@ class TestConfigManager(unittest.TestCase):
         self.assertIsNotNone(loaded)
         self.assertEqual(loaded['profile_name'], 'test_profile')
 
+    def test_save_profile_leaves_no_temp_file(self):
+        """Test saving a profile replaces the file without leftovers."""
+        self.config_manager.save_profile('test', {'profile_name': 'test', 'timers': []})
+        self.config_manager.save_profile('test', {'profile_name': 'test', 'timers': []})
+
+        self.assertEqual(os.listdir(self.config_manager.profiles_dir), ['test.json'])
+
+    def test_load_profile_returns_independent_copy(self):
+        """Test mutating a loaded profile does not affect later loads."""
+        self.config_manager.save_profile('cached', {'timers': []})
+
+        first = self.config_manager.load_profile('cached')
+        first['timers'].append({'label': 'mutated'})
+        first['global_settings']['theme'] = 'light'
+
+        second = self.config_manager.load_profile('cached')
+        self.assertEqual(second['timers'], [])
+        self.assertEqual(second['global_settings']['theme'], 'dark')
+
+    def test_load_profile_detects_external_change(self):
+        """Test a profile edited on disk is re-read instead of served from cache."""
+        self.config_manager.save_profile('edited', {'timers': []})
+        self.assertEqual(self.config_manager.load_profile('edited')['timers'], [])
+
+        # Rewrite the file behind the manager's back
+        profile_path = os.path.join(self.config_manager.profiles_dir, 'edited.json')
+        with open(profile_path, 'w', encoding='utf-8') as f:
+            json.dump({'profile_name': 'edited', 'timers': [{'label': 'External'}]}, f)
+
+        loaded = self.config_manager.load_profile('edited')
+        self.assertEqual(loaded['timers'], [{'label': 'External'}])
+
+    def test_load_non_dict_profile(self):
+        """Test a profile file holding a JSON list loads as the defaults."""
+        with open(os.path.join(self.config_manager.profiles_dir, 'listed.json'), 'w') as f:
+            f.write('[1, 2]')
+
+        loaded = self.config_manager.load_profile('listed')
+        self.assertEqual(loaded, json.loads(_TEMPLATE))
+
     def test_load_nonexistent_profile(self):
         """Test loading a profile that doesn't exist."""
         loaded = self.config_manager.load_profile('nonexistent')
@@ -51,7 +99,7 @@ class TestConfigManager(unittest.TestCase):
     def test_delete_profile(self):
         """Test deleting a profile."""
         # Create a profile first
-        test_profile = DEFAULT_PROFILE.copy()
+        test_profile = json.loads(_TEMPLATE)
         self.config_manager.save_profile('test_delete', test_profile)
 
         # Delete it
@@ -62,6 +110,16 @@ class TestConfigManager(unittest.TestCase):
         loaded = self.config_manager.load_profile('test_delete')
         self.assertIsNone(loaded)
 
+    def test_profile_exists(self):
+        """Test checking for a profile without loading it."""
+        self.assertFalse(self.config_manager.profile_exists('test'))
+
+        self.config_manager.save_profile('test', {'profile_name': 'test', 'timers': []})
+        self.assertTrue(self.config_manager.profile_exists('test'))
+
+        self.config_manager.delete_profile('test')
+        self.assertFalse(self.config_manager.profile_exists('test'))
+
     def test_delete_nonexistent_profile(self):
         """Test deleting a profile that doesn't exist."""
         success = self.config_manager.delete_profile('nonexistent')
@@ -71,7 +129,7 @@ class TestConfigManager(unittest.TestCase):
         """Test listing all profiles."""
         # Create multiple profiles
         for i in range(3):
-            profile = DEFAULT_PROFILE.copy()
+            profile = json.loads(_TEMPLATE)
             profile['profile_name'] = f'profile_{i}'
             self.config_manager.save_profile(f'profile_{i}', profile)
 
@@ -110,7 +168,7 @@ class TestConfigManager(unittest.TestCase):
     def test_export_profile(self):
         """Test exporting a profile to file."""
         # Create a profile
-        test_profile = DEFAULT_PROFILE.copy()
+        test_profile = json.loads(_TEMPLATE)
         test_profile['profile_name'] = 'export_test'
         self.config_manager.save_profile('export_test', test_profile)
 
@@ -128,7 +186,7 @@ class TestConfigManager(unittest.TestCase):
     def test_import_profile(self):
         """Test importing a profile from file."""
         # Create a test profile file
-        test_profile = DEFAULT_PROFILE.copy()
+        test_profile = json.loads(_TEMPLATE)
         test_profile['profile_name'] = 'imported'
         import_path = os.path.join(self.test_dir, 'import_test.json')
 
@@ -181,6 +239,50 @@ class TestConfigManager(unittest.TestCase):
         self.assertIn('global_settings', loaded)
         self.assertIn('theme', loaded['global_settings'])
 
+    def test_profile_validation_does_not_modify_defaults(self):
+        """Test loading custom global settings leaves DEFAULT_PROFILE untouched."""
+        custom_profile = {
+            'profile_name': 'custom',
+            'global_settings': {'theme': 'light'},
+            'timers': []
+        }
+
+        self.config_manager.save_profile('custom', custom_profile)
+        loaded = self.config_manager.load_profile('custom')
+
+        self.assertEqual(loaded['global_settings']['theme'], 'light')
+        self.assertEqual(DEFAULT_PROFILE['global_settings']['theme'], 'dark')
+
+    def test_profile_validation_partial_global_settings(self):
+        """Test missing global settings are filled in when others are present."""
+        profile = json.loads(_TEMPLATE)
+        del profile['global_settings']['theme']
+        profile['global_settings']['always_on_top'] = False
+
+        validated = self.config_manager._validate_profile(profile)
+
+        self.assertEqual(validated['global_settings']['theme'], 'dark')
+        self.assertFalse(validated['global_settings']['always_on_top'])
+
+    def test_profile_validation_adds_label_counter(self):
+        """Test profiles saved before the label counter existed get a default."""
+        profile = json.loads(_TEMPLATE)
+        del profile['global_settings']['timer_label_counter']
+
+        validated = self.config_manager._validate_profile(profile)
+
+        self.assertEqual(validated['global_settings']['timer_label_counter'], 0)
+
+    def test_profile_validation_complete_profile(self):
+        """Test a complete profile is returned unchanged."""
+        profile = json.loads(_TEMPLATE)
+        profile['global_settings']['theme'] = 'light'
+        profile['timers'] = [{'id': 't1', 'label': 'Pearl'}]
+
+        validated = self.config_manager._validate_profile(profile)
+
+        self.assertEqual(validated, profile)
+
 
 if __name__ == '__main__':
     unittest.main()
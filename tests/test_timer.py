@@ -1,14 +1,40 @@
 """Unit tests for Timer class."""
 
 import unittest
+import threading
 import time
+from unittest import mock
 from src.core.timer import Timer
+from src.core.timer_manager import TimerManager
 from src.config.defaults import TimerState
 
 
+class FakeClock:
+    """Stands in for the time module inside src.core.timer."""
+
+    def __init__(self, now: float = 1000.0):
+        """Start the clock at an arbitrary monotonic time."""
+        self.now = now
+
+    def monotonic(self) -> float:
+        """Return the current fake time."""
+        return self.now
+
+    def advance(self, seconds: float):
+        """Move the clock forward."""
+        self.now += seconds
+
+
 class TestTimer(unittest.TestCase):
     """Test cases for Timer functionality."""
 
+    def setUp(self):
+        """Drive timers from a fake clock instead of real time."""
+        self.clock = FakeClock()
+        patcher = mock.patch('src.core.timer.time', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_timer_initialization(self):
         """Test timer creates with correct initial values."""
         timer = Timer(
@@ -29,7 +55,7 @@ class TestTimer(unittest.TestCase):
         timer.start()
 
         self.assertEqual(timer.state, TimerState.RUNNING)
-        self.assertIsNotNone(timer._last_update)
+        self.assertIsNotNone(timer._deadline)
 
     def test_timer_pause(self):
         """Test pausing a running timer."""
@@ -37,53 +63,81 @@ class TestTimer(unittest.TestCase):
         timer.start()
 
         # Let it run for a moment
-        time.sleep(0.1)
-        timer.update(time.time())
+        self.clock.advance(0.1)
+        timer.update(self.clock.monotonic())
         timer.pause()
 
         self.assertEqual(timer.state, TimerState.PAUSED)
-        self.assertLess(timer.remaining, 60)
-        self.assertGreater(timer.remaining, 59)
+        self.assertAlmostEqual(timer.remaining, 59.9)
 
     def test_timer_resume(self):
         """Test resuming a paused timer."""
         timer = Timer("Test", 60)
         timer.start()
-        time.sleep(0.1)
-        timer.update(time.time())
+        self.clock.advance(0.1)
+        timer.update(self.clock.monotonic())
         timer.pause()
 
         remaining = timer.remaining
+        self.clock.advance(5)
         timer.resume()
 
         self.assertEqual(timer.state, TimerState.RUNNING)
-        self.assertAlmostEqual(timer.remaining, remaining, delta=0.1)
+        self.assertAlmostEqual(timer.remaining, remaining)
 
     def test_timer_reset(self):
         """Test resetting a timer."""
         timer = Timer("Test", 60)
         timer.start()
-        time.sleep(0.1)
-        timer.update(time.time())
+        self.clock.advance(0.1)
+        timer.update(self.clock.monotonic())
         timer.reset()
 
         self.assertEqual(timer.state, TimerState.STOPPED)
         self.assertEqual(timer.remaining, 60)
-        self.assertIsNone(timer._last_update)
+        self.assertIsNone(timer._deadline)
 
     def test_timer_completion(self):
         """Test timer completes when time expires."""
         timer = Timer("Test", 1)
         timer.start()
 
-        # Wait for timer to complete
-        time.sleep(1.2)
-        current_time = time.time()
-        timer.update(current_time)
+        # Run past the deadline
+        self.clock.advance(1.2)
+        timer.update(self.clock.monotonic())
 
         self.assertEqual(timer.state, TimerState.COMPLETED)
         self.assertEqual(timer.remaining, 0)
 
+    def test_timer_tick_only_on_second_change(self):
+        """Test tick callback fires only when whole seconds remaining change."""
+        ticks = []
+        timer = Timer("Test", 10)
+        timer.set_on_tick(ticks.append)
+        timer.start()
+        deadline = timer.deadline
+
+        timer.update(deadline - 9.5)
+        timer.update(deadline - 9.4)
+        self.assertEqual(len(ticks), 1)
+
+        timer.update(deadline - 8.5)
+        self.assertEqual(len(ticks), 2)
+
+    def test_timer_ticks_again_after_restart(self):
+        """Test a restarted timer ticks on the same second as the last run."""
+        ticks = []
+        timer = Timer("Test", 10)
+        timer.set_on_tick(ticks.append)
+
+        timer.start()
+        timer.update(timer.deadline - 9.5)
+        timer.reset()
+        timer.start()
+        timer.update(timer.deadline - 9.5)
+
+        self.assertEqual(len(ticks), 2)
+
     def test_timer_display_time(self):
         """Test timer display formatting."""
         timer = Timer("Test", 125)  # 2:05
@@ -95,6 +149,12 @@ class TestTimer(unittest.TestCase):
         display = timer2.get_display_time()
         self.assertEqual(display, "61:01")
 
+        timer3 = Timer("Test", 6000)  # 100:00, past the lookup table
+        self.assertEqual(timer3.get_display_time(), "100:00")
+
+        timer4 = Timer("Test", 0)
+        self.assertEqual(timer4.get_display_time(), "00:00")
+
     def test_timer_toggle_stopped_to_running(self):
         """Test toggle from stopped to running."""
         timer = Timer("Test", 60)
@@ -157,6 +217,129 @@ class TestTimer(unittest.TestCase):
         self.assertEqual(timer.hotkey, "ctrl+1")
         self.assertEqual(timer.state, TimerState.STOPPED)
 
+    def test_timer_state_round_trip(self):
+        """Test state is saved by name and restored from name or int."""
+        timer = Timer("Test", 60)
+        timer.start()
+        timer.pause()
+
+        data = timer.to_dict()
+        self.assertEqual(data['state']['current_state'], 'paused')
+        self.assertIs(Timer.from_dict(data).state, TimerState.PAUSED)
+
+        data['state']['current_state'] = int(TimerState.COMPLETED)
+        self.assertIs(Timer.from_dict(data).state, TimerState.COMPLETED)
+
+        data['state']['current_state'] = 'bogus'
+        self.assertIs(Timer.from_dict(data).state, TimerState.STOPPED)
+
+
+class TestTimerManager(unittest.TestCase):
+    """Test cases for TimerManager scheduling."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.manager = TimerManager()
+        self.completed = threading.Event()
+        self.manager.set_on_timer_complete(lambda timer: self.completed.set())
+        self.manager.start()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.manager.stop()
+
+    def test_timer_completes_at_deadline(self):
+        """Test the update thread wakes up when a timer's deadline passes."""
+        timer = Timer("Test", 0.2)
+        self.manager.add_timer(timer)
+        timer.start()
+
+        time.sleep(0.4)
+        self.assertEqual(timer.state, TimerState.COMPLETED)
+
+        # Completion callback only runs when events are processed
+        self.assertFalse(self.completed.is_set())
+        self.assertEqual(self.manager.process_events(), 1)
+        self.assertTrue(self.completed.is_set())
+
+    def test_paused_timer_does_not_complete(self):
+        """Test pausing invalidates the scheduled deadline."""
+        timer = Timer("Test", 0.2)
+        self.manager.add_timer(timer)
+        timer.start()
+        timer.pause()
+
+        time.sleep(0.4)
+        self.assertEqual(self.manager.process_events(), 0)
+        self.assertEqual(timer.state, TimerState.PAUSED)
+
+    def test_get_and_remove_timer(self):
+        """Test timers can be looked up and removed by ID."""
+        timer = Timer("Test", 60, timer_id="t1")
+        self.manager.add_timer(timer)
+
+        self.assertIs(self.manager.get_timer("t1"), timer)
+        self.assertTrue(self.manager.remove_timer("t1"))
+        self.assertIsNone(self.manager.get_timer("t1"))
+        self.assertFalse(self.manager.remove_timer("t1"))
+        self.assertEqual(len(self.manager), 0)
+
+    def test_get_dirty_timers(self):
+        """Test only timers with a changed display are reported dirty."""
+        timer1 = Timer("One", 60, timer_id="t1")
+        timer2 = Timer("Two", 60, timer_id="t2")
+        self.manager.add_timer(timer1)
+        self.manager.add_timer(timer2)
+
+        self.assertEqual(self.manager.get_dirty_timers(), ["t1", "t2"])
+        self.assertEqual(self.manager.get_dirty_timers(), [])
+
+        timer2.start()
+        timer2.pause()
+        self.assertEqual(self.manager.get_dirty_timers(), ["t2"])
+
+    def test_get_next_display_change(self):
+        """Test time until the next second boundary of a running timer."""
+        self.assertIsNone(self.manager.get_next_display_change())
+
+        timer = Timer("Test", 60)
+        self.manager.add_timer(timer)
+        timer.start()
+        timer.remaining = 10.25
+
+        self.assertAlmostEqual(self.manager.get_next_display_change(), 0.25, delta=0.05)
+
+    def test_get_next_display_change_ignores_restored_running_timer(self):
+        """Test a timer restored as running without a deadline is not polled."""
+        timer = Timer.from_dict({
+            "label": "Restored",
+            "duration_seconds": 240,
+            "state": {"current_state": "running", "remaining_seconds": 120}
+        })
+        self.manager.add_timer(timer)
+
+        self.assertIsNone(timer.deadline)
+        self.assertIsNone(self.manager.get_next_display_change())
+
+    def test_get_next_display_change_past_deadline(self):
+        """Test a running timer past its deadline asks for an immediate recheck."""
+        manager = TimerManager()  # No update thread, so nothing completes it
+        timer = Timer("Test", 60)
+        manager.add_timer(timer)
+        timer.start()
+
+        clock = FakeClock(timer.deadline + 0.002)
+        with mock.patch('src.core.timer_manager.time', clock):
+            self.assertEqual(timer.state, TimerState.RUNNING)
+            self.assertEqual(manager.get_next_display_change(), 0)
+
+    def test_idle_manager_stops_promptly(self):
+        """Test stop() wakes an update thread with nothing scheduled."""
+        start = time.monotonic()
+        self.manager.stop()
+
+        self.assertLess(time.monotonic() - start, 0.5)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,61 @@
+"""Unit tests for hotkey capture key naming."""
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from src.ui import timer_config_dialog
+from src.ui.timer_config_dialog import _key_name
+
+
+def _event(keysym, keycode=0):
+    """Build a stand-in for a Tk KeyPress event."""
+    return SimpleNamespace(keysym=keysym, keycode=keycode)
+
+
+class TestKeyName(unittest.TestCase):
+    """Test cases for mapping Tk key events to hotkey names."""
+
+    def test_plain_keysyms(self):
+        """Test letters, digits and function keys pass through lowercased."""
+        self.assertEqual(_key_name(_event('a')), 'a')
+        self.assertEqual(_key_name(_event('A')), 'a')
+        self.assertEqual(_key_name(_event('1')), '1')
+        self.assertEqual(_key_name(_event('F13')), 'f13')
+
+    def test_renamed_keysyms(self):
+        """Test keysyms whose hotkey names differ from the keysym."""
+        self.assertEqual(_key_name(_event('Prior')), 'page_up')
+        self.assertEqual(_key_name(_event('KP_5')), 'num5')
+
+    def test_punctuation_keysyms(self):
+        """Test punctuation keysyms map to their unshifted characters."""
+        cases = [
+            ('minus', '-'), ('underscore', '-'),
+            ('equal', '='), ('plus', '='),
+            ('comma', ','), ('period', '.'),
+            ('slash', '/'), ('semicolon', ';'),
+            ('bracketleft', '['), ('bracketright', ']'),
+            ('backslash', '\\'), ('apostrophe', "'"),
+            ('grave', '`'),
+        ]
+        for keysym, expected in cases:
+            with self.subTest(keysym=keysym):
+                self.assertEqual(_key_name(_event(keysym)), expected)
+
+    def test_unknown_keysym(self):
+        """Test events without a usable keysym are ignored."""
+        self.assertIsNone(_key_name(_event('??')))
+        self.assertIsNone(_key_name(_event('')))
+
+    def test_windows_virtual_key_codes(self):
+        """Test Windows key codes win over the (shifted) keysym."""
+        with mock.patch.object(timer_config_dialog, '_KEYCODE_IS_VK', True):
+            self.assertEqual(_key_name(_event('exclam', 49)), '1')
+            self.assertEqual(_key_name(_event('underscore', 189)), '-')
+            self.assertEqual(_key_name(_event('braceleft', 219)), '[')
+            # Unmapped key codes fall back to the keysym
+            self.assertEqual(_key_name(_event('Prior', 0)), 'page_up')
+
+
+if __name__ == '__main__':
+    unittest.main()
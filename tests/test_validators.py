@@ -1,5 +1,6 @@
 """Unit tests for validation utilities."""
 
+import random
 import unittest
 from src.utils.validators import (
     validate_profile_name,
@@ -15,6 +16,10 @@ from src.utils.validators import (
 class TestValidators(unittest.TestCase):
     """Test cases for input validation functions."""
 
+    # One character past the profile name and timer label limits
+    LONG_NAME_51 = "a" * 51
+    LONG_LABEL_31 = "a" * 31
+
     def test_validate_profile_name_valid(self):
         """Test valid profile names."""
         is_valid, msg = validate_profile_name("MyProfile")
@@ -32,8 +37,7 @@ class TestValidators(unittest.TestCase):
 
     def test_validate_profile_name_too_long(self):
         """Test profile name too long."""
-        long_name = "a" * 51
-        is_valid, msg = validate_profile_name(long_name)
+        is_valid, msg = validate_profile_name(self.LONG_NAME_51)
         self.assertFalse(is_valid)
         self.assertIn("long", msg.lower())
 
@@ -69,8 +73,7 @@ class TestValidators(unittest.TestCase):
 
     def test_validate_timer_label_too_long(self):
         """Test timer label too long."""
-        long_label = "a" * 31
-        is_valid, msg = validate_timer_label(long_label)
+        is_valid, msg = validate_timer_label(self.LONG_LABEL_31)
         self.assertFalse(is_valid)
         self.assertIn("long", msg.lower())
 
@@ -95,29 +98,31 @@ class TestValidators(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertIn("long", msg.lower())
 
-    def test_parse_duration_string_seconds(self):
-        """Test parsing duration as plain seconds."""
-        self.assertEqual(parse_duration_string("240"), 240)
-        self.assertEqual(parse_duration_string("60"), 60)
-
-    def test_parse_duration_string_mm_ss(self):
-        """Test parsing MM:SS format."""
-        self.assertEqual(parse_duration_string("04:30"), 270)
-        self.assertEqual(parse_duration_string("1:30"), 90)
-        self.assertEqual(parse_duration_string("00:45"), 45)
-
-    def test_parse_duration_string_hh_mm_ss(self):
-        """Test parsing HH:MM:SS format."""
-        self.assertEqual(parse_duration_string("01:30:15"), 5415)
-        self.assertEqual(parse_duration_string("0:04:30"), 270)
-
-    def test_parse_duration_string_invalid(self):
-        """Test parsing invalid duration strings."""
-        self.assertIsNone(parse_duration_string("abc"))
-        self.assertIsNone(parse_duration_string(""))
-        self.assertIsNone(parse_duration_string("1:2:3:4"))
-        self.assertIsNone(parse_duration_string("-10"))
-        self.assertIsNone(parse_duration_string("00:00"))
+    def test_parse_duration_string(self):
+        """Test parsing seconds, MM:SS, HH:MM:SS and invalid strings."""
+        cases = [
+            # Plain seconds
+            ("240", 240),
+            ("60", 60),
+            # MM:SS
+            ("04:30", 270),
+            ("1:30", 90),
+            ("00:45", 45),
+            # HH:MM:SS
+            ("01:30:15", 5415),
+            ("0:04:30", 270),
+            # Invalid
+            ("abc", None),
+            ("", None),
+            ("1:2:3:4", None),
+            ("-10", None),
+            ("00:00", None),
+            ("1:", None),
+            (":30", None),
+        ]
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(parse_duration_string(text), expected)
 
     def test_validate_hotkey_string_valid(self):
         """Test valid hotkey strings."""
@@ -174,21 +179,35 @@ class TestValidators(unittest.TestCase):
         is_valid, msg = validate_volume(101)
         self.assertFalse(is_valid)
 
-    def test_sanitize_filename_valid(self):
-        """Test sanitizing filenames."""
-        self.assertEqual(sanitize_filename("MyProfile"), "MyProfile")
-        self.assertEqual(sanitize_filename("Profile 123"), "Profile 123")
-
-    def test_sanitize_filename_invalid_chars(self):
-        """Test sanitizing filenames with invalid characters."""
-        self.assertEqual(sanitize_filename("My<Profile>"), "My_Profile_")
-        self.assertEqual(sanitize_filename("Profile/Name"), "Profile_Name")
-        self.assertEqual(sanitize_filename("File:Name"), "File_Name")
-
-    def test_sanitize_filename_empty(self):
-        """Test sanitizing empty filename."""
-        self.assertEqual(sanitize_filename(""), "unnamed")
-        self.assertEqual(sanitize_filename("   "), "unnamed")
+    def test_sanitize_filename(self):
+        """Test sanitizing valid, unsafe and empty filenames."""
+        cases = [
+            ("MyProfile", "MyProfile"),
+            ("Profile 123", "Profile 123"),
+            ("My<Profile>", "My_Profile_"),
+            ("Profile/Name", "Profile_Name"),
+            ("File:Name", "File_Name"),
+            ("", "unnamed"),
+            ("   ", "unnamed"),
+        ]
+        for filename, expected in cases:
+            with self.subTest(filename=filename):
+                self.assertEqual(sanitize_filename(filename), expected)
+
+    def test_sanitize_filename_random_inputs(self):
+        """Test sanitize_filename output is always a safe, usable name."""
+        alphabet = 'aZ09 ._-<>:"/\\|?*\u00e9\u4e2d'
+        rng = random.Random(1234)
+        for _ in range(500):
+            filename = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 200)))
+            with self.subTest(filename=filename):
+                result = sanitize_filename(filename)
+                self.assertTrue(result)
+                self.assertFalse(set(result) & set('<>:"/\\|?*'))
+                self.assertEqual(result, result.strip(' .'))
+                # Sanitized names only fail validation for length or reserved names
+                if len(result) <= 50 and result.upper() not in ("CON", "PRN", "AUX", "NUL"):
+                    self.assertTrue(validate_profile_name(result)[0])
 
 
 if __name__ == '__main__':